@@ -0,0 +1,186 @@
+"""
+Synthetic Benchmark Corpus
+==========================
+
+Membuat corpus PDF yang deterministik untuk benchmark: isi setiap file
+hanya bergantung pada jenis dan jumlah halamannya, sehingga hasil
+benchmark bisa dibandingkan antar commit dan antar mesin.
+
+Jenis dokumen:
+    text         - hanya text layer
+    scanned      - setiap halaman berupa gambar hasil "scan" tanpa text layer
+    mixed        - halaman teks dengan sisipan scan setiap 5 halaman
+    image-heavy  - teks ditambah beberapa gambar embedded per halaman
+"""
+
+import io
+import json
+import random
+from pathlib import Path
+from typing import Dict, List
+
+import fitz  # PyMuPDF
+from PIL import Image, ImageDraw, ImageFont
+
+KINDS = ("text", "scanned", "mixed", "image-heavy")
+SIZES = (10, 100, 1000)
+
+# Bump when generated documents change so stale corpus files are rebuilt
+CORPUS_VERSION = 1
+
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792  # US Letter in points
+SCAN_DPI = 100
+
+WORDS = (
+    "market structure price volume trend liquidity order flow support "
+    "resistance breakout range session value area auction balance "
+    "imbalance momentum volatility swing pullback reversal continuation "
+    "level analysis trader position risk reward entry exit target"
+).split()
+
+# Fixed metadata so saved files do not carry the generation time
+FIXED_METADATA = {
+    'title': '', 'author': 'benchmark corpus', 'subject': '', 'keywords': '',
+    'creator': 'benchmarks/corpus.py', 'producer': '',
+    'creationDate': "D:20240101000000", 'modDate': "D:20240101000000",
+}
+
+
+def _paragraphs(rng: random.Random, count: int) -> List[str]:
+    """Pseudo-random paragraphs dari daftar kata tetap"""
+    paragraphs = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(40, 70))]
+        paragraphs.append(" ".join(words).capitalize() + ".")
+    return paragraphs
+
+
+def _scan_image(rng: random.Random, page_num: int) -> bytes:
+    """Halaman teks yang di-render ke gambar grayscale (tanpa text layer)"""
+    width, height = PAGE_WIDTH * SCAN_DPI // 72, PAGE_HEIGHT * SCAN_DPI // 72
+    image = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default()
+
+    y = 60
+    draw.text((60, y), f"Scanned page {page_num}", fill=0, font=font)
+    for paragraph in _paragraphs(rng, 4):
+        y += 30
+        line = ""
+        for word in paragraph.split():
+            if len(line) + len(word) > 110:
+                draw.text((60, y), line, fill=0, font=font)
+                y += 16
+                line = ""
+            line += word + " "
+        draw.text((60, y), line, fill=0, font=font)
+        y += 16
+
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _figure_image(rng: random.Random) -> bytes:
+    """Gambar sederhana (chart-like) dengan warna dan bentuk acak tapi deterministik"""
+    image = Image.new("RGB", (320, 240), tuple(rng.randint(200, 255) for _ in range(3)))
+    draw = ImageDraw.Draw(image)
+
+    for _ in range(12):
+        x0, y0 = rng.randint(0, 300), rng.randint(0, 220)
+        x1, y1 = x0 + rng.randint(10, 80), y0 + rng.randint(10, 80)
+        color = tuple(rng.randint(0, 200) for _ in range(3))
+        if rng.random() < 0.5:
+            draw.rectangle((x0, y0, x1, y1), fill=color)
+        else:
+            draw.ellipse((x0, y0, x1, y1), fill=color)
+
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _add_text_page(doc, rng: random.Random, page_num: int, paragraphs: int = 5):
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    text = f"Page {page_num}\n\n" + "\n\n".join(_paragraphs(rng, paragraphs))
+    page.insert_textbox(fitz.Rect(54, 54, PAGE_WIDTH - 54, PAGE_HEIGHT - 54), text, fontsize=10)
+    return page
+
+
+def _add_scanned_page(doc, rng: random.Random, page_num: int):
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_image(page.rect, stream=_scan_image(rng, page_num))
+    return page
+
+
+def _add_image_heavy_page(doc, rng: random.Random, page_num: int):
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    text = f"Page {page_num}\n\n" + "\n\n".join(_paragraphs(rng, 1))
+    page.insert_textbox(fitz.Rect(54, 54, PAGE_WIDTH - 54, 230), text, fontsize=10)
+
+    for index in range(4):
+        x = 54 + (index % 2) * 260
+        y = 250 + (index // 2) * 250
+        page.insert_image(fitz.Rect(x, y, x + 240, y + 180), stream=_figure_image(rng))
+    return page
+
+
+def build_pdf(pdf_path: Path, kind: str, pages: int) -> None:
+    """Buat satu dokumen corpus"""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown corpus kind '{kind}'")
+
+    # Seed depends only on the document identity
+    rng = random.Random(f"{kind}-{pages}-{CORPUS_VERSION}")
+    doc = fitz.open()
+
+    for page_num in range(1, pages + 1):
+        if kind == "text":
+            _add_text_page(doc, rng, page_num)
+        elif kind == "scanned":
+            _add_scanned_page(doc, rng, page_num)
+        elif kind == "mixed":
+            if page_num % 5 == 0:
+                _add_scanned_page(doc, rng, page_num)
+            else:
+                _add_text_page(doc, rng, page_num)
+        else:
+            _add_image_heavy_page(doc, rng, page_num)
+
+    doc.set_metadata(FIXED_METADATA)
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    doc.save(str(pdf_path), garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+
+
+def ensure_corpus(corpus_dir: Path, kinds=KINDS, sizes=SIZES) -> List[Dict]:
+    """
+    Pastikan semua dokumen corpus ada (yang sudah ada tidak dibuat ulang)
+
+    Returns:
+        List entry {'name', 'kind', 'pages', 'path'}
+    """
+    corpus_dir = Path(corpus_dir)
+    manifest_path = corpus_dir / "manifest.json"
+
+    manifest = {}
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    if manifest.get('version') != CORPUS_VERSION:
+        manifest = {'version': CORPUS_VERSION, 'documents': {}}
+
+    entries = []
+    for kind in kinds:
+        for pages in sizes:
+            name = f"{kind}_{pages}"
+            pdf_path = corpus_dir / f"{name}.pdf"
+
+            if name not in manifest['documents'] or not pdf_path.exists():
+                print(f"Generating {pdf_path.name}...")
+                build_pdf(pdf_path, kind, pages)
+                manifest['documents'][name] = {'kind': kind, 'pages': pages}
+
+            entries.append({'name': name, 'kind': kind, 'pages': pages, 'path': pdf_path})
+
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    return entries
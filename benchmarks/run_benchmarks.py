@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+"""
+PDF Converter Benchmarks
+========================
+
+Menjalankan setiap entry point konversi terhadap corpus sintetis dan
+mencatat wall time, CPU time (termasuk subprocess seperti tesseract dan
+worker shard), peak RSS dan pages/sec ke file JSON.
+
+Setiap kasus dijalankan di proses baru supaya peak RSS tidak tercampur
+dengan kasus sebelumnya.
+
+Contoh:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 10 100 --entries fast_hybrid extract_text
+    python benchmarks/run_benchmarks.py --output results.json --repeat 3
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+sys.path.insert(0, str(current_dir))
+
+from corpus import KINDS, SIZES, ensure_corpus
+
+DEFAULT_CORPUS_DIR = current_dir / "corpus"
+DEFAULT_RESULTS_DIR = current_dir / "results"
+
+
+def _fast_hybrid(pdf_path: Path, work_dir: Path, options: Dict[str, Any]) -> Tuple[bool, str]:
+    from fast_pdf_processor import FastPDFProcessor
+
+    processor = FastPDFProcessor(work_dir, work_dir)
+    return processor.convert_hybrid_fast(pdf_path, work_dir / f"{pdf_path.stem}.md",
+                                         workers=options['workers'])
+
+
+def _fast_ocr(pdf_path: Path, work_dir: Path, options: Dict[str, Any]) -> Tuple[bool, str]:
+    from fast_pdf_processor import FastPDFProcessor
+
+    processor = FastPDFProcessor(work_dir, work_dir)
+    return processor.convert_ocr_fast(pdf_path, work_dir / f"{pdf_path.stem}.md")
+
+
+def _advanced_hybrid(pdf_path: Path, work_dir: Path, options: Dict[str, Any]) -> Tuple[bool, str]:
+    from advanced_pdf_processor import AdvancedPDFProcessor
+
+    processor = AdvancedPDFProcessor(work_dir, work_dir)
+    return processor.process_hybrid_mode(pdf_path, work_dir / f"{pdf_path.stem}.md")
+
+
+def _extract_text(pdf_path: Path, work_dir: Path, options: Dict[str, Any]) -> Tuple[bool, str]:
+    from pdf_extractor import PDFTextExtractor
+
+    success, _, message = PDFTextExtractor().extract_text(pdf_path)
+    return success, message
+
+
+def _document_profile(pdf_path: Path, work_dir: Path, options: Dict[str, Any]) -> Tuple[bool, str]:
+    from document_profile import DocumentProfile
+
+    profile = DocumentProfile.from_pdf(pdf_path)
+    labels = ", ".join(f"{count} {label}" for label, count in profile.label_counts().items() if count)
+    return profile.total_pages > 0, labels
+
+
+def _convert_pdf(pdf_path: Path, work_dir: Path, options: Dict[str, Any]) -> Tuple[bool, str]:
+    from converter import PDFConverter
+
+    converter = PDFConverter(work_dir / "temp", work_dir / "output", workers=options['workers'])
+    output_file = converter.convert_pdf(pdf_path, options['format'])
+    return output_file is not None, str(output_file)
+
+
+ENTRY_POINTS: Dict[str, Callable[[Path, Path, Dict[str, Any]], Tuple[bool, str]]] = {
+    'fast_hybrid': _fast_hybrid,
+    'fast_ocr': _fast_ocr,
+    'advanced_hybrid': _advanced_hybrid,
+    'extract_text': _extract_text,
+    'document_profile': _document_profile,
+    'convert_pdf': _convert_pdf,
+}
+
+
+def _run_case(entry: str, pdf_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Jalankan satu kasus (di proses anak) dan ukur resource-nya"""
+    work_dir = Path(tempfile.mkdtemp(prefix="pdfbench-"))
+
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start_usage = resource.getrusage(resource.RUSAGE_SELF)
+            start_children = resource.getrusage(resource.RUSAGE_CHILDREN)
+            start_time = time.perf_counter()
+
+            try:
+                success, message = ENTRY_POINTS[entry](Path(pdf_path), work_dir, options)
+            except Exception as e:
+                success, message = False, f"{type(e).__name__}: {e}"
+
+            wall_time = time.perf_counter() - start_time
+            end_usage = resource.getrusage(resource.RUSAGE_SELF)
+            end_children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    cpu_time = sum(
+        (end.ru_utime - start.ru_utime) + (end.ru_stime - start.ru_stime)
+        for start, end in ((start_usage, end_usage), (start_children, end_children))
+    )
+
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    rss_scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return {
+        'success': bool(success),
+        'message': message,
+        'wall_time': wall_time,
+        'cpu_time': cpu_time,
+        'peak_rss_mb': end_usage.ru_maxrss / rss_scale,
+        'children_peak_rss_mb': end_children.ru_maxrss / rss_scale,
+    }
+
+
+def run_case_isolated(entry: str, pdf_path: Path, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Jalankan kasus di proses baru (spawn) supaya peak RSS terisolasi"""
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(_run_case, (entry, str(pdf_path), options))
+
+
+def _git_commit() -> str:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=current_dir,
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return "unknown"
+
+
+def run_benchmarks(corpus_dir: Path, kinds: List[str], sizes: List[int], entries: List[str],
+                   repeat: int, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Jalankan semua kombinasi dokumen x entry point
+
+    Returns:
+        Dict dengan 'meta' (commit, platform, dll) dan 'results'
+    """
+    documents = ensure_corpus(corpus_dir, kinds, sizes)
+    results = []
+
+    for document in documents:
+        for entry in entries:
+            runs = [run_case_isolated(entry, document['path'], options) for _ in range(repeat)]
+            wall_time = statistics.median(run['wall_time'] for run in runs)
+
+            result = {
+                'document': document['name'],
+                'kind': document['kind'],
+                'pages': document['pages'],
+                'entry_point': entry,
+                'success': all(run['success'] for run in runs),
+                'message': runs[-1]['message'],
+                'wall_time': wall_time,
+                'cpu_time': statistics.median(run['cpu_time'] for run in runs),
+                'peak_rss_mb': max(run['peak_rss_mb'] for run in runs),
+                'children_peak_rss_mb': max(run['children_peak_rss_mb'] for run in runs),
+                'pages_per_sec': document['pages'] / wall_time if wall_time > 0 else 0.0,
+                'runs': len(runs),
+            }
+            results.append(result)
+
+            status = "ok" if result['success'] else "FAILED"
+            print(f"{document['name']:>18} {entry:<16} {wall_time:8.2f}s "
+                  f"{result['cpu_time']:8.2f}s cpu {result['peak_rss_mb']:8.1f}MB "
+                  f"{result['pages_per_sec']:8.1f} p/s  {status}")
+
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'repeat': repeat,
+            'options': options,
+        },
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PDF Converter benchmarks')
+    parser.add_argument('--corpus-dir', type=str, default=str(DEFAULT_CORPUS_DIR),
+                        help='Direktori corpus sintetis (dibuat jika belum ada)')
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=list(KINDS),
+                        help='Jenis dokumen yang di-benchmark')
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES),
+                        help='Jumlah halaman dokumen')
+    parser.add_argument('--entries', nargs='+', choices=list(ENTRY_POINTS), default=list(ENTRY_POINTS),
+                        help='Entry point yang di-benchmark')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Jumlah pengulangan per kasus (median dilaporkan)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Page-parallel workers untuk fast_hybrid dan convert_pdf')
+    parser.add_argument('--format', type=str, default='md',
+                        help='Format output untuk convert_pdf')
+    parser.add_argument('--output', type=str, default=None,
+                        help='File JSON hasil (default: benchmarks/results/<commit>.json)')
+
+    args = parser.parse_args()
+    options = {'workers': args.workers, 'format': args.format}
+
+    report = run_benchmarks(Path(args.corpus_dir), args.kinds, args.sizes, args.entries,
+                            max(1, args.repeat), options)
+
+    output_path = Path(args.output) if args.output else DEFAULT_RESULTS_DIR / f"{report['meta']['commit']}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f"Results written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Startup Time Benchmark
+======================
+
+Mengukur waktu startup entry point CLI (`--help` dan `--version`) di proses
+baru dan gagal (exit code 1) jika median melewati budget. Backend berat
+(PyMuPDF, PyPDF2, rich, OCR) harus di-import secara lazy supaya perintah
+ringan seperti ini tetap cepat.
+
+Contoh:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --budget-ms 100 --repeat 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+current_dir = Path(__file__).parent
+project_dir = current_dir.parent
+
+DEFAULT_BUDGET_MS = 100.0
+
+COMMANDS = {
+    'cli --help': [str(project_dir / "core" / "cli.py"), "--help"],
+    'cli --version': [str(project_dir / "core" / "cli.py"), "--version"],
+    'main --help': [str(project_dir / "main.py"), "--help"],
+    'main --version': [str(project_dir / "main.py"), "--version"],
+}
+
+
+def time_command(args: List[str], repeat: int) -> List[float]:
+    """Jalankan perintah `repeat` kali dan kembalikan wall time tiap run (ms)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run_startup_benchmark(repeat: int = 10, budget_ms: float = DEFAULT_BUDGET_MS) -> Dict[str, Dict]:
+    """
+    Ukur semua perintah startup
+
+    Returns:
+        Dict nama perintah -> {'min_ms', 'median_ms', 'within_budget'}
+    """
+    results = {}
+    for name, args in COMMANDS.items():
+        # One warm-up run so the first measurement does not include .pyc compilation
+        time_command(args, 1)
+        timings = time_command(args, repeat)
+        median_ms = statistics.median(timings)
+        results[name] = {
+            'min_ms': min(timings),
+            'median_ms': median_ms,
+            'within_budget': median_ms <= budget_ms,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PDF Converter startup time benchmark')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help='Budget median startup per perintah dalam milidetik')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='Jumlah run per perintah (median dilaporkan)')
+
+    args = parser.parse_args()
+    results = run_startup_benchmark(max(1, args.repeat), args.budget_ms)
+
+    for name, result in results.items():
+        status = "ok" if result['within_budget'] else "OVER BUDGET"
+        print(f"{name:<16} min {result['min_ms']:7.1f}ms  median {result['median_ms']:7.1f}ms  {status}")
+
+    over_budget = [name for name, result in results.items() if not result['within_budget']]
+    if over_budget:
+        print(f"Startup budget of {args.budget_ms:g}ms exceeded by: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
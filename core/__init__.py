@@ -5,19 +5,23 @@ PDF Converter Package
 Package untuk konversi PDF ke berbagai format menggunakan pandoc
 """
 
-__version__ = "1.0.0"
+from .version import __version__
 __author__ = "PDF Converter Tool"
 
-from .converter import PDFConverter
-from .utils import (
-    check_pandoc_installation,
-    validate_pdf_file,
-    get_available_pdf_files
-)
-
 __all__ = [
     'PDFConverter',
     'check_pandoc_installation', 
     'validate_pdf_file',
     'get_available_pdf_files'
 ]
+
+
+def __getattr__(name):
+    # Import lazy: "import core" tidak ikut memuat PyMuPDF/rich sampai dibutuhkan
+    if name == 'PDFConverter':
+        from .converter import PDFConverter
+        return PDFConverter
+    if name in __all__:
+        from . import utils
+        return getattr(utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,7 +9,6 @@ import os
 import tempfile
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Any
-import subprocess
 
 # Import libraries dengan fallback
 try:
@@ -47,6 +46,37 @@ except ImportError:
             print(*args)
     console = Console()
 
+try:
+    from .rasterizer import (
+        render_pages, count_pages, iter_document_pages, fill_skipped_pages, format_skipped_pages,
+        DEFAULT_WINDOW_SIZE, RASTERIZER_AVAILABLE, SKIPPED_PAGE_PLACEHOLDER
+    )
+    from .ocr_pool import OCRScheduler
+    from .ocr_router import OCRRouter
+    from .markdown_writer import MarkdownWriter
+    from .tracing import span
+    from .tools import tool_registry
+    from .image_store import ImageStore
+    from .image_encoder import ImageEncoder, DEFAULT_CODEC
+    from .document_profile import DocumentProfile, ensure_profile
+    from .page_classifier import PAGE_TEXT, PAGE_MIXED
+    from .pdf_source import PDFInput, open_source, open_fitz, pdf_reader
+except ImportError:
+    from rasterizer import (
+        render_pages, count_pages, iter_document_pages, fill_skipped_pages, format_skipped_pages,
+        DEFAULT_WINDOW_SIZE, RASTERIZER_AVAILABLE, SKIPPED_PAGE_PLACEHOLDER
+    )
+    from ocr_pool import OCRScheduler
+    from ocr_router import OCRRouter
+    from markdown_writer import MarkdownWriter
+    from tracing import span
+    from tools import tool_registry
+    from image_store import ImageStore
+    from image_encoder import ImageEncoder, DEFAULT_CODEC
+    from document_profile import DocumentProfile, ensure_profile
+    from page_classifier import PAGE_TEXT, PAGE_MIXED
+    from pdf_source import PDFInput, open_source, open_fitz, pdf_reader
+
 class AdvancedPDFProcessor:
     """
     Processor canggih untuk PDF dengan berbagai mode konversi
@@ -56,6 +86,12 @@ class AdvancedPDFProcessor:
         self.output_dir = Path(output_dir)
         self.temp_dir = Path(temp_dir)
         self.available_methods = self._check_available_methods()
+        self.raster_window_size = DEFAULT_WINDOW_SIZE  # Pages held in memory while rasterizing
+        self.raster_backend = "auto"  # Rasterizer backend: auto, pymupdf or pdf2image
+        self.image_passthrough = True  # Keep embedded JPEGs as .jpg instead of re-encoding to PNG
+        self.image_codec = DEFAULT_CODEC  # Page snapshot codec (see image_encoder.CODECS)
+        self.image_quality = None  # Quality for jpeg/webp snapshots (None = codec default)
+        self.ocr_workers = None  # Parallel tesseract processes (None = core count)
     
     def _check_available_methods(self) -> Dict[str, bool]:
         """Check which processing methods are available"""
@@ -66,9 +102,13 @@ class AdvancedPDFProcessor:
             'pypdf2': PYPDF2_AVAILABLE
         }
     
-    def analyze_pdf_content(self, pdf_path: Path) -> Dict[str, Any]:
+    def analyze_pdf_content(self, pdf_path: Path,
+                            profile: Optional[DocumentProfile] = None) -> Dict[str, Any]:
         """
         Analyze PDF untuk menentukan strategy konversi terbaik
+        
+        Args:
+            profile: DocumentProfile yang sudah dihitung (dibuat jika None)
         """
         analysis = {
             'total_pages': 0,
@@ -85,32 +125,20 @@ class AdvancedPDFProcessor:
             return analysis
         
         try:
-            doc = fitz.open(str(pdf_path))
-            analysis['total_pages'] = len(doc)
-            
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                
-                # Check text content
-                page_text = page.get_text().strip()
-                text_length = len(page_text)
-                
-                # Check embedded images
-                image_list = page.get_images(full=True)
-                image_count = len(image_list)
-                
-                analysis['embedded_images'] += image_count
-                
-                # Categorize page type
-                if text_length > 100 and image_count > 0:
+            profile = ensure_profile(pdf_path, profile)
+            analysis['total_pages'] = profile.total_pages
+            analysis['embedded_images'] = profile.embedded_images
+            
+            # Page types come from the profile's classifier labels (scan and
+            # vector pages both need OCR or a snapshot)
+            for page in profile.pages:
+                if page.label == PAGE_MIXED:
                     analysis['mixed_pages'] += 1
-                elif text_length > 100:
+                elif page.label == PAGE_TEXT:
                     analysis['text_pages'] += 1
                 else:
                     analysis['image_pages'] += 1
             
-            doc.close()
-            
             # Calculate text ratio
             if analysis['total_pages'] > 0:
                 analysis['text_ratio'] = (analysis['text_pages'] + analysis['mixed_pages']) / analysis['total_pages']
@@ -132,273 +160,254 @@ class AdvancedPDFProcessor:
         """
         Mode 1: Hybrid - Text tetap text, gambar tetap gambar (preserve original format)
         """
-        try:
-            console.print("[blue]🔄 HYBRID MODE: Preserving original format (text + images)[/blue]")
-            
-            # Fallback to pdf2image + OCR if PyMuPDF not available
-            if not PYMUPDF_AVAILABLE:
-                console.print("[yellow]PyMuPDF not available, using pdf2image + OCR fallback[/yellow]")
-                return self._hybrid_fallback_mode(pdf_path, output_md_path)
-            
-            doc = fitz.open(str(pdf_path))
-            
-            # Create images directory
-            images_dir = output_md_path.parent / f"{output_md_path.stem}_images"
-            images_dir.mkdir(exist_ok=True)
-            
-            markdown_content = self._generate_header(pdf_path, "Hybrid Mode - Original Format Preserved")
-            
-            total_images = 0
-            total_text_chars = 0
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Processing pages...", total=len(doc))
+        with span("document", processor="advanced", mode="hybrid", file=pdf_path.name):
+            try:
+                console.print("[blue]🔄 HYBRID MODE: Preserving original format (text + images)[/blue]")
                 
-                for page_num in range(len(doc)):
-                    page = doc.load_page(page_num)
-                    progress.update(task, description=f"Processing page {page_num + 1}/{len(doc)}")
-                    
-                    markdown_content += f"\n## Page {page_num + 1}\n\n"
-                    
-                    # Extract text first
-                    page_text = page.get_text()
-                    
-                    if page_text.strip():
-                        # Clean and format text
-                        cleaned_text = self._clean_extracted_text(page_text)
-                        markdown_content += cleaned_text + "\n\n"
-                        total_text_chars += len(cleaned_text)
+                # Fallback to pdf2image + OCR if PyMuPDF not available
+                if not PYMUPDF_AVAILABLE:
+                    console.print("[yellow]PyMuPDF not available, using pdf2image + OCR fallback[/yellow]")
+                    return self._hybrid_fallback_mode(pdf_path, output_md_path)
+                
+                doc = open_fitz(pdf_path)
+                
+                # Create images directory
+                images_dir = output_md_path.parent / f"{output_md_path.stem}_images"
+                images_dir.mkdir(exist_ok=True)
+                
+                with MarkdownWriter(output_md_path) as markdown, \
+                        ImageEncoder(self.image_codec, self.image_quality) as encoder:
+                    markdown.write(self._generate_header(pdf_path, "Hybrid Mode - Original Format Preserved"))
                     
-                    # Extract embedded images
-                    image_list = page.get_images(full=True)
+                    total_images = 0
+                    total_text_chars = 0
+                    image_store = ImageStore(images_dir, self.image_passthrough)  # Repeated images are written once
                     
-                    for img_index, img in enumerate(image_list):
-                        try:
-                            xref = img[0]
-                            pix = fitz.Pixmap(doc, xref)
-                            
-                            if pix.n - pix.alpha < 4:  # Valid image
-                                img_filename = f"page_{page_num + 1}_img_{img_index + 1}.png"
-                                img_path = images_dir / img_filename
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        console=console
+                    ) as progress:
+                        task = progress.add_task("Processing pages...", total=len(doc))
+                        
+                        for page_num in range(len(doc)):
+                            with span("page", page=page_num + 1):
+                                page = doc.load_page(page_num)
+                                progress.update(task, description=f"Processing page {page_num + 1}/{len(doc)}")
                                 
-                                pix.save(str(img_path))
+                                markdown.write(f"\n## Page {page_num + 1}\n\n")
                                 
-                                # Add image reference to markdown
-                                relative_img_path = f"{images_dir.name}/{img_filename}"
-                                markdown_content += f"![Image {total_images + 1}]({relative_img_path})\n\n"
+                                # Extract text first
+                                page_text = page.get_text()
                                 
-                                total_images += 1
-                            
-                            pix = None
-                            
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Could not extract image {img_index + 1} from page {page_num + 1}: {e}[/yellow]")
-                    
-                    # If page has little text and no images, convert page to image
-                    if len(page_text.strip()) < 50 and not image_list:
-                        console.print(f"[yellow]Converting page {page_num + 1} to image (low text content)[/yellow]")
-                        
-                        if PDF2IMAGE_AVAILABLE:
-                            try:
-                                page_images = convert_from_path(
-                                    str(pdf_path),
-                                    dpi=200,
-                                    first_page=page_num + 1,
-                                    last_page=page_num + 1
-                                )
+                                if page_text.strip():
+                                    # Clean and format text
+                                    cleaned_text = self._clean_extracted_text(page_text)
+                                    markdown.write(cleaned_text + "\n\n")
+                                    total_text_chars += len(cleaned_text)
                                 
-                                if page_images:
-                                    img_filename = f"page_{page_num + 1}_full.png"
-                                    img_path = images_dir / img_filename
-                                    page_images[0].save(str(img_path), "PNG", optimize=True)
-                                    
-                                    relative_img_path = f"{images_dir.name}/{img_filename}"
-                                    markdown_content += f"![Page {page_num + 1}]({relative_img_path})\n\n"
-                                    total_images += 1
+                                # Extract embedded images
+                                image_list = page.get_images(full=True)
+                                
+                                for img_index, img in enumerate(image_list):
+                                    try:
+                                        img_filename = image_store.extract(
+                                            doc, img[0], f"page_{page_num + 1}_img_{img_index + 1}.png",
+                                            accept=lambda pix: pix.n - pix.alpha < 4  # Valid image
+                                        )
+                                        
+                                        if img_filename:
+                                            # Add image reference to markdown
+                                            relative_img_path = f"{images_dir.name}/{img_filename}"
+                                            markdown.write(f"![Image {total_images + 1}]({relative_img_path})\n\n")
+                                            
+                                            total_images += 1
+                                        
+                                    except Exception as e:
+                                        console.print(f"[yellow]Warning: Could not extract image {img_index + 1} from page {page_num + 1}: {e}[/yellow]")
+                                
+                                # If page has little text and no images, convert page to image
+                                if len(page_text.strip()) < 50 and not image_list:
+                                    console.print(f"[yellow]Converting page {page_num + 1} to image (low text content)[/yellow]")
                                     
-                            except Exception as e:
-                                console.print(f"[yellow]Could not convert page {page_num + 1} to image: {e}[/yellow]")
+                                    if RASTERIZER_AVAILABLE:
+                                        try:
+                                            page_images = list(render_pages(pdf_path, [page_num + 1], dpi=200,
+                                                                            backend=self.raster_backend))
+                                            
+                                            if page_images:
+                                                img_filename = encoder.submit(page_images[0][1], images_dir,
+                                                                              f"page_{page_num + 1}_full")
+                                                
+                                                relative_img_path = f"{images_dir.name}/{img_filename}"
+                                                markdown.write(f"![Page {page_num + 1}]({relative_img_path})\n\n")
+                                                total_images += 1
+                                                
+                                        except Exception as e:
+                                            console.print(f"[yellow]Could not convert page {page_num + 1} to image: {e}[/yellow]")
+                                
+                                markdown.end_page()
+                            progress.advance(task)
                     
-                    markdown_content += "---\n\n"
-                    progress.advance(task)
-            
-            doc.close()
-            
-            # Add summary at the end
-            markdown_content += self._generate_summary(total_text_chars, total_images, "hybrid")
-            
-            # Save markdown file
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            message = f"Hybrid conversion completed: {total_text_chars} chars text, {total_images} images"
-            return True, message
-            
-        except Exception as e:
-            return False, f"Hybrid mode failed: {str(e)}"
+                    doc.close()
+                    
+                    # Add summary at the end
+                    markdown.write(self._generate_summary(total_text_chars, total_images, "hybrid"))
+                
+                message = f"Hybrid conversion completed: {total_text_chars} chars text, {total_images} images"
+                return True, message
+                
+            except Exception as e:
+                return False, f"Hybrid mode failed: {str(e)}"
     
     def _hybrid_fallback_mode(self, pdf_path: Path, output_md_path: Path) -> Tuple[bool, str]:
         """
         Fallback hybrid mode using pdf2image + simple text extraction
         """
         try:
-            if not PDF2IMAGE_AVAILABLE:
-                return False, "pdf2image not available for fallback mode"
+            if not RASTERIZER_AVAILABLE:
+                return False, "No rasterizer available for fallback mode (need PyMuPDF or pdf2image)"
             
             # Create images directory
             images_dir = output_md_path.parent / f"{output_md_path.stem}_images"
             images_dir.mkdir(exist_ok=True)
             
-            markdown_content = self._generate_header(pdf_path, "Hybrid Mode - Fallback Method")
-            
-            # Try to extract text using PyPDF2 first
-            total_text_chars = 0
-            page_texts = {}
-            
-            if PYPDF2_AVAILABLE:
-                try:
-                    reader = PdfReader(str(pdf_path))
-                    for page_num, page in enumerate(reader.pages):
-                        page_text = page.extract_text()
-                        if page_text.strip():
-                            page_texts[page_num] = self._clean_extracted_text(page_text)
-                            total_text_chars += len(page_texts[page_num])
-                except Exception as e:
-                    console.print(f"[yellow]PyPDF2 text extraction failed: {e}[/yellow]")
-            
-            # Convert pages to images
-            console.print("[blue]Converting PDF to images...[/blue]")
-            images = convert_from_path(str(pdf_path), dpi=200)
-            
-            total_images = 0
-            
-            for page_num, image in enumerate(images):
-                markdown_content += f"\n## Page {page_num + 1}\n\n"
+            with MarkdownWriter(output_md_path) as markdown, \
+                    ImageEncoder(self.image_codec, self.image_quality) as encoder:
+                markdown.write(self._generate_header(pdf_path, "Hybrid Mode - Fallback Method"))
                 
-                # Add text if available
-                if page_num in page_texts:
-                    markdown_content += page_texts[page_num] + "\n\n"
-                else:
-                    # Convert page to image since no text
-                    img_filename = f"page_{page_num + 1}.png"
-                    img_path = images_dir / img_filename
-                    image.save(str(img_path), "PNG", optimize=True)
+                # Try to extract text using PyPDF2 first
+                total_text_chars = 0
+                page_texts = {}
+                
+                if PYPDF2_AVAILABLE:
+                    try:
+                        reader = pdf_reader(pdf_path)
+                        for page_num, page in enumerate(reader.pages):
+                            page_text = page.extract_text()
+                            if page_text.strip():
+                                page_texts[page_num] = self._clean_extracted_text(page_text)
+                                total_text_chars += len(page_texts[page_num])
+                    except Exception as e:
+                        console.print(f"[yellow]PyPDF2 text extraction failed: {e}[/yellow]")
+                
+                # Convert pages to images (streamed in bounded windows)
+                console.print("[blue]Converting PDF to images...[/blue]")
+                
+                total_images = 0
+                
+                pages = iter_document_pages(pdf_path, dpi=200, window_size=self.raster_window_size,
+                                            backend=self.raster_backend)
+                skipped = []
+                for page_number, image in fill_skipped_pages(pages, range(1, count_pages(pdf_path) + 1)):
+                    page_num = page_number - 1
+                    markdown.write(f"\n## Page {page_num + 1}\n\n")
                     
-                    relative_img_path = f"{images_dir.name}/{img_filename}"
-                    markdown_content += f"![Page {page_num + 1}]({relative_img_path})\n\n"
-                    total_images += 1
+                    # Add text if available
+                    if page_num in page_texts:
+                        markdown.write(page_texts[page_num] + "\n\n")
+                    elif image is None:
+                        # Render failed: keep the page's slot so numbering stays intact
+                        markdown.write(SKIPPED_PAGE_PLACEHOLDER.format(page=page_num + 1) + "\n\n")
+                        skipped.append(page_num + 1)
+                    else:
+                        # Convert page to image since no text (encoded on a thread pool)
+                        img_filename = encoder.submit(image, images_dir, f"page_{page_num + 1}")
+                        
+                        relative_img_path = f"{images_dir.name}/{img_filename}"
+                        markdown.write(f"![Page {page_num + 1}]({relative_img_path})\n\n")
+                        total_images += 1
+                    
+                    markdown.end_page()
                 
-                markdown_content += "---\n\n"
-            
-            # Add summary
-            markdown_content += self._generate_summary(total_text_chars, total_images, "hybrid-fallback")
-            
-            # Save markdown file
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                # Add summary
+                markdown.write(self._generate_summary(total_text_chars, total_images, "hybrid-fallback"))
             
-            message = f"Hybrid fallback completed: {total_text_chars} chars text, {total_images} images"
+            message = (f"Hybrid fallback completed: {total_text_chars} chars text, {total_images} images"
+                       f"{format_skipped_pages(skipped)}")
             return True, message
             
         except Exception as e:
             return False, f"Hybrid fallback failed: {str(e)}"
     
-    def process_ocr_mode(self, pdf_path: Path, output_md_path: Path) -> Tuple[bool, str]:
+    def process_ocr_mode(self, pdf_path: Path, output_md_path: Path,
+                         profile: Optional[DocumentProfile] = None) -> Tuple[bool, str]:
         """
         Mode 2: OCR - Convert everything to text using OCR
         """
-        try:
-            console.print("[blue]🔍 OCR MODE: Converting all content to text[/blue]")
-            
-            if not OCR_AVAILABLE or not PDF2IMAGE_AVAILABLE:
-                return False, "OCR dependencies not available (need pytesseract and pdf2image)"
-            
-            # Check tesseract installation
+        with span("document", processor="advanced", mode="ocr", file=pdf_path.name):
             try:
-                subprocess.run(['tesseract', '--version'], 
-                             capture_output=True, check=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                return False, "Tesseract OCR not installed. Download from: https://github.com/UB-Mannheim/tesseract/wiki"
-            
-            markdown_content = self._generate_header(pdf_path, "OCR Mode - All Content as Text")
-            
-            # Convert PDF to images
-            console.print("[yellow]Converting PDF to images for OCR...[/yellow]")
-            images = convert_from_path(str(pdf_path), dpi=300)  # Higher DPI for better OCR
-            
-            total_text_chars = 0
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Performing OCR...", total=len(images))
+                console.print("[blue]🔍 OCR MODE: Converting all content to text[/blue]")
                 
-                for page_num, image in enumerate(images):
-                    progress.update(task, description=f"OCR on page {page_num + 1}/{len(images)}")
+                if not OCR_AVAILABLE or not RASTERIZER_AVAILABLE:
+                    return False, "OCR dependencies not available (need pytesseract and PyMuPDF or pdf2image)"
+                
+                # Check tesseract installation (probed once per process)
+                if not tool_registry.is_available('tesseract'):
+                    return False, "Tesseract OCR not installed. Download from: https://github.com/UB-Mannheim/tesseract/wiki"
+                
+                with MarkdownWriter(output_md_path) as markdown:
+                    markdown.write(self._generate_header(pdf_path, "OCR Mode - All Content as Text"))
                     
-                    markdown_content += f"\n## Page {page_num + 1}\n\n"
+                    # Read text layers up front; only pages without one are rasterized
+                    console.print("[yellow]Checking text layers before OCR...[/yellow]")
+                    profile = ensure_profile(pdf_path, profile)
+                    total_pages = profile.total_pages or count_pages(pdf_path)
                     
-                    try:
-                        # First try to extract text using PyMuPDF if available
-                        extracted_text = ""
+                    total_text_chars = 0
+                    
+                    # Perform OCR with optimized settings on a pool of tesseract workers
+                    scheduler = OCRScheduler(workers=self.ocr_workers, lang='eng', config='--oem 3 --psm 6')
+                    # Higher DPI for better OCR
+                    router = OCRRouter(scheduler, dpi=300, window_size=self.raster_window_size,
+                                       backend=self.raster_backend)
+                    
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        console=console
+                    ) as progress:
+                        task = progress.add_task("Performing OCR...", total=total_pages)
                         
-                        if PYMUPDF_AVAILABLE:
+                        for result in router.route(pdf_path, profile=profile):
+                            page_num = result['page'] - 1
+                            progress.update(task, description=f"OCR on page {page_num + 1}/{total_pages}")
+                            
+                            markdown.write(f"\n## Page {page_num + 1}\n\n")
+                            
                             try:
-                                doc = fitz.open(str(pdf_path))
-                                page = doc.load_page(page_num)
-                                pymupdf_text = page.get_text().strip()
-                                doc.close()
+                                if result['error']:
+                                    raise RuntimeError(result['error'])
                                 
-                                if len(pymupdf_text) > 100:  # If sufficient text found
-                                    extracted_text = self._clean_extracted_text(pymupdf_text)
+                                if result['source'] == "text-layer":
                                     console.print(f"[green]Page {page_num + 1}: Using extracted text[/green]")
-                            except:
-                                pass
-                        
-                        # If no sufficient text extracted, use OCR
-                        if not extracted_text:
-                            console.print(f"[yellow]Page {page_num + 1}: Performing OCR...[/yellow]")
-                            
-                            # Perform OCR with multiple languages and optimized settings
-                            ocr_text = pytesseract.image_to_string(
-                                image, 
-                                lang='eng',
-                                config='--oem 3 --psm 6'  # Optimized OCR settings
-                            )
+                                
+                                extracted_text = self._clean_extracted_text(result['text'])
+                                
+                                if extracted_text.strip():
+                                    markdown.write(extracted_text + "\n\n")
+                                    total_text_chars += len(extracted_text)
+                                else:
+                                    markdown.write("*[No readable text found on this page]*\n\n")
+                                
+                            except Exception as e:
+                                console.print(f"[red]Error processing page {page_num + 1}: {e}[/red]")
+                                markdown.write(f"*[Error processing page {page_num + 1}: {e}]*\n\n")
                             
-                            extracted_text = self._clean_extracted_text(ocr_text)
-                        
-                        if extracted_text.strip():
-                            markdown_content += extracted_text + "\n\n"
-                            total_text_chars += len(extracted_text)
-                        else:
-                            markdown_content += "*[No readable text found on this page]*\n\n"
-                        
-                    except Exception as e:
-                        console.print(f"[red]Error processing page {page_num + 1}: {e}[/red]")
-                        markdown_content += f"*[Error processing page {page_num + 1}: {e}]*\n\n"
+                            markdown.end_page()
+                            progress.advance(task)
                     
-                    markdown_content += "---\n\n"
-                    progress.advance(task)
-            
-            # Add summary
-            markdown_content += self._generate_summary(total_text_chars, 0, "ocr")
-            
-            # Save markdown file
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            message = f"OCR conversion completed: {total_text_chars} characters extracted"
-            return True, message
-            
-        except Exception as e:
-            return False, f"OCR mode failed: {str(e)}"
+                    console.print(f"[cyan]{router.format_summary()}[/cyan]")
+                    console.print(f"[cyan]{scheduler.format_summary()}[/cyan]")
+                    
+                    # Add summary
+                    markdown.write(self._generate_summary(total_text_chars, 0, "ocr"))
+                
+                message = f"OCR conversion completed: {total_text_chars} characters extracted"
+                return True, message
+                
+            except Exception as e:
+                return False, f"OCR mode failed: {str(e)}"
     
     def _clean_extracted_text(self, text: str) -> str:
         """Clean and format extracted text"""
@@ -454,49 +463,54 @@ class AdvancedPDFProcessor:
         from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    def convert_pdf(self, pdf_path: Path, mode: str = "auto") -> Tuple[bool, str, Path]:
+    def convert_pdf(self, pdf_path: PDFInput, mode: str = "auto",
+                    profile: Optional[DocumentProfile] = None) -> Tuple[bool, str, Path]:
         """
         Main conversion method
         
         Args:
-            pdf_path: Path to PDF file
+            pdf_path: Path to PDF file, PDFSource, or PDF bytes/file object
+                (opened once and shared by every reader and the rasterizer)
             mode: "auto", "hybrid", "ocr"
+            profile: Shared DocumentProfile (computed once here if None)
             
         Returns:
             (success, message, output_path)
         """
         
-        # Analyze PDF first
-        analysis = self.analyze_pdf_content(pdf_path)
-        
-        # Determine output path
-        if mode == "hybrid":
-            output_md_path = self.output_dir / f"{pdf_path.stem}_hybrid.md"
-        elif mode == "ocr":
-            output_md_path = self.output_dir / f"{pdf_path.stem}_ocr.md"
-        else:
-            output_md_path = self.output_dir / f"{pdf_path.stem}.md"
-        
-        console.print(f"[blue]📊 PDF Analysis Results:[/blue]")
-        console.print(f"  Total pages: {analysis['total_pages']}")
-        console.print(f"  Text pages: {analysis['text_pages']}")
-        console.print(f"  Image pages: {analysis['image_pages']}")
-        console.print(f"  Mixed pages: {analysis['mixed_pages']}")
-        console.print(f"  Text ratio: {analysis['text_ratio']:.1%}")
-        console.print(f"  Recommended mode: {analysis['recommended_mode']}")
-        console.print()
-        
-        # Auto-select mode if needed
-        if mode == "auto":
-            mode = analysis['recommended_mode']
-            console.print(f"[green]Auto-selected mode: {mode}[/green]")
-        
-        # Process based on mode
-        if mode == "hybrid":
-            success, message = self.process_hybrid_mode(pdf_path, output_md_path)
-        elif mode == "ocr":
-            success, message = self.process_ocr_mode(pdf_path, output_md_path)
-        else:
-            return False, f"Unknown mode: {mode}", output_md_path
+        with open_source(pdf_path) as source:
+            # Analyze PDF first (one scan, reused by OCR mode)
+            profile = ensure_profile(source, profile)
+            analysis = self.analyze_pdf_content(source, profile)
+            
+            # Determine output path
+            if mode == "hybrid":
+                output_md_path = self.output_dir / f"{source.stem}_hybrid.md"
+            elif mode == "ocr":
+                output_md_path = self.output_dir / f"{source.stem}_ocr.md"
+            else:
+                output_md_path = self.output_dir / f"{source.stem}.md"
+            
+            console.print(f"[blue]📊 PDF Analysis Results:[/blue]")
+            console.print(f"  Total pages: {analysis['total_pages']}")
+            console.print(f"  Text pages: {analysis['text_pages']}")
+            console.print(f"  Image pages: {analysis['image_pages']}")
+            console.print(f"  Mixed pages: {analysis['mixed_pages']}")
+            console.print(f"  Text ratio: {analysis['text_ratio']:.1%}")
+            console.print(f"  Recommended mode: {analysis['recommended_mode']}")
+            console.print()
+            
+            # Auto-select mode if needed
+            if mode == "auto":
+                mode = analysis['recommended_mode']
+                console.print(f"[green]Auto-selected mode: {mode}[/green]")
+            
+            # Process based on mode
+            if mode == "hybrid":
+                success, message = self.process_hybrid_mode(source, output_md_path)
+            elif mode == "ocr":
+                success, message = self.process_ocr_mode(source, output_md_path, profile)
+            else:
+                return False, f"Unknown mode: {mode}", output_md_path
         
         return success, message, output_md_path
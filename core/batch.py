@@ -0,0 +1,280 @@
+"""
+Batch Scheduler
+===============
+
+Menjalankan konversi banyak dokumen sekaligus di beberapa proses worker.
+File dikirim ke worker lewat antrian terbatas (input dibaca secara lazy),
+hasil setiap dokumen dikirim kembali begitu dokumen itu selesai, dan
+dokumen yang melewati batas waktu dihentikan dengan mengganti worker-nya
+sehingga dokumen lain tidak ikut tertahan.
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    from .page_parallel import resolve_workers
+    from .tracing import tracer
+except ImportError:
+    from page_parallel import resolve_workers
+    from tracing import tracer
+
+# Result status values
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_TIMEOUT = "timeout"
+STATUS_CANCELLED = "cancelled"
+
+# How often the scheduler checks for timeouts and dead workers (seconds)
+POLL_INTERVAL = 0.2
+
+
+def _make_result(index: int, input_file: Path, status: str, output: Optional[Path] = None,
+                 error: Optional[str] = None, elapsed: float = 0.0) -> Dict[str, Any]:
+    return {
+        'index': index,
+        'input': Path(input_file),
+        'output': Path(output) if output else None,
+        'status': status,
+        'error': error,
+        'elapsed': elapsed,
+    }
+
+
+def _convert_one(converter, index: int, input_file: Path, output_format: str,
+                 custom_options: Optional[List[str]]) -> Dict[str, Any]:
+    """Konversi satu dokumen; exception dilaporkan sebagai hasil gagal"""
+    start = time.perf_counter()
+    try:
+        output = converter.convert_pdf(Path(input_file), output_format, custom_options)
+        error = None if output else "conversion failed"
+    except Exception as e:
+        output, error = None, f"{type(e).__name__}: {e}"
+
+    status = STATUS_OK if output else STATUS_FAILED
+    return _make_result(index, input_file, status, output, error, time.perf_counter() - start)
+
+
+def _batch_worker(slot: int, converter_config: Dict[str, Any], task_queue, result_queue,
+                  current_jobs, trace_path: Optional[Path] = None) -> None:
+    """
+    Loop worker: ambil (index, file, format, opsi) dari antrian sampai None
+
+    Index dokumen yang sedang dikerjakan ditulis ke current_jobs[slot]
+    supaya scheduler tetap tahu dokumen mana yang hilang jika worker crash.
+    """
+    try:
+        from .converter import PDFConverter
+    except ImportError:
+        from converter import PDFConverter
+
+    # A forked worker already traces to the inherited file; a spawned one opens it
+    if trace_path is not None and not tracer.enabled:
+        tracer.configure(trace_path)
+
+    converter = PDFConverter(**converter_config)
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            return
+
+        index, input_file, output_format, custom_options = task
+        current_jobs[slot] = index
+        result_queue.put(('started', slot, os.getpid(), index))
+        result = _convert_one(converter, index, input_file, output_format, custom_options)
+        result_queue.put(('done', slot, os.getpid(), index, result))
+        current_jobs[slot] = -1
+
+
+class BatchScheduler:
+    """
+    Konversi dokumen secara paralel dengan timeout per file dan pembatalan
+
+    Contoh:
+        scheduler = BatchScheduler(jobs=8, timeout=120)
+        for result in scheduler.run(converter, pdf_files, 'md'):
+            print(result['input'], result['status'])
+
+    Hasil di-yield sesuai urutan selesai (bukan urutan input); gunakan
+    'index' untuk mengurutkan ulang. cancel() bisa dipanggil dari thread
+    lain untuk menghentikan batch.
+    """
+
+    def __init__(self, jobs: int = 1, timeout: Optional[float] = None,
+                 queue_size: Optional[int] = None):
+        """
+        Args:
+            jobs: Jumlah dokumen yang dikonversi bersamaan (0 = semua core)
+            timeout: Batas waktu per dokumen dalam detik (None = tanpa batas)
+            queue_size: Maksimum dokumen yang menunggu di antrian worker
+                (default: 2x jobs)
+        """
+        self.jobs = resolve_workers(jobs)
+        self.timeout = timeout if timeout and timeout > 0 else None
+        self.queue_size = queue_size or self.jobs * 2
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Hentikan batch: dokumen yang belum selesai dilaporkan 'cancelled'"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self, converter, input_files: Iterable[Path], output_format: str,
+            custom_options: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Konversi semua file dan yield hasil setiap dokumen segera setelah selesai
+
+        Args:
+            converter: PDFConverter yang konfigurasinya dipakai oleh worker
+            input_files: File PDF (boleh generator, dibaca secara lazy)
+            output_format: Format output
+            custom_options: Opsi pandoc tambahan
+
+        Yields:
+            Dict dengan 'index', 'input', 'output', 'status' (ok, failed,
+            timeout, cancelled), 'error' dan 'elapsed'
+        """
+        self._cancel_event.clear()
+
+        # Serial path runs in this process, exactly like a plain convert_pdf loop
+        if self.jobs == 1 and self.timeout is None:
+            yield from self._run_serial(converter, input_files, output_format, custom_options)
+        else:
+            yield from self._run_parallel(converter, input_files, output_format, custom_options)
+
+    def _run_serial(self, converter, input_files, output_format, custom_options):
+        for index, input_file in enumerate(input_files):
+            if self.cancelled:
+                yield _make_result(index, input_file, STATUS_CANCELLED, error="batch cancelled")
+                continue
+            yield _convert_one(converter, index, input_file, output_format, custom_options)
+
+    def _run_parallel(self, converter, input_files, output_format, custom_options):
+        context = multiprocessing.get_context()
+        task_queue = context.Queue(self.queue_size)
+        result_queue = context.Queue()
+        converter_config = converter.get_worker_config()
+
+        slots = self.jobs
+        if hasattr(input_files, '__len__'):
+            slots = max(1, min(slots, len(input_files)))
+
+        current_jobs = context.Array('l', [-1] * slots, lock=False)
+        workers: Dict[int, Any] = {}
+        running: Dict[int, tuple] = {}       # slot -> (index, started_at)
+        outstanding: Dict[int, Path] = {}    # index -> input file (queued or running)
+
+        def start_worker(slot: int) -> None:
+            current_jobs[slot] = -1
+            process = context.Process(target=_batch_worker,
+                                      args=(slot, converter_config, task_queue, result_queue,
+                                            current_jobs, tracer.output_path))
+            process.start()
+            workers[slot] = process
+
+        tasks = enumerate(input_files)
+        next_task = None
+        exhausted = False
+
+        try:
+            for slot in range(slots):
+                start_worker(slot)
+
+            while not self.cancelled:
+                # Keep the bounded queue topped up without blocking on it
+                while not exhausted:
+                    if next_task is None:
+                        next_task = next(tasks, None)
+                        if next_task is None:
+                            exhausted = True
+                            break
+                    index, input_file = next_task
+                    try:
+                        task_queue.put_nowait((index, str(input_file), output_format, custom_options))
+                    except queue.Full:
+                        break
+                    outstanding[index] = Path(input_file)
+                    next_task = None
+
+                if exhausted and not outstanding:
+                    break
+
+                try:
+                    message = result_queue.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    message = None
+
+                if message and message[0] == 'started':
+                    _, slot, pid, index = message
+                    # Ignore messages from a worker that has since been replaced
+                    if workers[slot].pid == pid:
+                        running[slot] = (index, time.perf_counter())
+                elif message and message[0] == 'done':
+                    _, slot, pid, index, result = message
+                    if workers[slot].pid == pid:
+                        running.pop(slot, None)
+                    # A late result for a job that already timed out is dropped
+                    if outstanding.pop(index, None) is not None:
+                        yield result
+
+                # Replace workers that ran over the timeout or died
+                now = time.perf_counter()
+                for slot, process in list(workers.items()):
+                    job = running.get(slot)
+                    timed_out = job is not None and self.timeout is not None and now - job[1] > self.timeout
+
+                    if not timed_out and process.is_alive():
+                        continue
+
+                    if process.is_alive():
+                        process.terminate()
+                    process.join()
+                    running.pop(slot, None)
+
+                    index = job[0] if job is not None else current_jobs[slot]
+                    if index in outstanding:
+                        started_at = job[1] if job is not None else now
+                        if timed_out:
+                            error = f"timed out after {self.timeout:g}s"
+                            status = STATUS_TIMEOUT
+                        else:
+                            error = f"worker exited with code {process.exitcode}"
+                            status = STATUS_FAILED
+                        yield _make_result(index, outstanding.pop(index), status,
+                                           error=error, elapsed=now - started_at)
+
+                    if not (exhausted and not outstanding):
+                        start_worker(slot)
+
+            if self.cancelled:
+                # Stop feeding and report everything that had not finished
+                if next_task is not None:
+                    outstanding[next_task[0]] = Path(next_task[1])
+                for index, input_file in tasks:
+                    outstanding[index] = Path(input_file)
+                for index in sorted(outstanding):
+                    yield _make_result(index, outstanding[index], STATUS_CANCELLED,
+                                       error="batch cancelled")
+                outstanding.clear()
+            else:
+                for _ in workers:
+                    task_queue.put(None)
+                for process in workers.values():
+                    process.join(timeout=5)
+        finally:
+            for process in workers.values():
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            task_queue.cancel_join_thread()
+            task_queue.close()
+            result_queue.close()
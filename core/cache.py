@@ -0,0 +1,226 @@
+"""
+Conversion Cache
+================
+
+Cache persisten di disk untuk hasil konversi. Key dibentuk dari hash isi
+PDF ditambah format/mode dan opsi, sehingga PDF yang sama (walaupun
+dengan nama lain) tidak perlu diproses ulang. Ukuran cache dibatasi dan
+entry yang paling lama tidak dipakai dihapus lebih dulu (LRU).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    from .pdf_source import PDFSource
+except ImportError:
+    from pdf_source import PDFSource
+
+# Bump when the output of a conversion mode changes so old entries are ignored
+CACHE_VERSION = 1
+
+# Memo of file hashes keyed by (path, size, mtime) to avoid re-reading big PDFs
+_hash_memo: Dict[tuple, str] = {}
+_hash_lock = threading.Lock()
+
+
+def hash_file(file_path: Path) -> str:
+    """SHA-256 dari isi file (di-memo per proses selama file tidak berubah)"""
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    memo_key = (str(file_path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+    with _hash_lock:
+        if memo_key in _hash_memo:
+            return _hash_memo[memo_key]
+
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+
+    with _hash_lock:
+        _hash_memo[memo_key] = digest.hexdigest()
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    """
+    Content-addressed cache untuk teks hasil ekstraksi dan file output
+    """
+
+    def __init__(self, cache_dir: Path, max_size_mb: int = 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def make_key(self, pdf_path: Path, **options: Any) -> str:
+        """
+        Buat cache key dari isi PDF dan opsi konversi
+
+        Args:
+            pdf_path: Path ke file PDF atau PDFSource (PDF di memory di-hash dari buffer-nya)
+            **options: Semua parameter yang mempengaruhi hasil (format, dpi, dll)
+        """
+        if isinstance(pdf_path, PDFSource):
+            pdf_sha256 = pdf_path.sha256() if pdf_path.in_memory else hash_file(pdf_path.path)
+        else:
+            pdf_sha256 = hash_file(pdf_path)
+        payload = {
+            'version': CACHE_VERSION,
+            'pdf_sha256': pdf_sha256,
+            'options': options
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def get(self, key: str) -> Optional[Path]:
+        """Kembalikan direktori entry jika ada (dan tandai sebagai baru dipakai)"""
+        meta_path = self._entry_dir(key) / "meta.json"
+        if not meta_path.exists():
+            return None
+
+        try:
+            os.utime(meta_path)  # LRU timestamp
+        except OSError:
+            return None
+        return meta_path.parent
+
+    def put_text(self, key: str, text: str) -> None:
+        """Simpan teks hasil ekstraksi"""
+        def populate(entry_dir: Path):
+            (entry_dir / "text.md").write_text(text, encoding='utf-8')
+
+        self._store(key, populate)
+
+    def get_text(self, key: str) -> Optional[str]:
+        """Ambil teks hasil ekstraksi, None jika tidak ada di cache"""
+        entry_dir = self.get(key)
+        if entry_dir is None or not (entry_dir / "text.md").exists():
+            return None
+        return (entry_dir / "text.md").read_text(encoding='utf-8')
+
+    def put_files(self, key: str, paths: List[Path]) -> None:
+        """Simpan file/direktori output (misalnya .md dan folder gambarnya)"""
+        def populate(entry_dir: Path):
+            files_dir = entry_dir / "files"
+            files_dir.mkdir()
+            for path in paths:
+                path = Path(path)
+                if path.is_dir():
+                    shutil.copytree(path, files_dir / path.name)
+                elif path.is_file():
+                    shutil.copy2(path, files_dir / path.name)
+
+        self._store(key, populate)
+
+    def restore_files(self, key: str, dest_dir: Path) -> List[Path]:
+        """
+        Salin file output dari cache ke dest_dir
+
+        Returns:
+            List path yang dipulihkan (kosong jika cache miss)
+        """
+        entry_dir = self.get(key)
+        if entry_dir is None or not (entry_dir / "files").is_dir():
+            return []
+
+        dest_dir = Path(dest_dir)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+
+        restored = []
+        for cached in sorted((entry_dir / "files").iterdir()):
+            target = dest_dir / cached.name
+            if target.is_dir():
+                shutil.rmtree(target)
+            if cached.is_dir():
+                shutil.copytree(cached, target)
+            else:
+                shutil.copy2(cached, target)
+            restored.append(target)
+
+        return restored
+
+    def _store(self, key: str, populate) -> None:
+        """Tulis entry di direktori sementara lalu pindahkan secara atomik"""
+        entry_dir = self._entry_dir(key)
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.cache_dir))
+
+        try:
+            populate(staging_dir)
+            size = sum(f.stat().st_size for f in staging_dir.rglob("*") if f.is_file())
+            meta = {'key': key, 'created': time.time(), 'size': size}
+            (staging_dir / "meta.json").write_text(json.dumps(meta), encoding='utf-8')
+
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(staging_dir, entry_dir)
+        except OSError:
+            # Another job stored the same key first; its entry is just as good
+            pass
+        finally:
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+        self.evict()
+
+    def _entries(self) -> List[Dict[str, Any]]:
+        """Semua entry beserta ukuran dan waktu terakhir dipakai"""
+        entries = []
+        for meta_path in self.cache_dir.glob("*/*/meta.json"):
+            try:
+                meta = json.loads(meta_path.read_text(encoding='utf-8'))
+                entries.append({
+                    'path': meta_path.parent,
+                    'size': meta.get('size', 0),
+                    'last_used': meta_path.stat().st_mtime
+                })
+            except (OSError, ValueError):
+                continue
+        return entries
+
+    def evict(self) -> int:
+        """
+        Hapus entry yang paling lama tidak dipakai sampai ukuran cache di bawah batas
+
+        Returns:
+            Jumlah entry yang dihapus
+        """
+        entries = self._entries()
+        total_size = sum(entry['size'] for entry in entries)
+        removed = 0
+
+        for entry in sorted(entries, key=lambda e: e['last_used']):
+            if total_size <= self.max_size_bytes:
+                break
+            shutil.rmtree(entry['path'], ignore_errors=True)
+            total_size -= entry['size']
+            removed += 1
+
+        return removed
+
+    def clear(self) -> None:
+        """Hapus seluruh isi cache"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistik cache"""
+        entries = self._entries()
+        return {
+            'cache_dir': str(self.cache_dir),
+            'entries': len(entries),
+            'size_mb': sum(entry['size'] for entry in entries) / (1024 * 1024),
+            'max_size_mb': self.max_size_bytes / (1024 * 1024)
+        }
@@ -0,0 +1,130 @@
+"""
+Per-Page Conversion Checkpoints
+===============================
+
+Menyimpan hasil setiap halaman yang sudah selesai ke file JSON lines di
+samping output (`<output>.checkpoint.jsonl`). Jika konversi berhenti karena
+batas waktu, menjalankannya lagi dengan checkpoint aktif akan melanjutkan
+dari halaman pertama yang belum selesai, sehingga scan besar bisa diproses
+dalam beberapa potongan waktu.
+
+Baris pertama file adalah header yang mengikat checkpoint ke PDF sumber
+(ukuran + mtime, atau hash isi untuk PDF di memory) dan mode konversi; checkpoint dari PDF atau mode lain
+dibuang. Setiap halaman ditulis sebagai satu baris dengan satu write() ber
+O_APPEND, jadi worker shard di proses lain bisa mencatat ke file yang sama
+dan baris terakhir yang terpotong (crash) diabaikan saat dibaca.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    from .pdf_source import as_source
+except ImportError:
+    from pdf_source import as_source
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_SUFFIX = ".checkpoint.jsonl"
+
+# Penanda di markdown untuk dokumen yang tidak selesai (dicek oleh is_truncated)
+TRUNCATION_MARKER = "<!-- pdf-converter: truncated -->"
+
+
+def truncation_notice(completed_pages: int, total_pages: int, resumable: bool) -> str:
+    """Markdown yang menandai dokumen terpotong secara eksplisit"""
+    hint = ("Run the conversion again with --resume to continue from the first missing page."
+            if resumable else "Run with --resume to convert it across several time slices.")
+    return (f"\n{TRUNCATION_MARKER}\n\n"
+            f"> **⚠️ Incomplete conversion:** time limit reached after {completed_pages} of "
+            f"{total_pages} pages. {hint}\n\n")
+
+
+def is_truncated(markdown_path: Path, tail_bytes: int = 8192) -> bool:
+    """True jika output markdown berisi penanda dokumen terpotong"""
+    try:
+        with open(markdown_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - tail_bytes))
+            return TRUNCATION_MARKER.encode('utf-8') in f.read()
+    except OSError:
+        return False
+
+
+class PageCheckpoint:
+    """
+    Hasil per halaman yang sudah selesai untuk satu output
+
+    Contoh:
+        checkpoint = PageCheckpoint(output_md_path, pdf_path, mode="ocr")
+        done = checkpoint.load()             # {page_num: result}
+        checkpoint.record(page_num, result)  # setelah halaman selesai
+        checkpoint.remove()                  # setelah dokumen lengkap
+    """
+
+    def __init__(self, output_path: Path, pdf_path: Path, mode: str):
+        self.path = Path(output_path).with_name(Path(output_path).name + CHECKPOINT_SUFFIX)
+        source = as_source(pdf_path)
+        self.header = {
+            'version': CHECKPOINT_VERSION,
+            'source': source.name,
+            'size': source.size_bytes,
+            'mtime_ns': source.mtime_ns,
+            'mode': mode,
+        }
+        if source.in_memory:
+            self.header['sha256'] = source.sha256()
+
+    def load(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Baca halaman yang sudah selesai dan siapkan file untuk dilanjutkan
+
+        Checkpoint yang tidak cocok dengan PDF/mode saat ini diganti dengan
+        checkpoint kosong.
+        """
+        pages: Dict[int, Dict[str, Any]] = {}
+        valid = False
+
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f):
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn write at the end of an interrupted run
+                    if line_number == 0:
+                        valid = entry == self.header
+                        if not valid:
+                            break
+                    else:
+                        pages[entry['page']] = entry['result']
+
+        if not valid:
+            pages = {}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.header) + "\n", encoding='utf-8')
+
+        return pages
+
+    def record(self, page_num: int, result: Dict[str, Any]) -> None:
+        """Tambahkan hasil satu halaman (aman dipanggil dari beberapa proses)"""
+        line = json.dumps({'page': page_num, 'result': result}) + "\n"
+        fd = os.open(str(self.path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode('utf-8'))
+        finally:
+            os.close(fd)
+
+    def remove(self) -> None:
+        """Hapus checkpoint setelah dokumen selesai seluruhnya"""
+        self.path.unlink(missing_ok=True)
+
+
+def first_incomplete_page(completed: Iterable[int], total_pages: int) -> Optional[int]:
+    """Halaman (0-based) pertama yang belum ada di checkpoint, atau None jika semua selesai"""
+    done = set(completed)
+    for page_num in range(total_pages):
+        if page_num not in done:
+            return page_num
+    return None
@@ -1,279 +1,154 @@
 """
 PDF Converter Command Line Interface
 ====================================
+
+Entry point ringan: hanya library standar yang di-import sampai argumen
+selesai di-parse, sehingga --help dan --version tidak membayar biaya import
+rich, PyMuPDF, PyPDF2 atau PIL. PDFConverterCLI (di app.py) dan converter
+dimuat saat sebuah perintah benar-benar dijalankan.
 """
 
+import os
 import sys
 import argparse
+import contextlib
+import glob
+import importlib
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Tuple
 
-# Import dengan fallback untuk dependencies yang mungkin belum terinstall
 try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.prompt import Prompt, Confirm
-    from rich.text import Text
-    RICH_AVAILABLE = True
+    from .version import __version__
+    from .tracing import tracer, profile_run
 except ImportError:
-    RICH_AVAILABLE = False
-    # Fallback console
-    class Console:
-        def print(self, *args, **kwargs):
-            print(*args)
-    
-    class Prompt:
-        @staticmethod
-        def ask(prompt, choices=None, default=None):
-            if choices:
-                print(f"{prompt} {choices}")
-            user_input = input(f"{prompt}: ")
-            return user_input if user_input else default
+    from version import __version__
+    from tracing import tracer, profile_run
 
-# Import local modules
-try:
-    # Try relative imports first
-    from .converter import PDFConverter
-    from .utils import (
-        get_available_pdf_files, check_pandoc_installation, 
-        install_pandoc_guide, show_error_message
-    )
-except ImportError:
-    # Fallback untuk import absolut
-    import sys
-    import os
-    current_file_dir = os.path.dirname(__file__)
-    sys.path.insert(0, current_file_dir)
-    
-    from converter import PDFConverter
-    from utils import (
-        get_available_pdf_files, check_pandoc_installation,
-        install_pandoc_guide, show_error_message
-    )
+# Exit codes for the non-interactive convert command
+EXIT_OK = 0            # every file converted
+EXIT_FAILURES = 1      # at least one file failed, timed out or was not found
+EXIT_USAGE = 2         # bad arguments or no input files
+EXIT_PARTIAL = 3       # no failures, but at least one output stopped at the time limit (truncated)
+EXIT_INTERRUPTED = 130 # Ctrl+C
 
-console = Console()
 
-class PDFConverterCLI:
-    """
-    Command Line Interface untuk PDF Converter
+def expand_input_patterns(patterns: List[str]) -> Tuple[List[Path], List[str]]:
     """
+    Expand file, direktori dan glob (termasuk **) menjadi daftar PDF unik
     
-    def __init__(self, base_dir: Path):
-        self.base_dir = Path(base_dir)
-        self.temp_dir = self.base_dir / "temp"
-        self.output_dir = self.base_dir / "output"
-        self.converter = PDFConverter(self.temp_dir, self.output_dir)
-        
-        # Buat direktori jika belum ada
-        self.temp_dir.mkdir(exist_ok=True)
-        self.output_dir.mkdir(exist_ok=True)
-    
-    def show_banner(self):
-        """
-        Menampilkan banner aplikasi
-        """
-        banner_text = """
-    ╔══════════════════════════════════════════════════════════╗
-    ║                   PDF CONVERTER TOOL                     ║
-    ║                                                          ║
-    ║   Mengkonversi PDF ke berbagai format dengan pandoc     ║
-    ║   Mendukung: Markdown, HTML, Word, Text, dan lainnya    ║
-    ╚══════════════════════════════════════════════════════════╝
-        """
-        
-        if RICH_AVAILABLE:
-            console.print(Panel(banner_text, border_style="blue"))
-        else:
-            print(banner_text)
-    
-    def check_system_requirements(self) -> bool:
-        """
-        Memeriksa requirements sistem
-        """
-        if not check_pandoc_installation():
-            install_pandoc_guide()
-            return False
-        
-        return True
-    
-    def get_pdf_files_menu(self) -> List[Path]:
-        """
-        Menampilkan menu pemilihan file PDF
-        """
-        # Cari file PDF di direktori utama
-        pdf_files = get_available_pdf_files(self.base_dir.parent)
-        
-        if not pdf_files:
-            console.print("[red]Tidak ada file PDF ditemukan![/red]")
-            return []
-        
-        if RICH_AVAILABLE:
-            # Tampilkan tabel file PDF
-            table = Table(title="File PDF Tersedia")
-            table.add_column("No", style="cyan", width=4)
-            table.add_column("Nama File", style="magenta")
-            table.add_column("Ukuran", style="green")
-            table.add_column("Lokasi", style="yellow")
-            
-            for i, pdf_file in enumerate(pdf_files, 1):
-                file_size = pdf_file.stat().st_size / (1024 * 1024)  # MB
-                table.add_row(
-                    str(i),
-                    pdf_file.name,
-                    f"{file_size:.1f} MB",
-                    str(pdf_file.parent.name)
-                )
-            
-            console.print(table)
-        else:
-            print("\nFile PDF Tersedia:")
-            print("-" * 60)
-            for i, pdf_file in enumerate(pdf_files, 1):
-                file_size = pdf_file.stat().st_size / (1024 * 1024)
-                print(f"{i:2d}. {pdf_file.name} ({file_size:.1f} MB) - {pdf_file.parent.name}")
-        
-        return pdf_files
-    
-    def select_files(self, pdf_files: List[Path]) -> List[Path]:
-        """
-        Memilih file untuk dikonversi
-        """
-        print("\nPilihan:")
-        print("- Ketik nomor file (misal: 1,3,5)")
-        print("- Ketik 'all' untuk semua file")
-        print("- Ketik 'q' untuk keluar")
-        
-        choice = input("\nMasukkan pilihan: ").strip().lower()
-        
-        if choice == 'q':
-            return []
-        elif choice == 'all':
-            return pdf_files
-        else:
-            try:
-                selected_indices = []
-                for num_str in choice.split(','):
-                    num = int(num_str.strip())
-                    if 1 <= num <= len(pdf_files):
-                        selected_indices.append(num - 1)
-                
-                return [pdf_files[i] for i in selected_indices]
-            except ValueError:
-                console.print("[red]Input tidak valid![/red]")
-                return []
+    Returns:
+        (files, unmatched) - unmatched berisi pattern yang tidak menemukan PDF
+    """
+    files: Dict[Path, None] = {}
+    unmatched = []
     
-    def select_output_format(self) -> Optional[str]:
-        """
-        Memilih format output
-        """
-        formats = self.converter.get_supported_formats()
-        
-        if RICH_AVAILABLE:
-            table = Table(title="Format Output Tersedia")
-            table.add_column("Kode", style="cyan")
-            table.add_column("Nama Format", style="magenta")
-            table.add_column("Deskripsi", style="green")
-            
-            descriptions = {
-                'md': 'Text only markdown (basic)',
-                'md-hybrid': '🔥 HYBRID: Text+images preserved (RECOMMENDED)',
-                'md-ocr': '🔍 OCR: Everything as text (for scanned PDFs)',
-                'html': 'HTML untuk web dan presentasi',
-                'docx': 'Microsoft Word format',
-                'txt': 'Plain text sederhana',
-                'rtf': 'Rich Text Format',
-                'odt': 'OpenDocument Text',
-                'epub': 'Format eBook',
-                'latex': 'Untuk publikasi akademik',
-                'json': 'Format data terstruktur'
-            }
-            
-            for code, name in formats.items():
-                table.add_row(code, name, descriptions.get(code, ''))
-            
-            console.print(table)
+    for pattern in patterns:
+        if Path(pattern).is_dir():
+            matches = sorted(Path(pattern).glob("*.pdf")) + sorted(Path(pattern).glob("*.PDF"))
+        elif glob.has_magic(pattern):
+            matches = [Path(match) for match in sorted(glob.glob(pattern, recursive=True))
+                       if match.lower().endswith('.pdf') and Path(match).is_file()]
         else:
-            print("\nFormat Output Tersedia:")
-            print("-" * 40)
-            for code, name in formats.items():
-                print(f"{code:6s} - {name}")
-        
-        # Input format yang dipilih
-        format_choice = input(f"\nPilih format output [md-hybrid]: ").strip().lower()
+            matches = [Path(pattern)] if Path(pattern).is_file() else []
         
-        if not format_choice:
-            format_choice = 'md-hybrid'
-        
-        if format_choice in formats:
-            return format_choice
-        else:
-            console.print(f"[red]Format '{format_choice}' tidak valid![/red]")
-            return None
+        if not matches:
+            unmatched.append(pattern)
+        for match in matches:
+            files.setdefault(match.resolve(), None)
     
-    def run_interactive_mode(self):
-        """
-        Menjalankan mode interaktif
-        """
-        self.show_banner()
-        
-        # Periksa requirements
-        if not self.check_system_requirements():
-            return False
-        
-        while True:
-            try:
-                # Dapatkan daftar file PDF
-                pdf_files = self.get_pdf_files_menu()
-                if not pdf_files:
-                    break
-                
-                # Pilih file
-                selected_files = self.select_files(pdf_files)
-                if not selected_files:
-                    print("Tidak ada file dipilih.")
-                    continue
-                
-                # Pilih format output
-                output_format = self.select_output_format()
-                if not output_format:
-                    continue
-                
-                # Konfirmasi konversi
-                print(f"\nAkan mengkonversi {len(selected_files)} file ke format {output_format.upper()}")
-                confirm = input("Lanjutkan? (y/n) [y]: ").strip().lower()
-                
-                if confirm in ('', 'y', 'yes'):
-                    # Jalankan konversi
-                    successful = self.converter.batch_convert(selected_files, output_format)
-                    
-                    print(f"\nKonversi selesai!")
-                    print(f"Berhasil: {len(successful)} file")
-                    print(f"Gagal: {len(selected_files) - len(successful)} file")
-                    print(f"Output tersimpan di: {self.output_dir / output_format}")
-                
-                # Tanya apakah ingin konversi lagi
-                again = input("\nKonversi file lain? (y/n) [n]: ").strip().lower()
-                if again not in ('y', 'yes'):
-                    break
-                    
-            except KeyboardInterrupt:
-                print("\n\nKeluar...")
-                break
-            except Exception as e:
-                console.print(f"[red]Error: {str(e)}[/red]")
-                continue
-        
-        console.print("[green]Terima kasih telah menggunakan PDF Converter![/green]")
-        return True
+    return list(files), unmatched
+
+@contextlib.contextmanager
+def _stdout_to_stderr():
+    """
+    Alihkan stdout ke stderr, termasuk fd 1 yang dipakai subprocess
+    (pandoc, tesseract) dan library C, supaya stdout hanya berisi JSON
+    """
+    sys.stdout.flush()
+    saved_fd = os.dup(1)
+    os.dup2(2, 1)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            yield
+    finally:
+        sys.stderr.flush()
+        os.dup2(saved_fd, 1)
+        os.close(saved_fd)
+
+def _load_app():
+    """Import app.py (rich + converters) saat pertama dibutuhkan"""
+    if __package__:
+        return importlib.import_module(".app", __package__)
+    return importlib.import_module("app")
+
+def __getattr__(name):
+    # Keep `from cli import PDFConverterCLI` working without loading it eagerly
+    if name == 'PDFConverterCLI':
+        return _load_app().PDFConverterCLI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def main():
     """
     Fungsi utama
     """
     parser = argparse.ArgumentParser(description='PDF Converter Tool')
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
     parser.add_argument('--base-dir', type=str, default=None,
                        help='Base directory untuk converter')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Jumlah proses worker per dokumen untuk md-hybrid (0 = semua core)')
+    parser.add_argument('--cache-dir', type=str, default=None,
+                       help='Direktori cache hasil konversi (default: <base-dir>/cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Nonaktifkan cache hasil konversi')
+    # Choices are checked after parsing so the rasterizer is not imported for --help
+    parser.add_argument('--raster-backend', type=str, default='auto', metavar='BACKEND',
+                       help='Backend render halaman ke gambar: auto, pymupdf atau pdf2image (default: auto = PyMuPDF, fallback pdf2image)')
+    parser.add_argument('--image-codec', type=str, default='png-optimized', metavar='CODEC',
+                       help='Codec snapshot halaman: png, png-fast, png-optimized, jpeg, webp atau webp-lossless (default: png-optimized)')
+    parser.add_argument('--image-quality', type=int, default=None, metavar='1-100',
+                       help='Quality untuk codec jpeg/webp (default: 85)')
+    parser.add_argument('--temp-dir', type=str, default=None,
+                       help='Root direktori kerja sementara per job (default: <base-dir>/temp; bisa tmpfs seperti /dev/shm)')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Jumlah dokumen yang dikonversi bersamaan dalam satu batch (0 = semua core)')
+    parser.add_argument('--timeout', type=float, default=None,
+                       help='Batas waktu per dokumen dalam detik; dokumen yang melewatinya dihentikan')
+    parser.add_argument('--resume', action='store_true',
+                       help='Simpan checkpoint per halaman (md-hybrid/md-ocr) dan lanjutkan dari halaman yang belum selesai')
+    parser.add_argument('--time-limit', type=float, default=None, metavar='SECONDS',
+                       help='Batas waktu pemrosesan per dokumen untuk md-hybrid/md-ocr (default: 300)')
+    parser.add_argument('--trace', type=str, default=None, metavar='FILE',
+                       help='Tulis timing per stage (dokumen, halaman, rasterize, OCR, pandoc) sebagai JSON lines')
+    parser.add_argument('--profile', action='store_true',
+                       help='Jalankan di bawah cProfile dan tampilkan fungsi yang paling mahal')
+    parser.add_argument('--profile-output', type=str, default=None, metavar='FILE',
+                       help='Simpan statistik cProfile mentah ke file (dengan --profile)')
+    
+    subparsers = parser.add_subparsers(dest='command')
+    serve_parser = subparsers.add_parser('serve', help='Jalankan daemon konversi (HTTP atau Unix socket)')
+    serve_parser.add_argument('--host', type=str, default='127.0.0.1',
+                             help='Alamat TCP (default: 127.0.0.1)')
+    serve_parser.add_argument('--port', type=int, default=8765,
+                             help='Port TCP (default: 8765)')
+    serve_parser.add_argument('--socket', type=str, default=None,
+                             help='Listen di Unix socket ini, bukan TCP')
+    serve_parser.add_argument('--jobs', type=int, default=argparse.SUPPRESS,
+                             help='Jumlah konversi bersamaan (0 = semua core)')
+    serve_parser.add_argument('--verbose', action='store_true',
+                             help='Log setiap request')
+    
+    convert_parser = subparsers.add_parser('convert', help='Konversi non-interaktif dengan ringkasan JSON di stdout')
+    convert_parser.add_argument('inputs', nargs='+',
+                               help='File PDF, direktori atau glob (misalnya "docs/**/*.pdf")')
+    convert_parser.add_argument('--format', '-f', dest='output_format', type=str, default='md',
+                               help='Format output (md, md-hybrid, md-ocr, html, docx, ...)')
+    convert_parser.add_argument('--out', '-o', type=str, default=None,
+                               help='Direktori output (default: <base-dir>/output)')
+    convert_parser.add_argument('--jobs', '-j', type=int, default=argparse.SUPPRESS,
+                               help='Jumlah dokumen yang dikonversi bersamaan (0 = semua core)')
+    convert_parser.add_argument('--timeout', type=float, default=argparse.SUPPRESS,
+                               help='Batas waktu per dokumen dalam detik')
     
     args = parser.parse_args()
     
@@ -284,9 +159,54 @@ def main():
         # Gunakan direktori saat ini
         base_dir = Path(__file__).parent.parent
     
-    # Jalankan CLI
-    cli = PDFConverterCLI(base_dir)
-    cli.run_interactive_mode()
+    if args.trace:
+        tracer.configure(args.trace)
+    
+    # Warning yang dicetak backend saat di-import tidak boleh mengotori JSON convert
+    quiet = _stdout_to_stderr() if args.command == 'convert' else contextlib.nullcontext()
+    with quiet:
+        app = _load_app()
+        if args.raster_backend not in app.BACKEND_CHOICES:
+            parser.error(f"argument --raster-backend: invalid choice: '{args.raster_backend}' "
+                         f"(choose from {', '.join(app.BACKEND_CHOICES)})")
+        if args.image_codec not in app.CODEC_CHOICES:
+            parser.error(f"argument --image-codec: invalid choice: '{args.image_codec}' "
+                         f"(choose from {', '.join(app.CODEC_CHOICES)})")
+        if args.image_quality is not None and not 1 <= args.image_quality <= 100:
+            parser.error("argument --image-quality: must be between 1 and 100")
+        
+        # Jalankan CLI
+        cli = app.PDFConverterCLI(base_dir, workers=args.workers, use_cache=not args.no_cache,
+                                  cache_dir=args.cache_dir, raster_backend=args.raster_backend,
+                                  jobs=args.jobs, timeout=args.timeout, temp_dir=args.temp_dir,
+                                  output_dir=getattr(args, 'out', None),
+                                  resume=args.resume, time_limit=args.time_limit,
+                                  image_codec=args.image_codec, image_quality=args.image_quality)
+    try:
+        if args.command == 'convert':
+            if args.profile:
+                # Keep stdout for the JSON summary
+                with profile_run(args.profile_output, stream=sys.stderr):
+                    return cli.run_batch_mode(args.inputs, args.output_format)
+            return cli.run_batch_mode(args.inputs, args.output_format)
+        elif args.command == 'serve':
+            try:
+                from .server import serve
+            except ImportError:
+                from server import serve
+            serve(cli.converter, host=args.host, port=args.port, socket_path=args.socket,
+                  jobs=args.jobs, verbose=args.verbose)
+        elif args.profile:
+            with profile_run(args.profile_output):
+                cli.run_interactive_mode()
+        else:
+            cli.run_interactive_mode()
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+    finally:
+        tracer.close()
+    
+    return EXIT_OK
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -3,17 +3,14 @@ PDF Converter Core Class
 ========================
 """
 
+import importlib
 import subprocess
 import shutil
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator
 import tempfile
 import os
-
-try:
-    import pypandoc
-except ImportError:
-    pypandoc = None
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from rich.console import Console
@@ -30,10 +27,16 @@ except ImportError:
 
 try:
     from .utils import (
-        validate_pdf_file, create_output_directory, clean_temp_directory,
+        validate_pdf_file, create_output_directory, job_workspace,
         show_success_message, show_error_message, check_pandoc_installation
     )
-    from .pdf_extractor import PDFTextExtractor
+    from .cache import ConversionCache
+    from .batch import BatchScheduler, STATUS_OK
+    from .tracing import span
+    from .tools import tool_registry
+    from .checkpoint import is_truncated
+    from .image_encoder import DEFAULT_CODEC
+    from .pdf_source import PDFInput, open_source
 except ImportError:
     # Fallback untuk import absolut
     import sys
@@ -42,26 +45,40 @@ except ImportError:
     sys.path.insert(0, current_file_dir)
     
     from utils import (
-        validate_pdf_file, create_output_directory, clean_temp_directory,
+        validate_pdf_file, create_output_directory, job_workspace,
         show_success_message, show_error_message, check_pandoc_installation
     )
-    from pdf_extractor import PDFTextExtractor
-    from pdf_to_md_with_images import PDFToMarkdownWithImages
-    from advanced_pdf_processor import AdvancedPDFProcessor
-    from fast_pdf_processor import FastPDFProcessor
+    from cache import ConversionCache
+    from batch import BatchScheduler, STATUS_OK
+    from tracing import span
+    from tools import tool_registry
+    from checkpoint import is_truncated
+    from image_encoder import DEFAULT_CODEC
+    from pdf_source import PDFInput, open_source
 
 class PDFConverter:
     """
     Kelas utama untuk konversi PDF ke berbagai format
     """
     
-    def __init__(self, temp_dir: Path, output_dir: Path):
-        self.temp_dir = Path(temp_dir)
+    def __init__(self, temp_dir: Optional[Path], output_dir: Path, workers: int = 1,
+                 cache_dir: Optional[Path] = None, cache_size_mb: int = 1024,
+                 raster_backend: str = "auto", resume: bool = False,
+                 time_limit: Optional[float] = None, image_codec: str = DEFAULT_CODEC,
+                 image_quality: Optional[int] = None):
+        # Root for per-job workspaces; None uses the system temp dir (TMPDIR)
+        self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.gettempdir())
         self.output_dir = Path(output_dir)
-        self.pdf_extractor = PDFTextExtractor()
-        self.pdf_to_md_with_images = PDFToMarkdownWithImages(output_dir, temp_dir)
-        self.advanced_processor = AdvancedPDFProcessor(output_dir, temp_dir)
-        self.fast_processor = FastPDFProcessor(output_dir, temp_dir)  # Fast replacement
+        self.workers = workers  # Page-parallel workers for fast processor (0 = all cores)
+        self.raster_backend = raster_backend  # Page rasterizer: auto, pymupdf or pdf2image
+        self.image_codec = image_codec  # Page snapshot codec (see image_encoder.CODECS)
+        self.image_quality = image_quality  # Quality for jpeg/webp snapshots (None = codec default)
+        self.cache = ConversionCache(cache_dir, cache_size_mb) if cache_dir else None
+        self.resume = resume  # Checkpoint md-hybrid/md-ocr pages so a rerun continues where it stopped
+        self.time_limit = time_limit  # Per-document processing budget in seconds (None = processor default)
+        # Processor dibuat saat pertama dipakai (lihat property di bawah) supaya
+        # backend berat (PyMuPDF, PyPDF2, OCR) tidak di-import saat startup
+        self._processors: Dict[str, Any] = {}
         self.supported_formats = {
             'md': 'Markdown (text only)',
             'md-hybrid': 'Markdown Hybrid (text + images preserved)',
@@ -76,40 +93,81 @@ class PDFConverter:
             'json': 'JSON'
         }
         
+        # Format yang media-nya diekstrak pandoc ke workspace job (--extract-media)
+        self.media_formats = {'md', 'html', 'docx', 'odt', 'epub', 'latex'}
+        
         # Pandoc options untuk setiap format
         self.pandoc_options = {
             'md': [
-                '--extract-media=temp/images',
                 '--wrap=none',
                 '--standalone'
             ],
             'md-hybrid': [],  # Special handling
             'md-ocr': [],     # Special handling
             'html': [
-                '--extract-media=temp/images',
                 '--standalone',
                 '--self-contained'
             ],
-            'docx': [
-                '--extract-media=temp/images'
-            ],
+            'docx': [],
             'txt': [
                 '--wrap=none'
             ],
             'rtf': [],
-            'odt': [
-                '--extract-media=temp/images'
-            ],
-            'epub': [
-                '--extract-media=temp/images'
-            ],
+            'odt': [],
+            'epub': [],
             'latex': [
-                '--extract-media=temp/images',
                 '--standalone'
             ],
             'json': []
         }
     
+    def _get_processor(self, name: str, module_name: str, class_name: str, *args, **settings):
+        """Import modul processor dan buat instance-nya sekali, saat pertama dibutuhkan"""
+        processor = self._processors.get(name)
+        if processor is None:
+            try:
+                module = importlib.import_module(f".{module_name}", __package__)
+            except (ImportError, TypeError, ValueError):
+                module = importlib.import_module(module_name)
+            processor = getattr(module, class_name)(*args)
+            processor.raster_backend = self.raster_backend
+            processor.image_codec = self.image_codec
+            processor.image_quality = self.image_quality
+            for attribute, value in settings.items():
+                setattr(processor, attribute, value)
+            self._processors[name] = processor
+        return processor
+
+    @property
+    def pdf_extractor(self):
+        return self._get_processor('pdf_extractor', 'pdf_extractor', 'PDFTextExtractor')
+
+    @property
+    def pdf_to_md_with_images(self):
+        return self._get_processor('pdf_to_md_with_images', 'pdf_to_md_with_images',
+                                   'PDFToMarkdownWithImages', self.output_dir, self.temp_dir)
+
+    @property
+    def advanced_processor(self):
+        return self._get_processor('advanced_processor', 'advanced_pdf_processor',
+                                   'AdvancedPDFProcessor', self.output_dir, self.temp_dir)
+
+    @property
+    def fast_processor(self):
+        settings = {'checkpointing': self.resume}
+        if self.time_limit:
+            settings['max_processing_time'] = self.time_limit
+        return self._get_processor('fast_processor', 'fast_pdf_processor',
+                                   'FastPDFProcessor', self.output_dir, self.temp_dir, **settings)
+    
+    def _profile_document(self, input_file: Path):
+        """Scan PDF sekali; DocumentProfile-nya dipakai bersama oleh processor yang dipanggil"""
+        try:
+            from .document_profile import DocumentProfile
+        except ImportError:
+            from document_profile import DocumentProfile
+        return DocumentProfile.from_pdf(input_file)
+    
     def check_dependencies(self) -> bool:
         """
         Memeriksa dependensi yang diperlukan
@@ -120,13 +178,14 @@ class PDFConverter:
         
         return True
     
-    def convert_pdf(self, input_file: Path, output_format: str, 
+    def convert_pdf(self, input_file: PDFInput, output_format: str, 
                    custom_options: Optional[List[str]] = None) -> Optional[Path]:
         """
         Konversi PDF ke format yang ditentukan
         
         Args:
-            input_file: Path ke file PDF input
+            input_file: Path ke file PDF input, atau PDFSource / bytes PDF
+                (misalnya upload ke daemon) yang tidak pernah ditulis ke disk
             output_format: Format output (md, html, docx, dll)
             custom_options: Opsi pandoc tambahan
             
@@ -134,167 +193,369 @@ class PDFConverter:
             Path ke file output yang berhasil dibuat, atau None jika gagal
         """
         
-        # Validasi input
-        is_valid, message = validate_pdf_file(input_file)
-        if not is_valid:
-            show_error_message(message)
-            return None
-        
-        if output_format not in self.supported_formats:
-            show_error_message(f"Format '{output_format}' tidak didukung")
-            return None
-        
-        # Buat direktori output
-        format_dir = create_output_directory(self.output_dir, output_format)
-        
-        # Bersihkan dan buat direktori temp
-        clean_temp_directory(self.temp_dir)
-        
-        # Tentukan nama file output
-        output_filename = input_file.stem + f".{output_format}"
-        output_file = format_dir / output_filename
-        
-        try:
-            console.print(f"[yellow]Mengkonversi {input_file.name} ke {output_format.upper()}...[/yellow]")
+        # One open (memory-mapped) PDF shared by the profile, processors and cache key
+        with open_source(input_file) as source, \
+                span("document", processor="converter", format=output_format, file=source.name):
+            # Validasi input
+            is_valid, message = validate_pdf_file(source)
+            if not is_valid:
+                show_error_message(message)
+                return None
             
-            # Special handling for advanced markdown formats
-            if output_format in ['md-hybrid', 'md-ocr']:
-                format_dir = create_output_directory(self.output_dir, 'md')
-                
-                console.print(f"[cyan]🚀 Using FAST processor for {output_format}[/cyan]")
-                
-                if output_format == 'md-hybrid':
-                    success, msg, result_path = self.fast_processor.convert_pdf_fast(input_file, "hybrid")
-                else:  # md-ocr
-                    success, msg, result_path = self.fast_processor.convert_pdf_fast(input_file, "ocr")
+            if output_format not in self.supported_formats:
+                show_error_message(f"Format '{output_format}' tidak didukung")
+                return None
+            
+            # Cek cache: PDF yang sama dengan opsi yang sama tidak perlu diproses ulang
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(
+                    source, name=source.name, format=output_format,
+                    options=custom_options or [], raster_backend=self.raster_backend,
+                    image_codec=self.image_codec, image_quality=self.image_quality
+                )
+                cached_output = self._restore_cached_output(cache_key, source, output_format)
+                if cached_output:
+                    show_success_message(source, cached_output,
+                                       f"{self.supported_formats[output_format]} (cache)")
+                    return cached_output
+            
+            # Buat direktori output
+            format_dir = create_output_directory(self.output_dir, output_format)
+            
+            # Tentukan nama file output
+            output_filename = source.stem + f".{output_format}"
+            output_file = format_dir / output_filename
+            
+            try:
+                console.print(f"[yellow]Mengkonversi {source.name} ke {output_format.upper()}...[/yellow]")
                 
-                if success:
-                    # Move result to correct location if needed
-                    final_output = format_dir / f"{input_file.stem}.md"
-                    if result_path != final_output:
-                        if final_output.exists():
-                            final_output.unlink()
-                        
-                        # Move the file
-                        result_path.rename(final_output)
+                # Special handling for advanced markdown formats
+                if output_format in ['md-hybrid', 'md-ocr']:
+                    format_dir = create_output_directory(self.output_dir, 'md')
+                    
+                    console.print(f"[cyan]🚀 Using FAST processor for {output_format}[/cyan]")
+                    profile = self._profile_document(source)
+                    
+                    if output_format == 'md-hybrid':
+                        success, msg, result_path = self.fast_processor.convert_pdf_fast(
+                            source, "hybrid", workers=self.workers, profile=profile
+                        )
+                    else:  # md-ocr
+                        success, msg, result_path = self.fast_processor.convert_pdf_fast(
+                            source, "ocr", workers=self.workers, profile=profile
+                        )
+                    
+                    if success and is_truncated(result_path):
+                        # Partial output is never cached; with --resume it stays next to
+                        # its checkpoint and images so the next run can continue it
+                        console.print(f"[yellow]⚠️ {msg}[/yellow]")
+                        if self.resume:
+                            console.print("[yellow]Run again with --resume to continue this document[/yellow]")
+                            return result_path
+                        cache_key = None
+                    
+                    if success:
+                        # Move result to correct location if needed
+                        final_output = format_dir / f"{source.stem}.md"
+                        if result_path != final_output:
+                            if final_output.exists():
+                                final_output.unlink()
+                            
+                            # Move the file
+                            result_path.rename(final_output)
+                            
+                            # Also move images directory if it exists
+                            src_images_dir = result_path.parent / f"{result_path.stem}_images"
+                            dest_images_dir = final_output.parent / f"{final_output.stem}_images"
+                            if src_images_dir.exists() and src_images_dir != dest_images_dir:
+                                if dest_images_dir.exists():
+                                    shutil.rmtree(dest_images_dir)
+                                src_images_dir.rename(dest_images_dir)
                         
-                        # Also move images directory if it exists
-                        src_images_dir = result_path.parent / f"{result_path.stem}_images"
-                        dest_images_dir = final_output.parent / f"{final_output.stem}_images"
-                        if src_images_dir.exists() and src_images_dir != dest_images_dir:
-                            if dest_images_dir.exists():
-                                shutil.rmtree(dest_images_dir)
-                            src_images_dir.rename(dest_images_dir)
+                        self._store_cached_output(cache_key, final_output)
+                        show_success_message(source, final_output, f"FAST {output_format.upper()}")
+                        return final_output
+                    else:
+                        show_error_message(f"Fast {output_format} conversion failed: {msg}")
+                        return None
+                
+                # Special handling for legacy md-img format
+                elif output_format == 'md-img':
+                    format_dir = create_output_directory(self.output_dir, 'md')
+                    output_file = format_dir / f"{source.stem}.md"
                     
-                    show_success_message(input_file, final_output, f"FAST {output_format.upper()}")
-                    return final_output
-                else:
-                    show_error_message(f"Fast {output_format} conversion failed: {msg}")
+                    console.print("[blue]Using legacy PDF to Markdown with Images converter...[/blue]")
+                    success, msg, result_path = self.pdf_to_md_with_images.convert_pdf_to_markdown_with_images(
+                        source, profile=self._profile_document(source)
+                    )
+                    
+                    if success:
+                        # Move result to correct location
+                        if result_path != output_file:
+                            shutil.move(str(result_path), str(output_file))
+                            # Also move images directory if it exists
+                            src_images_dir = result_path.parent / f"{result_path.stem}_images"
+                            dest_images_dir = output_file.parent / f"{output_file.stem}_images"
+                            if src_images_dir.exists() and src_images_dir != dest_images_dir:
+                                if dest_images_dir.exists():
+                                    shutil.rmtree(dest_images_dir)
+                                shutil.move(str(src_images_dir), str(dest_images_dir))
+                        
+                        show_success_message(source, output_file, "Markdown with Images")
+                        return output_file
+                    else:
+                        show_error_message(f"Markdown with images conversion failed: {msg}")
+                        return None
+                
+                # Regular conversion process for other formats
+                # Step 1: Extract text from PDF
+                console.print("[blue]Step 1: Extracting text from PDF...[/blue]")
+                success, text_content, extract_msg = self._extract_text_cached(source)
+                
+                if not success:
+                    show_error_message(f"Failed to extract text from PDF: {extract_msg}")
                     return None
-            
-            # Special handling for legacy md-img format
-            elif output_format == 'md-img':
-                format_dir = create_output_directory(self.output_dir, 'md')
-                output_file = format_dir / f"{input_file.stem}.md"
                 
-                console.print("[blue]Using legacy PDF to Markdown with Images converter...[/blue]")
-                success, msg, result_path = self.pdf_to_md_with_images.convert_pdf_to_markdown_with_images(
-                    input_file
-                )
+                console.print(f"[green]✓ {extract_msg}[/green]")
                 
-                if success:
-                    # Move result to correct location
-                    if result_path != output_file:
-                        shutil.move(str(result_path), str(output_file))
-                        # Also move images directory if it exists
-                        src_images_dir = result_path.parent / f"{result_path.stem}_images"
-                        dest_images_dir = output_file.parent / f"{output_file.stem}_images"
-                        if src_images_dir.exists() and src_images_dir != dest_images_dir:
-                            if dest_images_dir.exists():
-                                shutil.rmtree(dest_images_dir)
-                            shutil.move(str(src_images_dir), str(dest_images_dir))
+                # Step 2: Save as temporary markdown in this job's own workspace
+                with job_workspace(self.temp_dir, prefix=f"{source.stem}-") as workspace:
+                    temp_md_file = workspace / f"{source.stem}_temp.md"
+                    if not self.pdf_extractor.save_text_as_markdown(text_content, temp_md_file):
+                        show_error_message("Failed to save temporary markdown file")
+                        return None
                     
-                    show_success_message(input_file, output_file, "Markdown with Images")
-                    return output_file
-                else:
-                    show_error_message(f"Markdown with images conversion failed: {msg}")
-                    return None
+                    # Step 3: Use pandoc to convert from markdown to target format
+                    return self._render_markdown(source, temp_md_file, output_format,
+                                                 custom_options, cache_key)
+                    
+            except subprocess.CalledProcessError as e:
+                error_msg = f"Pandoc error: {e.stderr if e.stderr else str(e)}"
+                show_error_message(error_msg)
+                return None
+            except Exception as e:
+                show_error_message(f"Konversi gagal: {str(e)}")
+                return None
+    
+    def _render_markdown(self, input_file: Path, temp_md_file: Path, output_format: str,
+                         custom_options: Optional[List[str]] = None,
+                         cache_key: Optional[str] = None) -> Optional[Path]:
+        """
+        Konversi markdown sementara ke format target (pandoc atau copy untuk md)
+        
+        Media yang diekstrak pandoc ditulis ke workspace job (folder yang
+        berisi temp_md_file), satu folder per format.
+        
+        Raises:
+            subprocess.CalledProcessError: Jika pandoc gagal
+        """
+        format_dir = create_output_directory(self.output_dir, output_format)
+        output_filename = input_file.stem + f".{output_format}"
+        output_file = format_dir / output_filename
+        workspace = temp_md_file.parent
+        media_dir = workspace / f"images-{output_format}"
+        
+        if output_format == 'md':
+            # For markdown, just copy the temp file
+            shutil.copy2(temp_md_file, output_file)
+        else:
+            # Use pandoc to convert from markdown to other formats
+            pandoc_args = ['pandoc']
             
-            # Regular conversion process for other formats
-            # Step 1: Extract text from PDF
-            console.print("[blue]Step 1: Extracting text from PDF...[/blue]")
-            success, text_content, extract_msg = self.pdf_extractor.extract_text(input_file)
+            # Add options for format
+            if output_format in self.pandoc_options:
+                pandoc_args.extend(self.pandoc_options[output_format])
+            if output_format in self.media_formats:
+                pandoc_args.append(f'--extract-media={media_dir}')
             
-            if not success:
-                show_error_message(f"Failed to extract text from PDF: {extract_msg}")
-                return None
+            # Add custom options if provided
+            if custom_options:
+                pandoc_args.extend(custom_options)
             
-            console.print(f"[green]✓ {extract_msg}[/green]")
+            # Add input and output
+            pandoc_args.extend([
+                str(temp_md_file),
+                '-o', str(output_file)
+            ])
             
-            # Step 2: Save as temporary markdown
-            temp_md_file = self.temp_dir / f"{input_file.stem}_temp.md"
-            if not self.pdf_extractor.save_text_as_markdown(text_content, temp_md_file):
-                show_error_message("Failed to save temporary markdown file")
-                return None
+            console.print(f"[blue]Step 2: Converting to {output_format.upper()} using pandoc...[/blue]")
             
-            # Step 3: Use pandoc to convert from markdown to target format
-            if output_format == 'md':
-                # For markdown, just copy the temp file
-                shutil.copy2(temp_md_file, output_file)
-            else:
-                # Use pandoc to convert from markdown to other formats
-                pandoc_args = ['pandoc']
-                
-                # Add options for format
-                if output_format in self.pandoc_options:
-                    pandoc_args.extend(self.pandoc_options[output_format])
-                
-                # Add custom options if provided
-                if custom_options:
-                    pandoc_args.extend(custom_options)
-                
-                # Add input and output
-                pandoc_args.extend([
-                    str(temp_md_file),
-                    '-o', str(output_file)
-                ])
-                
-                console.print(f"[blue]Step 2: Converting to {output_format.upper()} using pandoc...[/blue]")
-                
-                # Run pandoc
-                result = subprocess.run(
+            # Run pandoc
+            with span("pandoc", format=output_format):
+                subprocess.run(
                     pandoc_args,
-                    cwd=self.temp_dir.parent,
+                    cwd=workspace,
                     capture_output=True,
                     text=True,
                     check=True
                 )
+        
+        # Periksa apakah file output berhasil dibuat
+        if output_file.exists() and output_file.stat().st_size > 0:
+            # Pindahkan gambar jika ada
+            self._move_extracted_images(media_dir, format_dir, output_filename)
+            self._store_cached_output(cache_key, output_file)
+            
+            show_success_message(input_file, output_file, 
+                               self.supported_formats[output_format])
+            return output_file
+        else:
+            show_error_message(f"File output {output_format.upper()} tidak berhasil dibuat")
+            return None
+    
+    def convert_pdf_multi(self, input_file: PDFInput, formats: List[str],
+                          custom_options: Optional[List[str]] = None,
+                          max_workers: Optional[int] = None) -> Dict[str, Optional[Path]]:
+        """
+        Konversi satu PDF ke beberapa format dengan satu kali ekstraksi
+        
+        Teks diekstrak sekali ke dokumen markdown sementara, lalu setiap
+        format pandoc dijalankan secara paralel dari dokumen yang sama.
+        Format md-hybrid/md-ocr tetap memakai pipeline-nya sendiri.
+        
+        Args:
+            input_file: Path ke file PDF input, atau PDFSource / bytes PDF
+            formats: List format output (md, html, docx, dll)
+            custom_options: Opsi pandoc tambahan
+            max_workers: Maksimum proses pandoc bersamaan (default: jumlah format)
+            
+        Returns:
+            Dict {format: path output atau None jika gagal}
+        """
+        # One open (memory-mapped) PDF shared by the cache keys, extraction and fast formats
+        with open_source(input_file) as source:
+            results: Dict[str, Optional[Path]] = {}
+            
+            is_valid, message = validate_pdf_file(source)
+            if not is_valid:
+                show_error_message(message)
+                return {output_format: None for output_format in formats}
+            
+            # Pisahkan format yang butuh ekstraksi teks bersama
+            pending = []
+            cache_keys = {}
+            for output_format in dict.fromkeys(formats):
+                if output_format not in self.supported_formats:
+                    show_error_message(f"Format '{output_format}' tidak didukung")
+                    results[output_format] = None
+                elif output_format in ['md-hybrid', 'md-ocr']:
+                    results[output_format] = self.convert_pdf(source, output_format, custom_options)
+                else:
+                    if self.cache is not None:
+                        cache_keys[output_format] = self.cache.make_key(
+                            source, name=source.name, format=output_format,
+                            options=custom_options or [], raster_backend=self.raster_backend,
+                            image_codec=self.image_codec, image_quality=self.image_quality
+                        )
+                        cached_output = self._restore_cached_output(cache_keys[output_format],
+                                                                    source, output_format)
+                        if cached_output:
+                            show_success_message(source, cached_output,
+                                               f"{self.supported_formats[output_format]} (cache)")
+                            results[output_format] = cached_output
+                            continue
+                    pending.append(output_format)
+            
+            if not pending:
+                return results
+            
+            console.print(f"[yellow]Mengkonversi {source.name} ke {', '.join(f.upper() for f in pending)}...[/yellow]")
+            
+            # Step 1: Extract text once
+            console.print("[blue]Step 1: Extracting text from PDF...[/blue]")
+            success, text_content, extract_msg = self._extract_text_cached(source)
+            
+            if not success:
+                show_error_message(f"Failed to extract text from PDF: {extract_msg}")
+                results.update({output_format: None for output_format in pending})
+                return results
+            
+            console.print(f"[green]✓ {extract_msg}[/green]")
             
-            # Periksa apakah file output berhasil dibuat
-            if output_file.exists() and output_file.stat().st_size > 0:
-                # Pindahkan gambar jika ada
-                self._move_extracted_images(format_dir, output_filename)
+            with job_workspace(self.temp_dir, prefix=f"{source.stem}-") as workspace:
+                temp_md_file = workspace / f"{source.stem}_temp.md"
+                if not self.pdf_extractor.save_text_as_markdown(text_content, temp_md_file):
+                    show_error_message("Failed to save temporary markdown file")
+                    results.update({output_format: None for output_format in pending})
+                    return results
                 
-                show_success_message(input_file, output_file, 
-                                   self.supported_formats[output_format])
-                return output_file
-            else:
-                show_error_message("File output tidak berhasil dibuat")
-                return None
+                # Step 2: Fan out to every target format concurrently
+                def render(output_format: str) -> Optional[Path]:
+                    try:
+                        return self._render_markdown(source, temp_md_file, output_format,
+                                                     custom_options, cache_keys.get(output_format))
+                    except subprocess.CalledProcessError as e:
+                        show_error_message(f"Pandoc error ({output_format}): {e.stderr if e.stderr else str(e)}")
+                    except Exception as e:
+                        show_error_message(f"Konversi {output_format} gagal: {str(e)}")
+                    return None
                 
-        except subprocess.CalledProcessError as e:
-            error_msg = f"Pandoc error: {e.stderr if e.stderr else str(e)}"
-            show_error_message(error_msg)
-            return None
+                with ThreadPoolExecutor(max_workers=max_workers or len(pending)) as executor:
+                    for output_format, output_path in zip(pending, executor.map(render, pending)):
+                        results[output_format] = output_path
+            
+            return results
+    
+    def _extract_text_cached(self, input_file: Path):
+        """
+        Ekstraksi teks dengan cache (hasilnya dipakai ulang untuk semua format)
+        
+        Returns:
+            (success, text_content, message)
+        """
+        if self.cache is None:
+            return self.pdf_extractor.extract_text(input_file)
+        
+        text_key = self.cache.make_key(input_file, stage='text', method='auto',
+                                       raster_backend=self.raster_backend)
+        cached_text = self.cache.get_text(text_key)
+        if cached_text is not None:
+            return True, cached_text, "Text loaded from cache"
+        
+        success, text_content, message = self.pdf_extractor.extract_text(input_file)
+        if success:
+            self.cache.put_text(text_key, text_content)
+        return success, text_content, message
+    
+    def _output_location(self, input_file: Path, output_format: str) -> Path:
+        """Path file output final untuk format tertentu"""
+        if output_format in ['md-hybrid', 'md-ocr']:
+            return self.output_dir / 'md' / f"{input_file.stem}.md"
+        return self.output_dir / output_format / f"{input_file.stem}.{output_format}"
+    
+    def _restore_cached_output(self, cache_key: str, input_file: Path,
+                               output_format: str) -> Optional[Path]:
+        """Pulihkan output dari cache, None jika cache miss"""
+        output_file = self._output_location(input_file, output_format)
+        with span("cache_lookup", format=output_format) as lookup_span:
+            restored = self.cache.restore_files(cache_key, output_file.parent)
+            lookup_span.set(hit=output_file in restored)
+        
+        if output_file in restored:
+            return output_file
+        return None
+    
+    def _store_cached_output(self, cache_key: Optional[str], output_file: Path):
+        """Simpan file output beserta folder gambarnya ke cache"""
+        if self.cache is None or cache_key is None:
+            return
+        
+        paths = [output_file]
+        images_dir = output_file.parent / f"{output_file.stem}_images"
+        if images_dir.exists():
+            paths.append(images_dir)
+        
+        try:
+            with span("cache_store"):
+                self.cache.put_files(cache_key, paths)
         except Exception as e:
-            show_error_message(f"Konversi gagal: {str(e)}")
-            return None
+            console.print(f"[yellow]Warning: could not store result in cache: {e}[/yellow]")
     
-    def _move_extracted_images(self, format_dir: Path, output_filename: str):
+    def _move_extracted_images(self, temp_images_dir: Path, format_dir: Path, output_filename: str):
         """
         Memindahkan gambar yang diekstrak ke direktori output
         """
-        temp_images_dir = self.temp_dir / "images"
         if temp_images_dir.exists():
             # Buat direktori gambar di output
             output_images_dir = format_dir / f"{Path(output_filename).stem}_images"
@@ -306,7 +567,8 @@ class PDFConverter:
                     shutil.copy2(image_file, output_images_dir)
     
     def batch_convert(self, input_files: List[Path], output_format: str,
-                     custom_options: Optional[List[str]] = None) -> List[Path]:
+                     custom_options: Optional[List[str]] = None, jobs: int = 1,
+                     timeout: Optional[float] = None) -> List[Path]:
         """
         Konversi batch multiple PDF files
         
@@ -314,18 +576,70 @@ class PDFConverter:
             input_files: List file PDF untuk dikonversi
             output_format: Format output
             custom_options: Opsi pandoc tambahan
+            jobs: Jumlah dokumen yang dikonversi bersamaan (0 = semua core)
+            timeout: Batas waktu per dokumen dalam detik (None = tanpa batas)
             
         Returns:
-            List path file output yang berhasil dibuat
+            List path file output yang berhasil dibuat (urutan input)
+        """
+        results = []
+        
+        for result in track(self.iter_batch_convert(input_files, output_format, custom_options,
+                                                    jobs=jobs, timeout=timeout),
+                            description=f"Converting to {output_format.upper()}"):
+            if result['status'] != STATUS_OK:
+                console.print(f"[red]✗ {result['input'].name}: {result['error']}[/red]")
+            results.append(result)
+        
+        results.sort(key=lambda result: result['index'])
+        return [result['output'] for result in results if result['status'] == STATUS_OK]
+    
+    def iter_batch_convert(self, input_files: Iterable[Path], output_format: str,
+                           custom_options: Optional[List[str]] = None, jobs: int = 1,
+                           timeout: Optional[float] = None,
+                           scheduler: Optional[BatchScheduler] = None) -> Iterator[Dict[str, Any]]:
         """
-        successful_conversions = []
+        Konversi batch dan yield hasil setiap file begitu file itu selesai
         
-        for input_file in track(input_files, description=f"Converting to {output_format.upper()}"):
-            result = self.convert_pdf(input_file, output_format, custom_options)
-            if result:
-                successful_conversions.append(result)
+        Dokumen dikonversi di beberapa proses worker (lihat BatchScheduler);
+        satu dokumen yang gagal atau melewati timeout tidak menahan yang lain.
+        Berikan scheduler sendiri untuk bisa memanggil scheduler.cancel().
         
-        return successful_conversions
+        Yields:
+            Dict dengan 'index', 'input', 'output', 'status', 'error', 'elapsed'
+        """
+        if scheduler is None:
+            scheduler = BatchScheduler(jobs=jobs, timeout=timeout)
+        yield from scheduler.run(self, input_files, output_format, custom_options)
+    
+    def get_worker_config(self) -> Dict[str, Any]:
+        """Argumen constructor untuk membuat converter yang sama di proses worker"""
+        return {
+            'temp_dir': self.temp_dir,
+            'output_dir': self.output_dir,
+            'workers': self.workers,
+            'cache_dir': self.cache.cache_dir if self.cache is not None else None,
+            'cache_size_mb': self.cache.max_size_bytes // (1024 * 1024) if self.cache is not None else 1024,
+            'raster_backend': self.raster_backend,
+            'image_codec': self.image_codec,
+            'image_quality': self.image_quality,
+            'resume': self.resume,
+            'time_limit': self.time_limit,
+        }
+    
+    def get_status_info(self) -> Dict[str, Any]:
+        """
+        Status tool eksternal (versi, bahasa OCR, format output pandoc) dari
+        probe yang di-cache, plus konfigurasi converter
+        """
+        return {
+            'tools': tool_registry.status(),
+            'supported_formats': list(self.supported_formats),
+            'raster_backend': self.raster_backend,
+            'image_codec': self.image_codec,
+            'workers': self.workers,
+            'cache_enabled': self.cache is not None,
+        }
     
     def get_supported_formats(self) -> Dict[str, str]:
         """
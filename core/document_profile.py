@@ -0,0 +1,229 @@
+"""
+Document Profile
+================
+
+Analisis satu kali per dokumen yang dipakai bersama oleh semua processor:
+jumlah halaman, label per halaman (text/scan/mixed/vector), perkiraan
+panjang text layer, jumlah gambar, luas area halaman yang tertutup gambar
+dan font yang dipakai. Sinyalnya diambil dari content stream dan resource
+halaman (lihat page_classifier.py), tanpa ekstraksi teks. Sebelumnya setiap
+processor membuka ulang PDF dan men-scan semua halaman untuk keputusan yang
+sama (mode auto, halaman yang butuh snapshot/OCR, sampling).
+
+Contoh:
+    profile = DocumentProfile.from_pdf(pdf_path)
+    if profile.label_counts()['scan'] > profile.total_pages // 2:
+        ...
+    processor.convert_pdf_fast(pdf_path, "auto", profile=profile)
+
+Halaman diklasifikasikan saat pertama dibutuhkan dan hasilnya disimpan:
+from_pdf() hanya menghitung halaman, classify(pages) mengisi halaman yang
+diminta dalam satu kali buka dokumen, dan properti yang butuh semua halaman
+(pages, label_counts, ...) mengklasifikasikan sisanya. Pemilihan mode dari
+sampel (mode_selector.py) jadi hanya membayar halaman yang disampel.
+
+Profile terikat ke ukuran + mtime file (atau hash isi untuk PDF di memory);
+ensure_profile() membuat profile baru jika yang diberikan sudah tidak cocok
+dengan file di disk. Profile menyimpan PDFSource-nya, jadi klasifikasi
+berikutnya membaca buffer yang sama dengan processor.
+"""
+
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Import libraries dengan fallback
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+try:
+    from PyPDF2 import PdfReader
+    PYPDF2_AVAILABLE = True
+except ImportError:
+    PYPDF2_AVAILABLE = False
+
+try:
+    from .tracing import span
+    from .pdf_source import as_source
+    from .page_classifier import (
+        PageSignals, page_signals, classify_signals,
+        PAGE_LABELS, PAGE_TEXT, PAGE_SCAN, PAGE_MIXED, MIN_TEXT_CHARS
+    )
+except ImportError:
+    from tracing import span
+    from pdf_source import as_source
+    from page_classifier import (
+        PageSignals, page_signals, classify_signals,
+        PAGE_LABELS, PAGE_TEXT, PAGE_SCAN, PAGE_MIXED, MIN_TEXT_CHARS
+    )
+
+# number: 1-based page number; label: text, scan, mixed or vector; the rest
+# are the classifier's PageSignals (text_chars is an estimate, see page_classifier)
+PageProfile = namedtuple('PageProfile', ['number', 'label'] + list(PageSignals._fields))
+
+
+class DocumentProfile:
+    """
+    Statistik per halaman dari satu PDF, dihitung sekali lalu dipakai ulang
+
+    Attributes:
+        source: PDFSource yang di-profile
+        pdf_path: File yang di-profile (nama dokumen untuk PDF di memory)
+        size_bytes, mtime_ns: Identitas file saat profile dibuat (mtime_ns None untuk memory)
+        total_pages: Jumlah halaman
+        backend: "pymupdf", "pypdf2" atau "none" (PyPDF2 tidak mengisi data gambar/font)
+    """
+
+    def __init__(self, pdf_path, total_pages: int, backend: str):
+        self.source = as_source(pdf_path)
+        self.pdf_path = self.source.path or Path(self.source.name)
+        self.size_bytes = self.source.size_bytes
+        self.mtime_ns = self.source.mtime_ns
+        self.total_pages = total_pages
+        self.backend = backend
+        self._pages: Dict[int, PageProfile] = {}  # page number -> profile, filled on demand
+        self._cache: Dict = {}  # font/image lookups shared by all pages
+
+    @classmethod
+    def from_pdf(cls, pdf_path) -> "DocumentProfile":
+        """
+        Buka PDF (Path atau PDFSource) untuk jumlah halaman (PyMuPDF, fallback
+        PyPDF2); PDF yang tidak terbaca menjadi profile kosong
+        """
+        source = as_source(pdf_path)
+        with span("document_profile", file=source.name) as profile_span:
+            total_pages = 0
+            backend = "none"
+            try:
+                if PYMUPDF_AVAILABLE:
+                    backend = "pymupdf"
+                    doc = source.open_fitz()
+                    total_pages = len(doc)
+                    doc.close()
+                elif PYPDF2_AVAILABLE:
+                    backend = "pypdf2"
+                    total_pages = len(source.pdf_reader().pages)
+            except Exception as e:
+                # Processors fall back to their own defaults for an empty profile
+                profile_span.set(error=str(e))
+                total_pages = 0
+            profile_span.set(pages=total_pages, backend=backend)
+        return cls(source, total_pages, backend)
+
+    def classify(self, page_numbers: Optional[Iterable[int]] = None) -> None:
+        """
+        Klasifikasikan halaman (1-based) yang belum ada di profile
+
+        Args:
+            page_numbers: Halaman yang dibutuhkan; default semua halaman
+        """
+        if page_numbers is None:
+            page_numbers = range(1, self.total_pages + 1)
+        missing = sorted(set(page_numbers) - set(self._pages))
+        if not missing:
+            return
+
+        with span("classify_pages", pages=len(missing)):
+            if self.backend == "pymupdf":
+                doc = self.source.open_fitz()
+                try:
+                    for page_num in missing:
+                        signals = page_signals(doc.load_page(page_num - 1), self._cache)
+                        self._pages[page_num] = PageProfile(page_num, classify_signals(signals), *signals)
+                finally:
+                    doc.close()
+            elif self.backend == "pypdf2":
+                reader = self.source.pdf_reader()
+                for page_num in missing:
+                    text = (reader.pages[page_num - 1].extract_text() or "").strip()
+                    # Images are not visible here: a page without text is assumed to be a scan
+                    label = PAGE_TEXT if len(text) > MIN_TEXT_CHARS else PAGE_SCAN
+                    self._pages[page_num] = PageProfile(page_num, label, 0, 0, len(text), False,
+                                                        0, 0.0, frozenset())
+
+    @property
+    def classified_pages(self) -> int:
+        """Jumlah halaman yang sudah diklasifikasikan"""
+        return len(self._pages)
+
+    @property
+    def pages(self) -> List[PageProfile]:
+        """PageProfile semua halaman (urutan halaman; mengklasifikasikan sisanya)"""
+        self.classify()
+        return [self._pages[page_num] for page_num in range(1, self.total_pages + 1)]
+
+    def matches(self, pdf_path) -> bool:
+        """True jika profile ini masih menggambarkan file di pdf_path (atau PDFSource)"""
+        if pdf_path is self.source:
+            return True
+        try:
+            return as_source(pdf_path).identity() == self.source.identity()
+        except OSError:
+            return False
+
+    @property
+    def file_size_mb(self) -> float:
+        return self.size_bytes / (1024 * 1024)
+
+    @property
+    def embedded_images(self) -> int:
+        return sum(page.image_count for page in self.pages)
+
+    @property
+    def fonts(self) -> List[str]:
+        """Semua font yang dipakai di dokumen (terurut)"""
+        return sorted(set().union(*(page.fonts for page in self.pages)))
+
+    @property
+    def text_ratio(self) -> float:
+        """Bagian halaman yang punya text layer cukup"""
+        if not self.pages:
+            return 0.0
+        return len(self.text_pages()) / len(self.pages)
+
+    def page(self, page_number: int) -> PageProfile:
+        """Profile satu halaman (1-based)"""
+        if page_number not in self._pages:
+            if not 1 <= page_number <= self.total_pages:
+                raise IndexError(f"page {page_number} out of range (1-{self.total_pages})")
+            self.classify([page_number])
+        return self._pages[page_number]
+
+    def label_counts(self) -> Dict[str, int]:
+        """Jumlah halaman per label"""
+        counts = dict.fromkeys(PAGE_LABELS, 0)
+        for page in self.pages:
+            counts[page.label] += 1
+        return counts
+
+    def text_pages(self) -> List[int]:
+        """Nomor halaman (1-based) dengan text layer yang terlihat (text atau mixed)"""
+        return [page.number for page in self.pages if page.label in (PAGE_TEXT, PAGE_MIXED)]
+
+    def low_text_pages(self) -> List[int]:
+        """Nomor halaman (1-based) tanpa teks yang bisa dipakai (scan atau vector: kandidat snapshot/OCR)"""
+        return [page.number for page in self.pages if page.label not in (PAGE_TEXT, PAGE_MIXED)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Ringkasan yang bisa di-serialize ke JSON (tanpa data per halaman; mengklasifikasikan semua halaman)"""
+        return {
+            'file': self.source.name,
+            'total_pages': self.total_pages,
+            'file_size_mb': round(self.file_size_mb, 2),
+            'text_pages': len(self.text_pages()),
+            'embedded_images': self.embedded_images,
+            'text_ratio': round(self.text_ratio, 3),
+            'labels': self.label_counts(),
+            'fonts': self.fonts,
+            'backend': self.backend,
+        }
+
+
+def ensure_profile(pdf_path, profile: Optional[DocumentProfile] = None) -> DocumentProfile:
+    """Pakai profile yang diberikan jika masih cocok dengan file, jika tidak buat yang baru"""
+    if profile is not None and profile.matches(pdf_path):
+        return profile
+    return DocumentProfile.from_pdf(pdf_path)
@@ -8,8 +8,9 @@ Versi optimized untuk processing cepat dan tidak stuck
 import os
 import tempfile
 import time
+from functools import partial
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, FrozenSet
 import subprocess
 
 # Import libraries dengan fallback
@@ -47,6 +48,196 @@ except ImportError:
             print(*args)
     console = Console()
 
+try:
+    from .page_parallel import run_page_shards
+    from .ocr_pool import OCRScheduler
+    from .ocr_router import OCRRouter
+    from .markdown_writer import MarkdownWriter
+    from .tracing import span
+    from .checkpoint import PageCheckpoint, first_incomplete_page, truncation_notice
+    from .image_encoder import ImageEncoder, DEFAULT_CODEC
+    from .document_profile import DocumentProfile, ensure_profile
+    from .mode_selector import select_mode, DEFAULT_SAMPLE_SIZE, DEFAULT_CONFIDENCE
+    from .rasterizer import (
+        render_pages, count_pages,
+        DEFAULT_WINDOW_SIZE, RASTERIZER_AVAILABLE
+    )
+    from .pdf_source import PDFInput, open_source, open_fitz, pdf_reader
+except ImportError:
+    from page_parallel import run_page_shards
+    from ocr_pool import OCRScheduler
+    from ocr_router import OCRRouter
+    from markdown_writer import MarkdownWriter
+    from tracing import span
+    from checkpoint import PageCheckpoint, first_incomplete_page, truncation_notice
+    from image_encoder import ImageEncoder, DEFAULT_CODEC
+    from document_profile import DocumentProfile, ensure_profile
+    from mode_selector import select_mode, DEFAULT_SAMPLE_SIZE, DEFAULT_CONFIDENCE
+    from rasterizer import (
+        render_pages, count_pages,
+        DEFAULT_WINDOW_SIZE, RASTERIZER_AVAILABLE
+    )
+    from pdf_source import PDFInput, open_source, open_fitz, pdf_reader
+
+
+def _clean_text(text: str) -> str:
+    """Fast text cleaning (module level so shard workers can use it)"""
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    return '\n'.join(lines)
+
+
+def _pypdf2_text_shard(pdf_path: Path, start: int, end: int) -> Dict[int, str]:
+    """
+    Extract text of pages [start, end) with PyPDF2 for smart hybrid mode
+
+    Runs in a worker process with its own PdfReader. Pages without text
+    (or whose extraction fails) are missing from the result.
+    """
+    texts = {}
+    reader = pdf_reader(pdf_path)
+    for page_num in range(start, end):
+        try:
+            page_text = reader.pages[page_num].extract_text()
+            if page_text.strip():
+                texts[page_num] = _clean_text(page_text)
+        except:
+            pass
+    return texts
+
+
+def _guaranteed_hybrid_shard(pdf_path: Path, start: int, end: int,
+                             images_dir: Path, deadline: float, page_count: int,
+                             window_size: int = DEFAULT_WINDOW_SIZE,
+                             backend: str = "auto",
+                             checkpoint: Optional[PageCheckpoint] = None,
+                             codec: str = DEFAULT_CODEC,
+                             quality: Optional[int] = None,
+                             done_pages: FrozenSet[int] = frozenset()) -> Dict[int, Dict[str, Any]]:
+    """
+    Process pages [start, end) for guaranteed hybrid mode
+
+    Runs in a worker process: opens its own PdfReader for text and streams
+    its page range through the rasterizer, window_size pages at a time,
+    while a thread pool encodes the snapshots. A page is complete once its
+    image is written; completed pages are recorded to the checkpoint (if
+    any) right away. Pages in done_pages (already in the checkpoint) are
+    skipped, and only completed pages are in the result.
+    """
+    pages = {page_num: {'text': None, 'image': None}
+             for page_num in range(start, end) if page_num not in done_pages}
+
+    # Step 1: Extract text using PyPDF2
+    if PYPDF2_AVAILABLE:
+        try:
+            reader = pdf_reader(pdf_path)
+
+            for page_num in pages:
+                if time.time() > deadline:
+                    break
+
+                try:
+                    with span("text_extraction", engine="pypdf2", page=page_num + 1):
+                        page_text = reader.pages[page_num].extract_text()
+                    if page_text.strip():
+                        pages[page_num]['text'] = _clean_text(page_text)
+                except:
+                    pass
+        except:
+            pass
+
+    # Step 2: Convert pages to images
+    with ImageEncoder(codec, quality) as encoder:
+        for page_number, image in render_pages(pdf_path, [page_num + 1 for page_num in pages], dpi=150,
+                                               window_size=window_size, backend=backend):
+            if time.time() > deadline:
+                console.print("[red]⏰ Timeout reached during image conversion[/red]")
+                break
+
+            page_num = page_number - 1
+            stem = f"page_{page_num + 1}"
+            pages[page_num]['image'] = encoder.filename(stem)
+            on_done = None
+            if checkpoint is not None:
+                on_done = partial(checkpoint.record, page_num, dict(pages[page_num]))
+            encoder.submit(image, images_dir, stem, on_done=on_done)
+
+            if page_num % 10 == 0:
+                console.print(f"[green]Converted page {page_num + 1}/{page_count}[/green]")
+
+    console.print(f"[cyan]{encoder.format_summary()}[/cyan]")
+    # Pages cut off by the deadline are left to the next run
+    return {page_num: result for page_num, result in pages.items() if result['image']}
+
+
+def _pymupdf_hybrid_shard(pdf_path: Path, start: int, end: int,
+                          images_dir: Path, deadline: float,
+                          max_images: int = 50,
+                          checkpoint: Optional[PageCheckpoint] = None,
+                          done_pages: FrozenSet[int] = frozenset()) -> Dict[int, Dict[str, Any]]:
+    """
+    Process pages [start, end) for PyMuPDF hybrid mode
+
+    Runs in a worker process with its own fitz document. Pages not reached
+    before the deadline, and pages in done_pages (already in the
+    checkpoint), are missing from the result.
+    """
+    pages = {}
+    shard_images = 0
+
+    doc = open_fitz(pdf_path)
+    try:
+        for page_num in range(start, end):
+            if page_num in done_pages:
+                continue
+
+            # Timeout check
+            if time.time() > deadline:
+                break
+
+            if page_num % 10 == 0:
+                console.print(f"[green]Processing page {page_num + 1}/{len(doc)}[/green]")
+
+            page = doc.load_page(page_num)
+            result = {'text': None, 'images': []}
+
+            # Extract text (fast)
+            with span("text_extraction", engine="pymupdf", page=page_num + 1):
+                page_text = page.get_text()
+            if page_text.strip():
+                result['text'] = _clean_text(page_text)
+
+            # The global image limit can only be reached later than the
+            # shard-local one, so stop extracting once this shard hits it.
+            if shard_images < max_images:
+                with span("extract_images", page=page_num + 1):
+                    try:
+                        image_list = page.get_images(full=True)
+                        for img_index, img in enumerate(image_list[:3]):  # Max 3 images per page
+                            try:
+                                xref = img[0]
+                                pix = fitz.Pixmap(doc, xref)
+
+                                if pix.width > 50 and pix.height > 50:  # Skip tiny images
+                                    img_filename = f"page_{page_num + 1}_img_{img_index + 1}.png"
+                                    pix.save(str(images_dir / img_filename))
+                                    result['images'].append(img_filename)
+                                    shard_images += 1
+
+                                pix = None
+                            except:
+                                pass  # Skip problematic images
+                    except:
+                        pass  # Skip if image extraction fails
+
+            pages[page_num] = result
+            if checkpoint is not None:
+                checkpoint.record(page_num, result)
+    finally:
+        doc.close()
+
+    return pages
+
+
 class FastPDFProcessor:
     """
     Fast and reliable PDF processor with timeout protection
@@ -57,10 +248,22 @@ class FastPDFProcessor:
         self.temp_dir = Path(temp_dir)
         self.max_pages_for_image_conversion = 50  # Limit for performance
         self.max_processing_time = 300  # 5 minutes max
+        self.raster_window_size = DEFAULT_WINDOW_SIZE  # Pages held in memory while rasterizing
+        self.raster_backend = "auto"  # Rasterizer backend: auto, pymupdf or pdf2image
+        self.image_codec = DEFAULT_CODEC  # Page snapshot codec (see image_encoder.CODECS)
+        self.image_quality = None  # Quality for jpeg/webp snapshots (None = codec default)
+        self.ocr_workers = None  # Parallel tesseract processes (None = core count)
+        self.checkpointing = False  # Persist finished pages so a rerun resumes (see checkpoint.py)
+        self.auto_sample_size = DEFAULT_SAMPLE_SIZE  # Pages sampled to pick a mode in auto mode
+        self.auto_confidence = DEFAULT_CONFIDENCE  # Confidence the sample must reach before a full scan
     
-    def analyze_pdf_simple(self, pdf_path: Path) -> Dict[str, Any]:
+    def analyze_pdf_simple(self, pdf_path: Path,
+                           profile: Optional[DocumentProfile] = None) -> Dict[str, Any]:
         """
         Quick PDF analysis without deep processing
+        
+        Args:
+            profile: DocumentProfile yang sudah dihitung (dibuat jika None)
         """
         analysis = {
             'total_pages': 0,
@@ -69,15 +272,9 @@ class FastPDFProcessor:
         }
         
         try:
-            analysis['file_size_mb'] = pdf_path.stat().st_size / (1024 * 1024)
-            
-            if PYMUPDF_AVAILABLE:
-                doc = fitz.open(str(pdf_path))
-                analysis['total_pages'] = len(doc)
-                doc.close()
-            elif PYPDF2_AVAILABLE:
-                reader = PdfReader(str(pdf_path))
-                analysis['total_pages'] = len(reader.pages)
+            profile = ensure_profile(pdf_path, profile)
+            analysis['file_size_mb'] = profile.file_size_mb
+            analysis['total_pages'] = profile.total_pages
             
             # Simple recommendation based on file size
             if analysis['file_size_mb'] > 50:
@@ -92,129 +289,142 @@ class FastPDFProcessor:
         
         return analysis
     
-    def convert_hybrid_fast(self, pdf_path: Path, output_md_path: Path) -> Tuple[bool, str]:
+    def convert_hybrid_fast(self, pdf_path: Path, output_md_path: Path, workers: int = 1,
+                            profile: Optional[DocumentProfile] = None) -> Tuple[bool, str]:
         """
         Fast hybrid conversion with guaranteed image extraction
+        
+        Args:
+            workers: Number of page-shard worker processes (0 = all cores)
+            profile: Shared DocumentProfile (computed here if None)
         """
         start_time = time.time()
         
-        try:
-            console.print("[blue]🔄 FAST HYBRID MODE: Text + Images GUARANTEED[/blue]")
-            
-            # Quick analysis
-            analysis = self.analyze_pdf_simple(pdf_path)
-            console.print(f"[cyan]📊 {analysis['total_pages']} pages, {analysis['file_size_mb']:.1f}MB[/cyan]")
-            
-            # For large files, use smarter approach
-            if analysis['file_size_mb'] > 20 or analysis['total_pages'] > 50:
-                console.print("[yellow]⚡ Large file - using smart hybrid approach[/yellow]")
-                return self._smart_hybrid_with_images(pdf_path, output_md_path, start_time)
-            
-            # For smaller files, use guaranteed image extraction
-            else:
-                console.print("[green]📄 Normal size - using guaranteed image extraction[/green]")
-                return self._guaranteed_image_hybrid(pdf_path, output_md_path, start_time)
+        with span("document", processor="fast", mode="hybrid", file=pdf_path.name):
+            try:
+                console.print("[blue]🔄 FAST HYBRID MODE: Text + Images GUARANTEED[/blue]")
                 
-        except Exception as e:
-            return False, f"Fast hybrid conversion failed: {str(e)}"
+                # Quick analysis
+                profile = ensure_profile(pdf_path, profile)
+                analysis = self.analyze_pdf_simple(pdf_path, profile)
+                console.print(f"[cyan]📊 {analysis['total_pages']} pages, {analysis['file_size_mb']:.1f}MB[/cyan]")
+                
+                # For large files, use smarter approach (unless the conversion is
+                # checkpointed: then every page is converted across time slices)
+                if not self.checkpointing and (analysis['file_size_mb'] > 20 or analysis['total_pages'] > 50):
+                    console.print("[yellow]⚡ Large file - using smart hybrid approach[/yellow]")
+                    return self._smart_hybrid_with_images(pdf_path, output_md_path, start_time, workers)
+                
+                # For smaller files, use guaranteed image extraction
+                else:
+                    console.print("[green]📄 Normal size - using guaranteed image extraction[/green]")
+                    return self._guaranteed_image_hybrid(pdf_path, output_md_path, start_time, workers,
+                                                         profile)
+                    
+            except Exception as e:
+                return False, f"Fast hybrid conversion failed: {str(e)}"
     
-    def _guaranteed_image_hybrid(self, pdf_path: Path, output_md_path: Path, start_time: float) -> Tuple[bool, str]:
+    def _guaranteed_image_hybrid(self, pdf_path: Path, output_md_path: Path, start_time: float,
+                                 workers: int = 1,
+                                 profile: Optional[DocumentProfile] = None) -> Tuple[bool, str]:
         """
         Guaranteed image extraction for normal-sized PDFs
         """
         try:
-            if not PDF2IMAGE_AVAILABLE:
-                return False, "pdf2image not available for image extraction"
+            if not RASTERIZER_AVAILABLE:
+                return False, "No rasterizer available for image extraction (need PyMuPDF or pdf2image)"
             
             # Create images directory
             images_dir = output_md_path.parent / f"{output_md_path.stem}_images"
             images_dir.mkdir(exist_ok=True)
             
-            # Step 1: Extract text using PyPDF2
-            page_texts = {}
-            total_text_chars = 0
-            total_pages = 0
+            total_pages = ensure_profile(pdf_path, profile).total_pages
             
-            if PYPDF2_AVAILABLE:
-                try:
-                    reader = PdfReader(str(pdf_path))
-                    total_pages = len(reader.pages)
-                    
-                    for page_num, page in enumerate(reader.pages):
-                        if time.time() - start_time > self.max_processing_time:
-                            break
-                        
-                        try:
-                            page_text = page.extract_text()
-                            if page_text.strip():
-                                page_texts[page_num] = self._clean_text_fast(page_text)
-                                total_text_chars += len(page_texts[page_num])
-                        except:
-                            pass
-                except:
-                    pass
+            # Pages finished by an earlier, time-limited run are not converted again
+            checkpoint = PageCheckpoint(output_md_path, pdf_path, "guaranteed-hybrid") if self.checkpointing else None
+            page_results = checkpoint.load() if checkpoint is not None else {}
+            first_page = first_incomplete_page(page_results, total_pages)
+            if page_results:
+                console.print(f"[cyan]↻ Resuming from page {(first_page or total_pages) + 1}: "
+                              f"{len(page_results)}/{total_pages} pages in checkpoint[/cyan]")
             
-            # Step 2: Convert pages to images
+            # Step 1 + 2: Extract text and convert pages to images (page-sharded)
             console.print("[cyan]🖼️  Converting pages to images...[/cyan]")
             
-            total_images = 0
-            
-            try:
-                # Convert all pages to images
-                images = convert_from_path(str(pdf_path), dpi=150)
-                total_pages = len(images)  # Update page count
-                
-                for page_num, image in enumerate(images):
-                    if time.time() - start_time > self.max_processing_time:
-                        console.print("[red]⏰ Timeout reached during image conversion[/red]")
-                        break
-                    
-                    img_filename = f"page_{page_num + 1}.png"
-                    img_path = images_dir / img_filename
-                    image.save(str(img_path), "PNG", optimize=True)
-                    total_images += 1
-                    
-                    if page_num % 10 == 0:
-                        console.print(f"[green]Converted page {page_num + 1}/{total_pages}[/green]")
+            if first_page is not None:
+                try:
+                    with span("shards", workers=workers, pages=total_pages - len(page_results)):
+                        shard_results = run_page_shards(
+                            _guaranteed_hybrid_shard, pdf_path, total_pages, workers,
+                            first_page=first_page,
+                            images_dir=images_dir,
+                            deadline=start_time + self.max_processing_time,
+                            page_count=total_pages,
+                            window_size=self.raster_window_size,
+                            backend=self.raster_backend,
+                            checkpoint=checkpoint,
+                            codec=self.image_codec,
+                            quality=self.image_quality,
+                            done_pages=frozenset(page_results)
+                        )
+                    # Checkpointed pages are never replaced
+                    for page_num, result in shard_results.items():
+                        page_results.setdefault(page_num, result)
+                except Exception as e:
+                    console.print(f"[red]Image conversion failed: {e}[/red]")
+                    return False, f"Image conversion failed: {e}"
             
-            except Exception as e:
-                console.print(f"[red]Image conversion failed: {e}[/red]")
-                return False, f"Image conversion failed: {e}"
+            page_texts = {page_num: result['text'] for page_num, result in page_results.items() if result['text']}
+            total_text_chars = sum(len(text) for text in page_texts.values())
+            total_images = sum(1 for result in page_results.values() if result['image'])
             
             # Step 3: Generate markdown
-            markdown_content = self._generate_header(pdf_path, "Fast Hybrid Mode - Guaranteed Images")
-            
-            for page_num in range(total_pages):
-                markdown_content += f"\n## Page {page_num + 1}\n\n"
+            with span("write_markdown"), MarkdownWriter(output_md_path) as markdown:
+                markdown.write(self._generate_header(pdf_path, "Fast Hybrid Mode - Guaranteed Images"))
                 
-                # Add text if available and substantial
-                if page_num in page_texts and len(page_texts[page_num]) > 50:
-                    markdown_content += page_texts[page_num] + "\n\n"
+                for page_num in range(total_pages):
+                    markdown.write(f"\n## Page {page_num + 1}\n\n")
+                    
+                    # Add text if available and substantial
+                    if page_num in page_texts and len(page_texts[page_num]) > 50:
+                        markdown.write(page_texts[page_num] + "\n\n")
+                    
+                    # Image exists for every page the time limit did not cut off
+                    if page_num in page_results and page_results[page_num]['image']:
+                        img_filename = page_results[page_num]['image']
+                        relative_img_path = f"{images_dir.name}/{img_filename}"
+                        markdown.write(f"![Page {page_num + 1}]({relative_img_path})\n\n")
+                    else:
+                        markdown.write("*[Page not converted: time limit reached]*\n\n")
+                    
+                    markdown.end_page()
                 
-                # ALWAYS add image (guaranteed to exist)
-                img_filename = f"page_{page_num + 1}.png"
-                relative_img_path = f"{images_dir.name}/{img_filename}"
-                markdown_content += f"![Page {page_num + 1}]({relative_img_path})\n\n"
+                if total_images < total_pages:
+                    markdown.write(truncation_notice(total_images, total_pages, checkpoint is not None))
                 
-                markdown_content += "---\n\n"
-            
-            # Add summary
-            markdown_content += self._generate_summary(total_text_chars, total_images, "guaranteed-hybrid")
-            
-            # Save result
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                # Add summary
+                markdown.write(self._generate_summary(total_text_chars, total_images, "guaranteed-hybrid"))
             
             elapsed = time.time() - start_time
+            if total_images < total_pages:
+                return True, (f"Guaranteed hybrid stopped at the time limit after {elapsed:.1f}s: "
+                              f"{total_images}/{total_pages} pages converted")
+            
+            if checkpoint is not None:
+                checkpoint.remove()
             message = f"Guaranteed hybrid completed in {elapsed:.1f}s: {total_text_chars} chars, {total_images} images"
             return True, message
             
         except Exception as e:
             return False, f"Guaranteed hybrid failed: {str(e)}"
     
-    def _smart_hybrid_with_images(self, pdf_path: Path, output_md_path: Path, start_time: float) -> Tuple[bool, str]:
+    def _smart_hybrid_with_images(self, pdf_path: Path, output_md_path: Path, start_time: float,
+                                  workers: int = 1) -> Tuple[bool, str]:
         """
         Smart hybrid approach for large files
+        
+        Args:
+            workers: Number of text-extraction worker processes (0 = all cores)
         """
         try:
             # Create images directory
@@ -228,19 +438,13 @@ class FastPDFProcessor:
             
             if PYPDF2_AVAILABLE:
                 try:
-                    reader = PdfReader(str(pdf_path))
-                    total_pages = len(reader.pages)
+                    total_pages = len(pdf_reader(pdf_path).pages)
                     
                     console.print(f"[cyan]📄 Extracting text from {total_pages} pages...[/cyan]")
                     
-                    for page_num, page in enumerate(reader.pages):
-                        try:
-                            page_text = page.extract_text()
-                            if page_text.strip():
-                                page_texts[page_num] = self._clean_text_fast(page_text)
-                                total_text_chars += len(page_texts[page_num])
-                        except:
-                            pass
+                    with span("shards", workers=workers, pages=total_pages):
+                        page_texts = run_page_shards(_pypdf2_text_shard, pdf_path, total_pages, workers)
+                    total_text_chars = sum(len(text) for text in page_texts.values())
                 except:
                     pass
             
@@ -270,60 +474,59 @@ class FastPDFProcessor:
             console.print(f"[yellow]Converting {len(sample_pages)} key pages to images...[/yellow]")
             
             total_images = 0
+            image_files = {}  # 1-based page number -> snapshot filename
+            encoder = ImageEncoder(self.image_codec, self.image_quality)
             
-            for page_num in sample_pages:
-                if time.time() - start_time > self.max_processing_time:
-                    break
-                
-                try:
-                    page_images = convert_from_path(
-                        str(pdf_path),
-                        dpi=150,
-                        first_page=page_num,
-                        last_page=page_num
-                    )
+            try:
+                # Render all sampled pages in one pass; snapshots are encoded on a thread pool
+                for page_num, image in render_pages(pdf_path, sample_pages, dpi=150, backend=self.raster_backend):
+                    if time.time() - start_time > self.max_processing_time:
+                        break
                     
-                    if page_images:
-                        img_filename = f"page_{page_num}.png"
-                        img_path = images_dir / img_filename
-                        page_images[0].save(str(img_path), "PNG", optimize=True)
+                    try:
+                        image_files[page_num] = encoder.submit(image, images_dir, f"page_{page_num}")
                         total_images += 1
                         
                         if total_images % 5 == 0:
                             console.print(f"[green]Converted {total_images} images...[/green]")
-                
-                except Exception as e:
-                    console.print(f"[yellow]Failed to convert page {page_num}: {e}[/yellow]")
+                    
+                    except Exception as e:
+                        console.print(f"[yellow]Failed to convert page {page_num}: {e}[/yellow]")
             
-            # Step 3: Generate markdown
-            markdown_content = self._generate_header(pdf_path, "Fast Hybrid Mode - Smart Sampling")
+            except Exception as e:
+                console.print(f"[yellow]Image conversion failed: {e}[/yellow]")
             
-            for page_num in range(total_pages):
-                markdown_content += f"\n## Page {page_num + 1}\n\n"
-                
-                # Add text if available
-                if page_num in page_texts:
-                    markdown_content += page_texts[page_num] + "\n\n"
-                
-                # Add image if available
-                img_filename = f"page_{page_num + 1}.png"
-                img_path = images_dir / img_filename
+            try:
+                encoder.close()
+            except Exception as e:
+                console.print(f"[yellow]Image encoding failed: {e}[/yellow]")
+            console.print(f"[cyan]{encoder.format_summary()}[/cyan]")
+            
+            # Step 3: Generate markdown
+            with MarkdownWriter(output_md_path) as markdown:
+                markdown.write(self._generate_header(pdf_path, "Fast Hybrid Mode - Smart Sampling"))
                 
-                if img_path.exists():
-                    relative_img_path = f"{images_dir.name}/{img_filename}"
-                    markdown_content += f"![Page {page_num + 1}]({relative_img_path})\n\n"
-                elif page_num not in page_texts:
-                    markdown_content += "*[Page appears to be image-based - not sampled]*\n\n"
+                for page_num in range(total_pages):
+                    markdown.write(f"\n## Page {page_num + 1}\n\n")
+                    
+                    # Add text if available
+                    if page_num in page_texts:
+                        markdown.write(page_texts[page_num] + "\n\n")
+                    
+                    # Add image if available
+                    img_filename = image_files.get(page_num + 1)
+                    
+                    if img_filename and (images_dir / img_filename).exists():
+                        relative_img_path = f"{images_dir.name}/{img_filename}"
+                        markdown.write(f"![Page {page_num + 1}]({relative_img_path})\n\n")
+                    elif page_num not in page_texts:
+                        markdown.write("*[Page appears to be image-based - not sampled]*\n\n")
+                    
+                    markdown.end_page()
                 
-                markdown_content += "---\n\n"
-            
-            # Add note about sampling
-            markdown_content += f"\n*Note: {total_images} key pages converted to images for performance.*\n\n"
-            markdown_content += self._generate_summary(total_text_chars, total_images, "smart-hybrid")
-            
-            # Save result
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                # Add note about sampling
+                markdown.write(f"\n*Note: {total_images} key pages converted to images for performance.*\n\n")
+                markdown.write(self._generate_summary(total_text_chars, total_images, "smart-hybrid"))
             
             elapsed = time.time() - start_time
             message = f"Smart hybrid completed in {elapsed:.1f}s: {total_text_chars} chars, {total_images} images"
@@ -332,76 +535,83 @@ class FastPDFProcessor:
         except Exception as e:
             return False, f"Smart hybrid failed: {str(e)}"
     
-    def _hybrid_pymupdf_fast(self, pdf_path: Path, output_md_path: Path, start_time: float) -> Tuple[bool, str]:
+    def _hybrid_pymupdf_fast(self, pdf_path: Path, output_md_path: Path, start_time: float,
+                             workers: int = 1) -> Tuple[bool, str]:
         """
         Fast PyMuPDF-based hybrid conversion
         """
         try:
-            doc = fitz.open(str(pdf_path))
+            doc = open_fitz(pdf_path)
+            total_pages = len(doc)
+            doc.close()
             
             # Create images directory
             images_dir = output_md_path.parent / f"{output_md_path.stem}_images"
             images_dir.mkdir(exist_ok=True)
             
-            markdown_content = self._generate_header(pdf_path, "Fast Hybrid Mode")
-            
-            total_images = 0
-            total_text_chars = 0
+            checkpoint = PageCheckpoint(output_md_path, pdf_path, "fast-hybrid") if self.checkpointing else None
+            page_results = checkpoint.load() if checkpoint is not None else {}
+            first_page = first_incomplete_page(page_results, total_pages)
+            
+            if first_page is not None:
+                with span("shards", workers=workers, pages=total_pages - len(page_results)):
+                    shard_results = run_page_shards(
+                        _pymupdf_hybrid_shard, pdf_path, total_pages, workers,
+                        first_page=first_page,
+                        images_dir=images_dir,
+                        deadline=start_time + self.max_processing_time,
+                        checkpoint=checkpoint,
+                        done_pages=frozenset(page_results)
+                    )
+                # Checkpointed pages are never replaced
+                for page_num, result in shard_results.items():
+                    page_results.setdefault(page_num, result)
             
-            for page_num in range(len(doc)):
-                # Timeout check
-                if time.time() - start_time > self.max_processing_time:
-                    console.print("[red]⏰ Timeout reached, stopping conversion[/red]")
-                    break
+            with span("write_markdown"), MarkdownWriter(output_md_path) as markdown:
+                markdown.write(self._generate_header(pdf_path, "Fast Hybrid Mode"))
                 
-                if page_num % 10 == 0:
-                    console.print(f"[green]Processing page {page_num + 1}/{len(doc)}[/green]")
+                total_images = 0
+                total_text_chars = 0
+                completed_pages = 0
                 
-                page = doc.load_page(page_num)
-                markdown_content += f"\n## Page {page_num + 1}\n\n"
-                
-                # Extract text (fast)
-                page_text = page.get_text()
-                if page_text.strip():
-                    cleaned_text = self._clean_text_fast(page_text)
-                    markdown_content += cleaned_text + "\n\n"
-                    total_text_chars += len(cleaned_text)
-                
-                # Quick image extraction (skip if too many images already)
-                if total_images < 50:  # Limit images for performance
-                    try:
-                        image_list = page.get_images(full=True)
-                        for img_index, img in enumerate(image_list[:3]):  # Max 3 images per page
-                            try:
-                                xref = img[0]
-                                pix = fitz.Pixmap(doc, xref)
-                                
-                                if pix.width > 50 and pix.height > 50:  # Skip tiny images
-                                    img_filename = f"page_{page_num + 1}_img_{img_index + 1}.png"
-                                    img_path = images_dir / img_filename
-                                    pix.save(str(img_path))
-                                    
-                                    relative_img_path = f"{images_dir.name}/{img_filename}"
-                                    markdown_content += f"![Image {total_images + 1}]({relative_img_path})\n\n"
-                                    total_images += 1
-                                
-                                pix = None
-                            except:
-                                pass  # Skip problematic images
-                    except:
-                        pass  # Skip if image extraction fails
+                for page_num in range(total_pages):
+                    # Pages missing from the results were cut off by the timeout
+                    if page_num not in page_results:
+                        console.print("[red]⏰ Timeout reached, stopping conversion[/red]")
+                        markdown.write(truncation_notice(completed_pages, total_pages, checkpoint is not None))
+                        break
+                    completed_pages += 1
+                    
+                    result = page_results[page_num]
+                    markdown.write(f"\n## Page {page_num + 1}\n\n")
+                    
+                    if result['text']:
+                        markdown.write(result['text'] + "\n\n")
+                        total_text_chars += len(result['text'])
+                    
+                    # Quick image extraction (skip if too many images already)
+                    if total_images < 50:  # Limit images for performance
+                        for img_filename in result['images']:
+                            relative_img_path = f"{images_dir.name}/{img_filename}"
+                            markdown.write(f"![Image {total_images + 1}]({relative_img_path})\n\n")
+                            total_images += 1
+                    else:
+                        # Shards cannot see the global limit, drop their surplus files
+                        for img_filename in result['images']:
+                            (images_dir / img_filename).unlink(missing_ok=True)
+                    
+                    markdown.end_page()
                 
-                markdown_content += "---\n\n"
-            
-            doc.close()
-            
-            # Save result
-            markdown_content += self._generate_summary(total_text_chars, total_images, "fast-hybrid")
-            
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                # Add summary
+                markdown.write(self._generate_summary(total_text_chars, total_images, "fast-hybrid"))
             
             elapsed = time.time() - start_time
+            if completed_pages < total_pages:
+                return True, (f"Fast hybrid stopped at the time limit after {elapsed:.1f}s: "
+                              f"{completed_pages}/{total_pages} pages converted")
+            
+            if checkpoint is not None:
+                checkpoint.remove()
             message = f"Fast hybrid completed in {elapsed:.1f}s: {total_text_chars} chars, {total_images} images"
             return True, message
             
@@ -413,105 +623,104 @@ class FastPDFProcessor:
         Fast PyPDF2-based hybrid conversion with image extraction
         """
         try:
-            reader = PdfReader(str(pdf_path))
+            reader = pdf_reader(pdf_path)
             
             # Create images directory
             images_dir = output_md_path.parent / f"{output_md_path.stem}_images"
             images_dir.mkdir(exist_ok=True)
             
-            markdown_content = self._generate_header(pdf_path, "Fast Hybrid Mode - PyPDF2 + Images")
-            total_text_chars = 0
-            total_images = 0
-            
-            # Extract text using PyPDF2
-            page_texts = {}
-            
-            try:
-                for page_num, page in enumerate(reader.pages):
-                    page_text = page.extract_text()
-                    if page_text.strip():
-                        page_texts[page_num] = self._clean_text_fast(page_text)
-                        total_text_chars += len(page_texts[page_num])
-            except Exception as e:
-                console.print(f"[yellow]PyPDF2 text extraction failed: {e}[/yellow]")
-            
-            # Extract images using pdf2image for pages with little/no text
-            if PDF2IMAGE_AVAILABLE:
-                console.print("[blue]Converting pages with little text to images...[/blue]")
+            with MarkdownWriter(output_md_path) as markdown:
+                markdown.write(self._generate_header(pdf_path, "Fast Hybrid Mode - PyPDF2 + Images"))
+                total_text_chars = 0
+                total_images = 0
                 
-                # Identify pages that need image conversion
-                pages_needing_images = []
-                for page_num in range(len(reader.pages)):
-                    if page_num not in page_texts or len(page_texts[page_num]) < 100:
-                        pages_needing_images.append(page_num + 1)  # pdf2image uses 1-based
+                # Extract text using PyPDF2
+                page_texts = {}
                 
-                if pages_needing_images:
-                    # Convert only the pages that need images (more efficient)
-                    try:
-                        # For efficiency, limit to first 20 image pages
-                        limited_pages = pages_needing_images[:20]
+                try:
+                    for page_num, page in enumerate(reader.pages):
+                        with span("text_extraction", engine="pypdf2", page=page_num + 1):
+                            page_text = page.extract_text()
+                        if page_text.strip():
+                            page_texts[page_num] = self._clean_text_fast(page_text)
+                            total_text_chars += len(page_texts[page_num])
+                except Exception as e:
+                    console.print(f"[yellow]PyPDF2 text extraction failed: {e}[/yellow]")
+                
+                # Extract images for pages with little/no text
+                image_files = {}  # 1-based page number -> snapshot filename
+                if RASTERIZER_AVAILABLE:
+                    console.print("[blue]Converting pages with little text to images...[/blue]")
+                    
+                    # Identify pages that need image conversion
+                    pages_needing_images = []
+                    for page_num in range(len(reader.pages)):
+                        if page_num not in page_texts or len(page_texts[page_num]) < 100:
+                            pages_needing_images.append(page_num + 1)  # pdf2image uses 1-based
+                    
+                    if pages_needing_images:
+                        encoder = ImageEncoder(self.image_codec, self.image_quality)
                         
-                        for page_num in limited_pages:
-                            # Timeout check
-                            if time.time() - start_time > self.max_processing_time:
-                                console.print("[red]⏰ Timeout reached during image conversion[/red]")
-                                break
+                        # Convert only the pages that need images (more efficient)
+                        try:
+                            # For efficiency, limit to first 20 image pages
+                            limited_pages = pages_needing_images[:20]
                             
-                            try:
-                                page_images = convert_from_path(
-                                    str(pdf_path),
-                                    dpi=150,  # Reasonable quality vs speed
-                                    first_page=page_num,
-                                    last_page=page_num
-                                )
+                            # Render all selected pages in one pass
+                            for page_num, image in render_pages(pdf_path, limited_pages, dpi=150,  # Reasonable quality vs speed
+                                                                backend=self.raster_backend):
+                                # Timeout check
+                                if time.time() - start_time > self.max_processing_time:
+                                    console.print("[red]⏰ Timeout reached during image conversion[/red]")
+                                    break
                                 
-                                if page_images:
-                                    img_filename = f"page_{page_num}.png"
-                                    img_path = images_dir / img_filename
-                                    page_images[0].save(str(img_path), "PNG", optimize=True)
+                                try:
+                                    image_files[page_num] = encoder.submit(image, images_dir, f"page_{page_num}")
                                     total_images += 1
                                     
                                     console.print(f"[green]Created image for page {page_num}[/green]")
-                                    
-                            except Exception as e:
-                                console.print(f"[yellow]Could not convert page {page_num} to image: {e}[/yellow]")
-                    
-                    except Exception as e:
-                        console.print(f"[yellow]Image conversion failed: {e}[/yellow]")
-            
-            # Generate markdown content
-            for page_num in range(len(reader.pages)):
-                # Timeout check
-                if time.time() - start_time > self.max_processing_time:
-                    console.print("[red]⏰ Timeout reached, stopping conversion[/red]")
-                    break
-                
-                if page_num % 20 == 0:
-                    console.print(f"[green]Processing page {page_num + 1}/{len(reader.pages)}[/green]")
-                
-                markdown_content += f"\n## Page {page_num + 1}\n\n"
+                                        
+                                except Exception as e:
+                                    console.print(f"[yellow]Could not convert page {page_num} to image: {e}[/yellow]")
+                        
+                        except Exception as e:
+                            console.print(f"[yellow]Image conversion failed: {e}[/yellow]")
+                        
+                        try:
+                            encoder.close()
+                        except Exception as e:
+                            console.print(f"[yellow]Image encoding failed: {e}[/yellow]")
+                        console.print(f"[cyan]{encoder.format_summary()}[/cyan]")
                 
-                # Add text if available
-                if page_num in page_texts and len(page_texts[page_num]) > 50:
-                    markdown_content += page_texts[page_num] + "\n\n"
-                else:
-                    # Check if we have an image for this page
-                    img_filename = f"page_{page_num + 1}.png"
-                    img_path = images_dir / img_filename
+                # Generate markdown content
+                for page_num in range(len(reader.pages)):
+                    # Timeout check
+                    if time.time() - start_time > self.max_processing_time:
+                        console.print("[red]⏰ Timeout reached, stopping conversion[/red]")
+                        break
                     
-                    if img_path.exists():
-                        relative_img_path = f"{images_dir.name}/{img_filename}"
-                        markdown_content += f"![Page {page_num + 1}]({relative_img_path})\n\n"
+                    if page_num % 20 == 0:
+                        console.print(f"[green]Processing page {page_num + 1}/{len(reader.pages)}[/green]")
+                    
+                    markdown.write(f"\n## Page {page_num + 1}\n\n")
+                    
+                    # Add text if available
+                    if page_num in page_texts and len(page_texts[page_num]) > 50:
+                        markdown.write(page_texts[page_num] + "\n\n")
                     else:
-                        markdown_content += "*[Page appears to be image-based - image conversion skipped]*\n\n"
+                        # Check if we have an image for this page
+                        img_filename = image_files.get(page_num + 1)
+                        
+                        if img_filename and (images_dir / img_filename).exists():
+                            relative_img_path = f"{images_dir.name}/{img_filename}"
+                            markdown.write(f"![Page {page_num + 1}]({relative_img_path})\n\n")
+                        else:
+                            markdown.write("*[Page appears to be image-based - image conversion skipped]*\n\n")
+                    
+                    markdown.end_page()
                 
-                markdown_content += "---\n\n"
-            
-            # Save result
-            markdown_content += self._generate_summary(total_text_chars, total_images, "fast-hybrid-with-images")
-            
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                # Add summary
+                markdown.write(self._generate_summary(total_text_chars, total_images, "fast-hybrid-with-images"))
             
             elapsed = time.time() - start_time
             message = f"Fast hybrid with images completed in {elapsed:.1f}s: {total_text_chars} chars, {total_images} images"
@@ -520,104 +729,104 @@ class FastPDFProcessor:
         except Exception as e:
             return False, f"PyPDF2 hybrid with images failed: {str(e)}"
     
-    def convert_ocr_fast(self, pdf_path: Path, output_md_path: Path) -> Tuple[bool, str]:
+    def convert_ocr_fast(self, pdf_path: Path, output_md_path: Path,
+                         profile: Optional[DocumentProfile] = None) -> Tuple[bool, str]:
         """
         Fast OCR conversion with smart sampling
+        
+        Args:
+            profile: Shared DocumentProfile (computed here if None)
         """
         start_time = time.time()
         
-        try:
-            console.print("[blue]🔍 FAST OCR MODE: Smart text extraction[/blue]")
-            
-            if not PDF2IMAGE_AVAILABLE:
-                return False, "pdf2image not available for OCR mode"
-            
-            analysis = self.analyze_pdf_simple(pdf_path)
-            
-            # Smart page sampling for large PDFs
-            if analysis['total_pages'] > 20:
-                console.print(f"[yellow]⚡ Large PDF detected, using smart sampling[/yellow]")
-                return self._ocr_smart_sampling(pdf_path, output_md_path, start_time)
-            else:
-                return self._ocr_all_pages(pdf_path, output_md_path, start_time)
+        with span("document", processor="fast", mode="ocr", file=pdf_path.name):
+            try:
+                console.print("[blue]🔍 FAST OCR MODE: Smart text extraction[/blue]")
                 
-        except Exception as e:
-            return False, f"Fast OCR conversion failed: {str(e)}"
+                if not RASTERIZER_AVAILABLE:
+                    return False, "No rasterizer available for OCR mode (need PyMuPDF or pdf2image)"
+                
+                profile = ensure_profile(pdf_path, profile)
+                
+                # Smart page sampling for large PDFs
+                if profile.total_pages > 20 and not self.checkpointing:
+                    console.print(f"[yellow]⚡ Large PDF detected, using smart sampling[/yellow]")
+                    return self._ocr_smart_sampling(pdf_path, output_md_path, start_time, profile)
+                else:
+                    return self._ocr_all_pages(pdf_path, output_md_path, start_time, profile)
+                    
+            except Exception as e:
+                return False, f"Fast OCR conversion failed: {str(e)}"
     
-    def _ocr_smart_sampling(self, pdf_path: Path, output_md_path: Path, start_time: float) -> Tuple[bool, str]:
+    def _ocr_smart_sampling(self, pdf_path: Path, output_md_path: Path, start_time: float,
+                            profile: Optional[DocumentProfile] = None) -> Tuple[bool, str]:
         """
         OCR with smart page sampling for large files
         """
         try:
-            markdown_content = self._generate_header(pdf_path, "Fast OCR Mode - Smart Sampling")
-            
-            # Sample pages intelligently (first 5, middle 5, last 5)
-            analysis = self.analyze_pdf_simple(pdf_path)
-            total_pages = analysis['total_pages']
-            
-            sample_pages = []
-            # First pages
-            sample_pages.extend(range(1, min(6, total_pages + 1)))
-            
-            # Middle pages
-            if total_pages > 10:
-                middle_start = total_pages // 2 - 2
-                middle_end = middle_start + 5
-                sample_pages.extend(range(max(1, middle_start), min(total_pages + 1, middle_end)))
-            
-            # Last pages
-            if total_pages > 5:
-                sample_pages.extend(range(max(1, total_pages - 4), total_pages + 1))
-            
-            # Remove duplicates and sort
-            sample_pages = sorted(list(set(sample_pages)))
-            
-            console.print(f"[cyan]📋 Sampling {len(sample_pages)} pages from {total_pages} total[/cyan]")
-            
-            total_text_chars = 0
-            
-            for page_num in sample_pages:
-                # Timeout check
-                if time.time() - start_time > self.max_processing_time:
-                    break
+            with MarkdownWriter(output_md_path) as markdown:
+                markdown.write(self._generate_header(pdf_path, "Fast OCR Mode - Smart Sampling"))
                 
-                console.print(f"[green]OCR page {page_num}/{total_pages}[/green]")
+                # Sample pages intelligently (first 5, middle 5, last 5)
+                profile = ensure_profile(pdf_path, profile)
+                total_pages = profile.total_pages
                 
-                try:
-                    # Convert single page
-                    page_images = convert_from_path(
-                        str(pdf_path),
-                        dpi=150,  # Lower DPI for speed
-                        first_page=page_num,
-                        last_page=page_num
-                    )
+                sample_pages = []
+                # First pages
+                sample_pages.extend(range(1, min(6, total_pages + 1)))
+                
+                # Middle pages
+                if total_pages > 10:
+                    middle_start = total_pages // 2 - 2
+                    middle_end = middle_start + 5
+                    sample_pages.extend(range(max(1, middle_start), min(total_pages + 1, middle_end)))
+                
+                # Last pages
+                if total_pages > 5:
+                    sample_pages.extend(range(max(1, total_pages - 4), total_pages + 1))
+                
+                # Remove duplicates and sort
+                sample_pages = sorted(list(set(sample_pages)))
+                
+                console.print(f"[cyan]📋 Sampling {len(sample_pages)} pages from {total_pages} total[/cyan]")
+                
+                total_text_chars = 0
+                
+                if OCR_AVAILABLE:
+                    scheduler = OCRScheduler(workers=self.ocr_workers, config='--oem 3 --psm 6')
+                    # Sampled pages without a text layer are rendered in one pass (lower DPI for speed)
+                    router = OCRRouter(scheduler, dpi=150, window_size=self.raster_window_size,
+                                       backend=self.raster_backend)
                     
-                    if page_images and OCR_AVAILABLE:
-                        # Try OCR
-                        try:
-                            page_text = pytesseract.image_to_string(
-                                page_images[0],
-                                config='--oem 3 --psm 6'
-                            )
-                            
-                            if page_text.strip():
-                                markdown_content += f"\n## Page {page_num}\n\n"
-                                cleaned_text = self._clean_text_fast(page_text)
-                                markdown_content += cleaned_text + "\n\n"
-                                total_text_chars += len(cleaned_text)
-                                markdown_content += "---\n\n"
-                        except:
+                    for result in router.route(pdf_path, sample_pages, profile):
+                        page_num = result['page']
+                        
+                        # Timeout check
+                        if time.time() - start_time > self.max_processing_time:
+                            break
+                        
+                        if result['error']:
                             console.print(f"[yellow]OCR failed for page {page_num}[/yellow]")
+                            continue
+                        
+                        if result['source'] == "text-layer":
+                            console.print(f"[green]Page {page_num}/{total_pages}: using text layer[/green]")
+                        else:
+                            console.print(f"[green]OCR page {page_num}/{total_pages} ({result['elapsed']:.1f}s)[/green]")
+                        
+                        if result['text'].strip():
+                            markdown.write(f"\n## Page {page_num}\n\n")
+                            cleaned_text = self._clean_text_fast(result['text'])
+                            markdown.write(cleaned_text + "\n\n")
+                            total_text_chars += len(cleaned_text)
+                            markdown.end_page()
                     
-                except Exception as e:
-                    console.print(f"[yellow]Error processing page {page_num}: {e}[/yellow]")
-            
-            # Add note about sampling
-            markdown_content += f"\n*Note: This is a smart sample of {len(sample_pages)} pages from {total_pages} total pages.*\n\n"
-            markdown_content += self._generate_summary(total_text_chars, 0, "fast-ocr-sampling")
-            
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                    console.print(f"[cyan]{router.format_summary()}[/cyan]")
+                    console.print(f"[cyan]{scheduler.format_summary()}[/cyan]")
+                
+                # Add note about sampling
+                markdown.write(f"\n*Note: This is a smart sample of {len(sample_pages)} pages from {total_pages} total pages.*\n\n")
+                markdown.write(self._generate_summary(total_text_chars, 0, "fast-ocr-sampling"))
             
             elapsed = time.time() - start_time
             message = f"Fast OCR sampling completed in {elapsed:.1f}s: {total_text_chars} characters from {len(sample_pages)} pages"
@@ -626,55 +835,91 @@ class FastPDFProcessor:
         except Exception as e:
             return False, f"OCR sampling failed: {str(e)}"
     
-    def _ocr_all_pages(self, pdf_path: Path, output_md_path: Path, start_time: float) -> Tuple[bool, str]:
+    def _ocr_all_pages(self, pdf_path: Path, output_md_path: Path, start_time: float,
+                       profile: Optional[DocumentProfile] = None) -> Tuple[bool, str]:
         """
         OCR all pages for smaller files
         """
         try:
-            markdown_content = self._generate_header(pdf_path, "Fast OCR Mode - All Pages")
-            
-            # Convert all pages at once (faster than one by one)
-            console.print("[yellow]Converting PDF to images...[/yellow]")
-            images = convert_from_path(str(pdf_path), dpi=200)
-            
-            total_text_chars = 0
-            
-            for page_num, image in enumerate(images):
-                # Timeout check
-                if time.time() - start_time > self.max_processing_time:
-                    break
+            with MarkdownWriter(output_md_path) as markdown:
+                markdown.write(self._generate_header(pdf_path, "Fast OCR Mode - All Pages"))
                 
-                console.print(f"[green]OCR page {page_num + 1}/{len(images)}[/green]")
+                # Pages without a text layer are streamed in bounded windows
+                console.print("[yellow]Checking text layers before OCR...[/yellow]")
+                profile = ensure_profile(pdf_path, profile)
+                total_pages = profile.total_pages or count_pages(pdf_path)
                 
-                try:
-                    if OCR_AVAILABLE:
-                        page_text = pytesseract.image_to_string(
-                            image,
-                            config='--oem 3 --psm 6'
-                        )
+                total_text_chars = 0
+                completed_pages = 0
+                truncated = False
+                checkpoint = None
+                
+                if OCR_AVAILABLE:
+                    # Pages finished by an earlier, time-limited run come from the checkpoint
+                    checkpoint = PageCheckpoint(output_md_path, pdf_path, "ocr-all") if self.checkpointing else None
+                    completed = checkpoint.load() if checkpoint is not None else {}
+                    if completed:
+                        console.print(f"[cyan]↻ Resuming: {len(completed)}/{total_pages} pages in checkpoint[/cyan]")
+                    
+                    scheduler = OCRScheduler(workers=self.ocr_workers, config='--oem 3 --psm 6')
+                    router = OCRRouter(scheduler, dpi=200, window_size=self.raster_window_size,
+                                       backend=self.raster_backend)
+                    pending = [page_num + 1 for page_num in range(total_pages) if page_num not in completed]
+                    results = router.route(pdf_path, pending, profile) if pending else iter(())
+                    
+                    for page_num in range(total_pages):
+                        if page_num in completed:
+                            result = completed[page_num]
+                        else:
+                            # Timeout check
+                            if time.time() - start_time > self.max_processing_time:
+                                truncated = True
+                                break
+                            
+                            result = next(results)
+                            if result['error']:
+                                console.print(f"[yellow]OCR error on page {page_num + 1}: {result['error']}[/yellow]")
+                                markdown.write(f"*[OCR failed for page {page_num + 1}]*\n\n")
+                                markdown.end_page()
+                                continue
+                            
+                            if result['source'] == "text-layer":
+                                console.print(f"[green]Page {page_num + 1}/{total_pages}: using text layer[/green]")
+                            else:
+                                console.print(f"[green]OCR page {page_num + 1}/{total_pages} ({result['elapsed']:.1f}s)[/green]")
+                            
+                            if checkpoint is not None:
+                                checkpoint.record(page_num, {'text': result['text'], 'source': result['source']})
                         
-                        markdown_content += f"\n## Page {page_num + 1}\n\n"
+                        completed_pages += 1
+                        markdown.write(f"\n## Page {page_num + 1}\n\n")
                         
-                        if page_text.strip():
-                            cleaned_text = self._clean_text_fast(page_text)
-                            markdown_content += cleaned_text + "\n\n"
+                        if result['text'].strip():
+                            cleaned_text = self._clean_text_fast(result['text'])
+                            markdown.write(cleaned_text + "\n\n")
                             total_text_chars += len(cleaned_text)
                         else:
-                            markdown_content += "*[No readable text found on this page]*\n\n"
+                            markdown.write("*[No readable text found on this page]*\n\n")
                         
-                        markdown_content += "---\n\n"
+                        markdown.end_page()
                     
-                except Exception as e:
-                    console.print(f"[yellow]OCR error on page {page_num + 1}: {e}[/yellow]")
-                    markdown_content += f"*[OCR failed for page {page_num + 1}]*\n\n---\n\n"
-            
-            markdown_content += self._generate_summary(total_text_chars, 0, "fast-ocr-all")
-            
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                    if truncated:
+                        console.print("[red]⏰ Timeout reached, stopping OCR[/red]")
+                        markdown.write(truncation_notice(completed_pages, total_pages, checkpoint is not None))
+                    
+                    console.print(f"[cyan]{router.format_summary()}[/cyan]")
+                    console.print(f"[cyan]{scheduler.format_summary()}[/cyan]")
+                
+                markdown.write(self._generate_summary(total_text_chars, 0, "fast-ocr-all"))
             
             elapsed = time.time() - start_time
-            message = f"Fast OCR completed in {elapsed:.1f}s: {total_text_chars} characters from {len(images)} pages"
+            if truncated:
+                return True, (f"Fast OCR stopped at the time limit after {elapsed:.1f}s: "
+                              f"{completed_pages}/{total_pages} pages converted")
+            
+            if checkpoint is not None:
+                checkpoint.remove()
+            message = f"Fast OCR completed in {elapsed:.1f}s: {total_text_chars} characters from {total_pages} pages"
             return True, message
             
         except Exception as e:
@@ -682,8 +927,7 @@ class FastPDFProcessor:
     
     def _clean_text_fast(self, text: str) -> str:
         """Fast text cleaning"""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        return '\n'.join(lines)
+        return _clean_text(text)
     
     def _generate_header(self, pdf_path: Path, mode_description: str) -> str:
         """Generate markdown header"""
@@ -713,30 +957,52 @@ class FastPDFProcessor:
 ---
 """
     
-    def convert_pdf_fast(self, pdf_path: Path, mode: str = "auto") -> Tuple[bool, str, Path]:
+    def convert_pdf_fast(self, pdf_path: PDFInput, mode: str = "auto", workers: int = 1,
+                         profile: Optional[DocumentProfile] = None) -> Tuple[bool, str, Path]:
         """
         Main fast conversion method
-        """
-        # Determine output path
-        if mode == "hybrid":
-            output_md_path = self.output_dir / f"{pdf_path.stem}_hybrid.md"
-        elif mode == "ocr":
-            output_md_path = self.output_dir / f"{pdf_path.stem}_ocr.md"
-        else:
-            output_md_path = self.output_dir / f"{pdf_path.stem}.md"
         
-        # Quick analysis for auto mode
-        if mode == "auto":
-            analysis = self.analyze_pdf_simple(pdf_path)
-            mode = analysis['recommended_mode']
-            console.print(f"[green]🎯 Auto-selected mode: {mode}[/green]")
-        
-        # Process based on mode
-        if mode == "hybrid":
-            success, message = self.convert_hybrid_fast(pdf_path, output_md_path)
-        elif mode == "ocr":
-            success, message = self.convert_ocr_fast(pdf_path, output_md_path)
-        else:
-            return False, f"Unknown mode: {mode}", output_md_path
+        Args:
+            pdf_path: Path to PDF file, PDFSource, or PDF bytes/file object
+                (opened once, memory-mapped, shared by every reader and the rasterizer)
+            mode: "auto", "hybrid", "ocr"
+            workers: Number of page-shard worker processes for hybrid mode
+                (1 = serial, 0 = all cores)
+            profile: DocumentProfile dari caller; dihitung sekali di sini jika
+                None dan dipakai ulang oleh analisis dan mode yang dipilih
+            
+        Returns:
+            (success, message, output_path)
+        """
+        with open_source(pdf_path) as source:
+            # Determine output path
+            if mode == "hybrid":
+                output_md_path = self.output_dir / f"{source.stem}_hybrid.md"
+            elif mode == "ocr":
+                output_md_path = self.output_dir / f"{source.stem}_ocr.md"
+            else:
+                output_md_path = self.output_dir / f"{source.stem}.md"
+            
+            # One scan of the document, shared by the analysis and the chosen mode
+            profile = ensure_profile(source, profile)
+            
+            # Auto mode: classify a stratified sample of pages, all pages only if it is ambiguous
+            if mode == "auto":
+                selection = select_mode(profile, self.auto_sample_size, self.auto_confidence)
+                mode = selection['recommended_mode']
+                low, high = selection['interval']
+                console.print(f"[cyan]📋 {selection['method'].capitalize()}: {selection['sampled_pages']}/"
+                              f"{selection['total_pages']} pages classified, text pages "
+                              f"{selection['text_ratio']:.0%} ({low:.0%}-{high:.0%} at "
+                              f"{selection['confidence']:.0%} confidence)[/cyan]")
+                console.print(f"[green]🎯 Auto-selected mode: {mode}[/green]")
+            
+            # Process based on mode
+            if mode == "hybrid":
+                success, message = self.convert_hybrid_fast(source, output_md_path, workers, profile)
+            elif mode == "ocr":
+                success, message = self.convert_ocr_fast(source, output_md_path, profile)
+            else:
+                return False, f"Unknown mode: {mode}", output_md_path
         
         return success, message, output_md_path
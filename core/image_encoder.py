@@ -0,0 +1,184 @@
+"""
+Parallel Image Encoder
+======================
+
+Menyimpan snapshot halaman (PIL Image hasil rasterizer) di thread pool.
+Encoder PNG (zlib), JPEG dan WebP di Pillow melepas GIL, jadi beberapa
+halaman bisa di-encode bersamaan sementara thread utama lanjut me-render
+halaman berikutnya. Codec dan quality bisa dipilih per deployment untuk
+menukar ukuran output dengan throughput; waktu encode, total byte output
+dan rata-rata byte per gambar dilaporkan di summary() sehingga run dengan
+codec berbeda bisa dibandingkan.
+
+Contoh:
+    with ImageEncoder(codec='jpeg', quality=85) as encoder:
+        for page_number, image in render_pages(pdf_path, pages):
+            filename = encoder.submit(image, images_dir, f"page_{page_number}")
+            markdown.write(f"![Page {page_number}]({images_dir.name}/{filename})")
+    print(encoder.format_summary())
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from .tracing import span, tracer
+except ImportError:
+    from tracing import span, tracer
+
+# codec -> (Pillow format, file suffix, save options, uses quality)
+CODECS: Dict[str, tuple] = {
+    'png': ('PNG', '.png', {'compress_level': 6}, False),
+    'png-fast': ('PNG', '.png', {'compress_level': 1}, False),
+    'png-optimized': ('PNG', '.png', {'optimize': True}, False),
+    'jpeg': ('JPEG', '.jpg', {'optimize': False}, True),
+    'webp': ('WEBP', '.webp', {'method': 4}, True),
+    'webp-lossless': ('WEBP', '.webp', {'lossless': True, 'method': 4}, False),  # line art
+}
+CODEC_CHOICES = tuple(CODECS)
+
+# Previous behaviour: optimized PNG for every page snapshot
+DEFAULT_CODEC = 'png-optimized'
+DEFAULT_QUALITY = 85
+
+
+def default_encode_workers() -> int:
+    """Satu thread per core, maksimal 4 (shard page-parallel juga punya encoder sendiri)"""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+class ImageEncoder:
+    """
+    Bounded thread pool yang menyimpan PIL Image dengan codec tertentu
+
+    submit() langsung mengembalikan nama file; file-nya dijamin ada setelah
+    close() (atau keluar dari blok with). Error encode dilempar ulang saat
+    close() supaya tidak hilang diam-diam.
+    """
+
+    def __init__(self, codec: str = DEFAULT_CODEC, quality: Optional[int] = None,
+                 workers: Optional[int] = None):
+        """
+        Args:
+            codec: Salah satu CODEC_CHOICES
+            quality: Quality 1-100 untuk jpeg/webp (default 85)
+            workers: Thread encoder (default: core count, maksimal 4)
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Unknown image codec '{codec}' (choose from {', '.join(CODEC_CHOICES)})")
+
+        self.codec = codec
+        self.format, self.suffix, options, uses_quality = CODECS[codec]
+        self.options = dict(options)
+        if uses_quality:
+            self.options['quality'] = quality or DEFAULT_QUALITY
+
+        self.workers = workers if workers and workers > 0 else default_encode_workers()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = deque()
+        self._lock = threading.Lock()
+
+        self.images = 0
+        self.encode_time = 0.0  # seconds spent encoding, summed over threads
+        self.bytes_out = 0
+
+    def __enter__(self) -> "ImageEncoder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(raise_errors=exc_type is None)
+
+    def filename(self, stem: str) -> str:
+        """Nama file untuk stem dengan suffix codec ini"""
+        return stem + self.suffix
+
+    def submit(self, image: Any, directory: Path, stem: str,
+               on_done: Optional[Callable[[], None]] = None) -> str:
+        """
+        Antrikan image untuk disimpan sebagai directory/<stem><suffix>
+
+        Jumlah image yang menunggu dibatasi 2x jumlah worker, sehingga memory
+        tetap terbatas walaupun rasterizer lebih cepat dari encoder.
+        on_done dipanggil (di worker thread) setelah file selesai ditulis.
+
+        Returns:
+            Nama file (tanpa directory)
+        """
+        filename = self.filename(stem)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        while len(self._pending) >= self.workers * 2:
+            self._pending.popleft().result()
+
+        # Worker threads have no span stack; attach their spans to the caller's
+        parent_span = tracer.current_span_id()
+        self._pending.append(self._executor.submit(self._encode, image, Path(directory) / filename,
+                                                   parent_span, on_done))
+        return filename
+
+    def save(self, image: Any, directory: Path, stem: str) -> str:
+        """Encode langsung di thread ini (untuk satu gambar di luar batch)"""
+        filename = self.filename(stem)
+        self._encode(image, Path(directory) / filename, tracer.current_span_id())
+        return filename
+
+    def _encode(self, image: Any, path: Path, parent_span: Optional[int],
+                on_done: Optional[Callable[[], None]] = None) -> None:
+        if self.format == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+
+        start_time = time.perf_counter()
+        with span("encode_image", parent=parent_span, codec=self.codec) as encode_span:
+            image.save(str(path), self.format, **self.options)
+            size = path.stat().st_size
+            encode_span.set(bytes=size)
+        elapsed = time.perf_counter() - start_time
+
+        with self._lock:
+            self.images += 1
+            self.encode_time += elapsed
+            self.bytes_out += size
+
+        if on_done is not None:
+            on_done()
+
+    def close(self, raise_errors: bool = True) -> None:
+        """Tunggu semua encode selesai; lempar error encode pertama (jika ada)"""
+        first_error = None
+        while self._pending:
+            try:
+                self._pending.popleft().result()
+            except Exception as e:
+                first_error = first_error or e
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if first_error is not None and raise_errors:
+            raise first_error
+
+    def summary(self) -> Dict[str, Any]:
+        """Ringkasan encode: jumlah gambar, waktu encode, byte output total dan per gambar"""
+        return {
+            'codec': self.codec,
+            'images': self.images,
+            'workers': self.workers,
+            'encode_time': self.encode_time,
+            'bytes_out': self.bytes_out,
+            'bytes_per_image': self.bytes_out / self.images if self.images else 0.0,
+        }
+
+    def format_summary(self) -> str:
+        """Ringkasan dalam satu baris untuk console"""
+        stats = self.summary()
+        if not stats['images']:
+            return f"Images: none encoded ({stats['codec']})"
+
+        return (f"Images: {stats['images']} as {stats['codec']} on {stats['workers']} threads, "
+                f"{stats['encode_time']:.2f}s encoding, {stats['bytes_out'] / 1024 / 1024:.1f}MB written "
+                f"({stats['bytes_per_image'] / 1024:.0f}KB per image)")
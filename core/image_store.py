@@ -0,0 +1,163 @@
+"""
+Deduplicated Embedded-Image Store
+=================================
+
+Gambar yang sama sering muncul di banyak halaman (logo, header, watermark).
+ImageStore memastikan setiap gambar unik di-decode dan ditulis sekali saja:
+xref yang sudah pernah dilihat langsung memakai file yang ada, dan xref
+berbeda dengan stream yang identik (hash isi stream mentah, tanpa decode)
+juga diarahkan ke file yang sama. Halaman berikutnya cukup mereferensikan
+nama file yang sudah ditulis.
+
+Foto yang di PDF sudah tersimpan sebagai JPEG (DCTDecode, gray/RGB, tanpa
+alpha) ditulis apa adanya sebagai .jpg (passthrough) alih-alih di-decode
+lalu di-encode ulang menjadi PNG yang jauh lebih besar. CMYK, alpha/SMask,
+JPX dan encoding lain tetap lewat Pixmap -> PNG (CMYK dikonversi ke RGB).
+"""
+
+import hashlib
+from collections import namedtuple
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+
+# Lightweight stand-in for a Pixmap when the encoded stream is written directly;
+# accept() filters only use these attributes
+ImageInfo = namedtuple('ImageInfo', ['width', 'height', 'n', 'alpha'])
+
+
+def _passthrough_jpeg(doc, xref: int) -> Optional[Dict]:
+    """
+    Hasil doc.extract_image() jika stream bisa ditulis langsung sebagai .jpg
+
+    Hanya DCTDecode gray/RGB tanpa SMask dan tanpa /Decode (inversi warna);
+    selain itu None supaya gambar dikonversi lewat Pixmap.
+    """
+    try:
+        if "/DCTDecode" not in doc.xref_get_key(xref, "Filter")[1]:
+            return None
+        if doc.xref_get_key(xref, "Decode")[0] != 'null':
+            return None
+        info = doc.extract_image(xref)
+    except Exception:
+        return None
+    if not info or info.get('ext') != 'jpeg' or info.get('smask'):
+        return None
+    if info.get('colorspace') not in (1, 3):
+        return None
+    return info
+
+
+def _stream_digest(doc, xref: int) -> Optional[str]:
+    """Hash stream gambar mentah (masih terkompresi) atau None jika tidak terbaca"""
+    try:
+        raw = doc.xref_stream_raw(xref)
+    except Exception:
+        return None
+    if not raw:
+        return None
+    # Same bytes with a different soft mask are different images
+    smask = doc.xref_get_key(xref, "SMask")
+    return hashlib.sha256(raw + repr(smask).encode('ascii')).hexdigest()
+
+
+class ImageStore:
+    """
+    Tulis gambar embedded ke images_dir sekali per gambar unik
+
+    Contoh:
+        store = ImageStore(images_dir)
+        for img_index, img in enumerate(page.get_images(full=True)):
+            filename = store.extract(doc, img[0], f"page_{n}_img_{img_index + 1}.png",
+                                     accept=lambda pix: pix.n - pix.alpha < 4)
+            if filename:
+                markdown.write(f"![Image]({images_dir.name}/{filename})")
+
+    Satu store berlaku untuk satu dokumen (xref hanya unik di dalam dokumen).
+    """
+
+    def __init__(self, images_dir: Path, passthrough: bool = True):
+        """
+        Args:
+            images_dir: Folder tujuan file gambar
+            passthrough: Tulis JPEG yang sudah web-friendly tanpa re-encode
+                (nama file memakai .jpg); False = selalu PNG lewat Pixmap
+        """
+        self.images_dir = Path(images_dir)
+        self.passthrough = passthrough
+        self._by_xref: Dict[int, Optional[str]] = {}    # xref -> filename (None = rejected)
+        self._by_digest: Dict[str, Optional[str]] = {}  # stream digest -> filename
+        self.written = 0            # images saved (passthrough or re-encoded)
+        self.passthrough_count = 0  # images written from their original stream
+        self.reused = 0             # references served from an existing file
+
+    def extract(self, doc, xref: int, filename: str,
+                accept: Optional[Callable[..., bool]] = None) -> Optional[str]:
+        """
+        Kembalikan nama file untuk gambar xref, menulisnya hanya jika belum ada
+
+        Args:
+            doc: Dokumen fitz yang sedang dibuka
+            xref: xref gambar (elemen pertama dari page.get_images())
+            filename: Nama file yang dipakai jika gambar ini baru (suffix
+                diganti .jpg untuk passthrough)
+            accept: Filter opsional atas Pixmap atau ImageInfo (width, height,
+                n, alpha); gambar yang ditolak juga diingat supaya tidak
+                di-decode ulang
+
+        Returns:
+            Nama file (relatif ke images_dir) atau None jika gambar ditolak
+        """
+        if xref in self._by_xref:
+            return self._reuse(self._by_xref[xref])
+
+        digest = _stream_digest(doc, xref)
+        if digest is not None and digest in self._by_digest:
+            self._by_xref[xref] = self._by_digest[digest]
+            return self._reuse(self._by_digest[digest])
+
+        jpeg = _passthrough_jpeg(doc, xref) if self.passthrough else None
+        if jpeg is not None:
+            stored = self._write_passthrough(jpeg, filename, accept)
+        else:
+            pix = fitz.Pixmap(doc, xref)
+            try:
+                # The filter sees the image as stored (callers may reject CMYK)
+                if accept is not None and not accept(pix):
+                    stored = None
+                else:
+                    if pix.n - pix.alpha >= 4:
+                        # PNG cannot hold CMYK
+                        pix = fitz.Pixmap(fitz.csRGB, pix)
+                    pix.save(str(self.images_dir / filename))
+                    self.written += 1
+                    stored = filename
+            finally:
+                pix = None
+
+        self._by_xref[xref] = stored
+        if digest is not None:
+            self._by_digest[digest] = stored
+        return stored
+
+    def _write_passthrough(self, jpeg: Dict, filename: str,
+                           accept: Optional[Callable[..., bool]]) -> Optional[str]:
+        info = ImageInfo(jpeg['width'], jpeg['height'], jpeg['colorspace'], 0)
+        if accept is not None and not accept(info):
+            return None
+        stored = Path(filename).with_suffix('.jpg').name
+        (self.images_dir / stored).write_bytes(jpeg['image'])
+        self.written += 1
+        self.passthrough_count += 1
+        return stored
+
+    def _reuse(self, filename: Optional[str]) -> Optional[str]:
+        if filename is not None:
+            self.reused += 1
+        return filename
@@ -0,0 +1,67 @@
+"""
+Streaming Markdown Writer
+=========================
+
+Menulis output Markdown langsung ke file secara bertahap. Processor tidak
+lagi menyusun seluruh dokumen sebagai satu string (yang berarti copy
+berulang dan satu salinan penuh di memory); setiap bagian halaman ditulis
+ke file handle ber-buffer dan di-flush per halaman sehingga hasil parsial
+sudah terlihat selama konversi panjang berjalan.
+"""
+
+from pathlib import Path
+
+# Separator written between page sections
+PAGE_SEPARATOR = "---\n\n"
+
+# Write buffer size; a page section is normally flushed well before this fills
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class MarkdownWriter:
+    """
+    Incremental Markdown emitter yang menulis ke file ber-buffer
+
+    Contoh:
+        with MarkdownWriter(output_md_path) as markdown:
+            markdown.write(header)
+            for page in pages:
+                markdown.write(page_text)
+                markdown.end_page()
+    """
+
+    def __init__(self, output_path: Path, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.output_path = Path(output_path)
+        self.chars_written = 0
+        self.pages_written = 0
+        self._file = open(self.output_path, 'w', encoding='utf-8', buffering=buffer_size)
+
+    def write(self, text: str) -> None:
+        """Tulis potongan Markdown (tetap di buffer sampai flush/penuh)"""
+        self._file.write(text)
+        self.chars_written += len(text)
+
+    def end_page(self, separator: str = PAGE_SEPARATOR) -> None:
+        """Tutup satu bagian halaman dan flush ke disk"""
+        self.write(separator)
+        self.pages_written += 1
+        self._file.flush()
+
+    def flush(self) -> None:
+        """Flush buffer ke disk"""
+        self._file.flush()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def close(self) -> None:
+        """Flush dan tutup file"""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "MarkdownWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
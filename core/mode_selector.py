@@ -0,0 +1,145 @@
+"""
+Auto Mode Selection by Page Sampling
+====================================
+
+Memilih mode hybrid/OCR untuk dokumen besar dari sampel halaman, bukan dari
+scan semua halaman. Dokumen dibagi menjadi strata halaman yang berurutan dan
+satu halaman acak diambil dari setiap stratum (bab scan di tengah arsip
+tetap terwakili). Dari label sampel (page_classifier) dihitung interval
+Wilson untuk proporsi halaman teks pada confidence yang diminta, dengan
+koreksi populasi terbatas. Jika seluruh interval berada di satu sisi batas
+OCR_TEXT_RATIO keputusan diambil dari sampel; jika interval melewati batas
+(sampel ambigu) semua halaman diklasifikasikan.
+
+Contoh:
+    profile = DocumentProfile.from_pdf(pdf_path)
+    selection = select_mode(profile, sample_size=48, confidence=0.95)
+    mode = selection['recommended_mode']   # 'hybrid' atau 'ocr'
+"""
+
+import math
+import random
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .tracing import span
+    from .page_classifier import PAGE_TEXT, PAGE_MIXED
+except ImportError:
+    from tracing import span
+    from page_classifier import PAGE_TEXT, PAGE_MIXED
+
+DEFAULT_SAMPLE_SIZE = 48
+DEFAULT_CONFIDENCE = 0.95
+# Same rule as AdvancedPDFProcessor.analyze_pdf_content: OCR when fewer than
+# 30% of the pages carry visible text
+OCR_TEXT_RATIO = 0.3
+
+
+def stratified_sample(total_pages: int, sample_size: int, seed: Optional[int] = None) -> List[int]:
+    """
+    Satu halaman acak (1-based) dari setiap stratum halaman berurutan
+
+    Args:
+        total_pages: Jumlah halaman dokumen
+        sample_size: Jumlah strata (dan halaman sampel)
+        seed: Seed random supaya dokumen yang sama memakai sampel yang sama
+    """
+    if sample_size >= total_pages:
+        return list(range(1, total_pages + 1))
+
+    rng = random.Random(seed)
+    pages = []
+    for stratum in range(sample_size):
+        start = stratum * total_pages // sample_size
+        end = (stratum + 1) * total_pages // sample_size
+        pages.append(rng.randrange(start, end) + 1)
+    return pages
+
+
+def wilson_interval(successes: int, n: int, confidence: float,
+                    population: Optional[int] = None) -> Tuple[float, float]:
+    """
+    Interval Wilson untuk proporsi successes/n
+
+    Dengan population, ukuran sampel efektif dikoreksi untuk sampling tanpa
+    pengembalian (sampel seluruh populasi memberi interval selebar nol).
+    """
+    if n <= 0:
+        return 0.0, 1.0
+    p = successes / n
+    if population is not None:
+        if n >= population:
+            return p, p
+        n = n * (population - 1) / (population - n)
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def _text_share(profile, page_numbers: List[int]) -> int:
+    profile.classify(page_numbers)
+    return sum(1 for page_num in page_numbers if profile.page(page_num).label in (PAGE_TEXT, PAGE_MIXED))
+
+
+def select_mode(profile, sample_size: int = DEFAULT_SAMPLE_SIZE,
+                confidence: float = DEFAULT_CONFIDENCE, seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Pilih mode hybrid/OCR dari sampel halaman bertingkat
+
+    Args:
+        profile: DocumentProfile dokumen (halaman sampel diklasifikasikan di sini)
+        sample_size: Jumlah halaman sampel
+        confidence: Confidence interval proporsi halaman teks (0-1)
+        seed: Seed sampel; default ukuran file sehingga hasilnya reprodusibel
+
+    Returns:
+        Dict dengan 'recommended_mode', 'text_ratio' (perkiraan), 'interval',
+        'confidence', 'sampled_pages', 'total_pages' dan 'method'
+        ("sample", "full" untuk dokumen kecil, atau "escalated" jika sampel ambigu)
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+    if sample_size < 1:
+        raise ValueError(f"sample_size must be positive, got {sample_size}")
+
+    total_pages = profile.total_pages
+    selection = {
+        'recommended_mode': 'hybrid',
+        'text_ratio': 0.0,
+        'interval': (0.0, 1.0),
+        'confidence': confidence,
+        'sampled_pages': 0,
+        'total_pages': total_pages,
+        'method': "full",
+    }
+    if not total_pages:
+        return selection
+
+    with span("mode_selection", pages=total_pages, sample_size=sample_size) as selection_span:
+        pages = stratified_sample(total_pages, sample_size,
+                                  profile.size_bytes if seed is None else seed)
+        text_pages = _text_share(profile, pages)
+        low, high = wilson_interval(text_pages, len(pages), confidence, population=total_pages)
+
+        if len(pages) < total_pages:
+            selection['method'] = "sample"
+            if low < OCR_TEXT_RATIO <= high:
+                # Sample cannot tell which side of the threshold the document is on
+                pages = list(range(1, total_pages + 1))
+                text_pages = _text_share(profile, pages)
+                low = high = text_pages / total_pages
+                selection['method'] = "escalated"
+
+        selection.update({
+            'recommended_mode': 'ocr' if high < OCR_TEXT_RATIO else 'hybrid',
+            'text_ratio': text_pages / len(pages),
+            'interval': (low, high),
+            'sampled_pages': len(pages),
+        })
+        selection_span.set(method=selection['method'], sampled=len(pages),
+                           mode=selection['recommended_mode'])
+    return selection
@@ -0,0 +1,180 @@
+"""
+Parallel OCR Scheduler
+======================
+
+Menjalankan Tesseract untuk banyak halaman sekaligus. Setiap panggilan
+pytesseract menjalankan proses tesseract sendiri, jadi thread pool cukup
+untuk memakai semua core (thread hanya menunggu subprocess). Hasil
+dikembalikan sesuai urutan halaman beserta latency per halaman.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Import libraries dengan fallback
+try:
+    import pytesseract
+    OCR_AVAILABLE = True
+except ImportError:
+    OCR_AVAILABLE = False
+
+try:
+    from .tracing import span, tracer
+except ImportError:
+    from tracing import span, tracer
+
+
+def default_ocr_workers() -> int:
+    """
+    Jumlah worker default: satu per core, dibagi OMP_THREAD_LIMIT
+
+    Tesseract memakai OpenMP; jika setiap proses boleh memakai N thread,
+    menjalankan lebih dari core/N proses hanya membuat oversubscription.
+    """
+    cpu_count = os.cpu_count() or 1
+
+    try:
+        threads_per_job = int(os.environ.get('OMP_THREAD_LIMIT', '1'))
+    except ValueError:
+        threads_per_job = 1
+
+    return max(1, cpu_count // max(1, threads_per_job))
+
+
+# Schedulers currently holding the OMP_THREAD_LIMIT override (see _single_thread_tesseract)
+_omp_lock = threading.Lock()
+_omp_users = 0
+
+
+@contextmanager
+def _single_thread_tesseract() -> Iterator[None]:
+    """
+    OMP_THREAD_LIMIT=1 untuk proses tesseract selama pool berjalan
+
+    pytesseract mewariskan environment proses ke setiap subprocess, jadi
+    limit di-set di os.environ dan dihapus lagi saat scheduler terakhir
+    selesai. Nilai yang di-set user tidak pernah diubah.
+    """
+    global _omp_users
+    with _omp_lock:
+        if _omp_users == 0 and 'OMP_THREAD_LIMIT' in os.environ:
+            owned = False
+        else:
+            owned = True
+            _omp_users += 1
+            os.environ['OMP_THREAD_LIMIT'] = '1'
+    try:
+        yield
+    finally:
+        if owned:
+            with _omp_lock:
+                _omp_users -= 1
+                if _omp_users == 0:
+                    os.environ.pop('OMP_THREAD_LIMIT', None)
+
+
+class OCRScheduler:
+    """
+    Bounded OCR worker pool dengan hasil berurutan per halaman
+    """
+
+    def __init__(self, workers: Optional[int] = None, lang: Optional[str] = None,
+                 config: str = ''):
+        self.workers = workers if workers and workers > 0 else default_ocr_workers()
+        self.lang = lang
+        self.config = config
+        self.page_latencies: List[Tuple[int, float]] = []
+
+    def _ocr_page(self, page_num: int, image: Any, parent_span: Optional[int] = None) -> Dict[str, Any]:
+        """OCR satu halaman (dijalankan di worker thread)"""
+        result = {'page': page_num, 'text': None, 'elapsed': 0.0, 'error': None}
+
+        if image is None:
+            # Caller already has text for this page, keep its slot in the order
+            return result
+
+        start_time = time.time()
+        with span("ocr", parent=parent_span, page=page_num) as ocr_span:
+            try:
+                result['text'] = pytesseract.image_to_string(image, lang=self.lang, config=self.config)
+            except Exception as e:
+                result['error'] = str(e)
+                ocr_span.set(error=result['error'])
+        result['elapsed'] = time.time() - start_time
+
+        return result
+
+    def map(self, pages: Iterable[Tuple[int, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        OCR setiap (page_num, image) dan yield hasil sesuai urutan input
+
+        Image None dilewati tanpa OCR. Jumlah halaman yang sedang diproses
+        dibatasi 2x jumlah worker sehingga stream rasterizer tidak dibaca
+        habis ke memory.
+
+        Yields:
+            Dict dengan 'page', 'text', 'elapsed' (detik) dan 'error'
+        """
+        max_pending = self.workers * 2
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        # Worker threads have no span stack; attach their spans to the caller's
+        parent_span = tracer.current_span_id()
+        # One OpenMP thread per tesseract process; the pool provides the parallelism
+        omp_limit = _single_thread_tesseract() if self.workers > 1 else nullcontext()
+
+        with omp_limit:
+            try:
+                for page_num, image in pages:
+                    pending.append(executor.submit(self._ocr_page, page_num, image, parent_span))
+                    image = None
+
+                    if len(pending) >= max_pending:
+                        yield self._collect(pending.popleft())
+
+                while pending:
+                    yield self._collect(pending.popleft())
+            finally:
+                # Consumer may stop early (timeout); drop work that has not started
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True)
+
+    def _collect(self, future) -> Dict[str, Any]:
+        """Ambil hasil dari future dan catat latency-nya"""
+        result = future.result()
+        if result['text'] is not None or result['error']:
+            self.page_latencies.append((result['page'], result['elapsed']))
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """Ringkasan latency OCR untuk halaman yang sudah diproses"""
+        latencies = [elapsed for _, elapsed in self.page_latencies]
+        if not latencies:
+            return {'pages': 0, 'workers': self.workers, 'total_time': 0.0,
+                    'avg_time': 0.0, 'max_time': 0.0, 'slowest_page': None}
+
+        slowest_page, max_time = max(self.page_latencies, key=lambda item: item[1])
+        return {
+            'pages': len(latencies),
+            'workers': self.workers,
+            'total_time': sum(latencies),
+            'avg_time': sum(latencies) / len(latencies),
+            'max_time': max_time,
+            'slowest_page': slowest_page
+        }
+
+    def format_summary(self) -> str:
+        """Ringkasan latency dalam satu baris untuk console"""
+        stats = self.summary()
+        if not stats['pages']:
+            return f"OCR: no pages processed ({stats['workers']} workers)"
+
+        return (f"OCR: {stats['pages']} pages on {stats['workers']} workers, "
+                f"avg {stats['avg_time']:.2f}s/page, "
+                f"slowest page {stats['slowest_page']} ({stats['max_time']:.2f}s)")
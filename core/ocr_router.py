@@ -0,0 +1,179 @@
+"""
+OCR Router
+==========
+
+Memilih sumber teks per halaman sebelum OCR dijalankan. Text layer setiap
+halaman dibaca dari satu dokumen yang dibuka sekali; hanya halaman yang
+tidak punya text layer yang cukup yang di-render dan dikirim ke
+tesseract. PDF yang sebagian besar digital dengan beberapa halaman scan
+tidak lagi membayar biaya OCR penuh.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+# Import libraries dengan fallback
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+try:
+    from PyPDF2 import PdfReader
+    PYPDF2_AVAILABLE = True
+except ImportError:
+    PYPDF2_AVAILABLE = False
+
+try:
+    from .rasterizer import render_pages, count_pages, DEFAULT_WINDOW_SIZE
+    from .ocr_pool import OCRScheduler
+    from .tracing import span
+    from .pdf_source import open_fitz, pdf_reader
+except ImportError:
+    from rasterizer import render_pages, count_pages, DEFAULT_WINDOW_SIZE
+    from ocr_pool import OCRScheduler
+    from tracing import span
+    from pdf_source import open_fitz, pdf_reader
+
+# Pages with more than this many text-layer characters are not OCR'd
+MIN_TEXT_LAYER_CHARS = 100
+
+
+def classify_text_layers(pdf_path: Path, page_numbers: Iterable[int],
+                         min_chars: int = MIN_TEXT_LAYER_CHARS) -> Dict[int, str]:
+    """
+    Baca text layer halaman-halaman yang diminta dari satu dokumen terbuka
+
+    Args:
+        pdf_path: Path ke file PDF atau PDFSource
+        page_numbers: Nomor halaman (1-based)
+        min_chars: Text layer dianggap cukup jika lebih dari jumlah karakter ini
+
+    Returns:
+        Dict {page_num: text} hanya untuk halaman dengan text layer yang
+        cukup; halaman lain perlu OCR
+    """
+    layer_texts = {}
+
+    try:
+        if PYMUPDF_AVAILABLE:
+            doc = open_fitz(pdf_path)
+            try:
+                for page_num in page_numbers:
+                    text = doc.load_page(page_num - 1).get_text().strip()
+                    if len(text) > min_chars:
+                        layer_texts[page_num] = text
+            finally:
+                doc.close()
+        elif PYPDF2_AVAILABLE:
+            reader = pdf_reader(pdf_path)
+            for page_num in page_numbers:
+                text = (reader.pages[page_num - 1].extract_text() or "").strip()
+                if len(text) > min_chars:
+                    layer_texts[page_num] = text
+    except Exception:
+        # Unreadable text layer: fall back to OCR for every page
+        return {}
+
+    return layer_texts
+
+
+class OCRRouter:
+    """
+    Text-layer-first OCR: text layer jika ada, tesseract hanya untuk sisanya
+    """
+
+    def __init__(self, scheduler: OCRScheduler, dpi: int = 300,
+                 window_size: int = DEFAULT_WINDOW_SIZE, backend: str = "auto",
+                 min_chars: int = MIN_TEXT_LAYER_CHARS):
+        self.scheduler = scheduler
+        self.dpi = dpi
+        self.window_size = window_size
+        self.backend = backend
+        self.min_chars = min_chars
+        self.text_layer_pages = 0
+        self.ocr_pages = 0
+
+    def route(self, pdf_path: Path, page_numbers: Optional[Iterable[int]] = None,
+              profile=None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield teks setiap halaman sesuai urutan halaman
+
+        Args:
+            pdf_path: Path ke file PDF
+            page_numbers: Nomor halaman (1-based), default semua halaman
+            profile: DocumentProfile opsional; halaman yang menurut profile
+                tidak punya text layer sama sekali langsung dikirim ke OCR
+                tanpa membaca text layer-nya lagi
+
+        Yields:
+            Dict dengan 'page', 'text', 'source' ("text-layer" atau "ocr"),
+            'elapsed' (detik OCR) dan 'error'
+        """
+        if profile is not None and not profile.total_pages:
+            profile = None  # unreadable during profiling: scan every page
+        if page_numbers is None:
+            page_numbers = range(1, (profile.total_pages if profile is not None
+                                     else count_pages(pdf_path)) + 1)
+        pages = sorted(set(page_numbers))
+        candidates = pages
+        if profile is not None:
+            profile.classify(pages)
+            candidates = [page_num for page_num in pages
+                          if profile.page(page_num).text_chars > 0]
+
+        with span("text_layer_scan", pages=len(candidates)) as scan_span:
+            layer_texts = classify_text_layers(pdf_path, candidates, self.min_chars) if candidates else {}
+            scan_span.set(text_layer_pages=len(layer_texts))
+        ocr_pages = [page_num for page_num in pages if page_num not in layer_texts]
+        unrendered: Set[int] = set()
+
+        self.text_layer_pages += len(layer_texts)
+        self.ocr_pages += len(ocr_pages)
+
+        work = self._scheduled_pages(pdf_path, pages, layer_texts, ocr_pages, unrendered)
+        for result in self.scheduler.map(work):
+            page_num = result['page']
+
+            if page_num in layer_texts:
+                result['text'] = layer_texts.pop(page_num)
+                result['source'] = "text-layer"
+            else:
+                result['source'] = "ocr"
+                if page_num in unrendered:
+                    result['error'] = "page could not be rendered"
+
+            yield result
+
+    def _scheduled_pages(self, pdf_path: Path, pages, layer_texts: Dict[int, str],
+                         ocr_pages, unrendered: Set[int]) -> Iterator[Tuple[int, Any]]:
+        """
+        Gabungkan halaman text-layer (image None) dengan halaman yang di-render
+
+        Hanya halaman OCR yang di-render, dalam range yang digabung oleh
+        rasterizer. Halaman yang gagal di-render tetap mendapat slot.
+        """
+        rendered = render_pages(pdf_path, ocr_pages, dpi=self.dpi,
+                                window_size=self.window_size, backend=self.backend)
+        upcoming = None
+
+        for page_num in pages:
+            if page_num in layer_texts:
+                yield page_num, None
+                continue
+
+            if upcoming is None:
+                upcoming = next(rendered, None)
+
+            if upcoming is not None and upcoming[0] == page_num:
+                yield upcoming
+                upcoming = None
+            else:
+                unrendered.add(page_num)
+                yield page_num, None
+
+    def format_summary(self) -> str:
+        """Ringkasan routing dalam satu baris untuk console"""
+        return (f"Routing: {self.text_layer_pages} pages from text layer, "
+                f"{self.ocr_pages} pages sent to OCR")
@@ -0,0 +1,275 @@
+"""
+Page Classifier
+===============
+
+Klasifikasi halaman (text / scan / mixed / vector) dari sinyal murah tanpa
+ekstraksi teks: content stream halaman dibaca sekali (sudah di-decompress
+oleh PyMuPDF, tanpa layout teks), jumlah dan panjang string di text object
+(BT..ET) menjadi perkiraan jumlah karakter, dan luas gambar dihitung dari
+matrix `cm` sebelum setiap `/Image Do` atau inline image (BI..ID..EI).
+Data biner inline image dibuang sebelum stream di-scan, jadi isinya tidak
+terbaca sebagai string teks atau operator.
+
+Font dan gambar dibaca langsung dari /Resources halaman dengan cache per
+dokumen. Early exit: halaman tanpa text object tidak di-scan teksnya,
+halaman tanpa gambar tidak dihitung luas gambarnya. Halaman yang menggambar lewat Form XObject
+(isi form tidak terlihat di content stream halaman) memakai cara lengkap
+(get_text + get_image_info) supaya hasilnya tetap benar.
+
+Scan yang membawa text layer OCR tak terlihat (render mode 3 Tr) tetap
+diklasifikasikan sebagai scan, bukan halaman teks.
+"""
+
+import re
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# Import libraries dengan fallback
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+try:
+    from .pdf_source import open_fitz
+except ImportError:
+    from pdf_source import open_fitz
+
+PAGE_TEXT = "text"      # digital text, at most small images
+PAGE_SCAN = "scan"      # raster image(s) without visible text (OCR layer allowed)
+PAGE_MIXED = "mixed"    # visible text plus significant images
+PAGE_VECTOR = "vector"  # no usable text and no raster image: drawings, charts or blank
+PAGE_LABELS = (PAGE_TEXT, PAGE_SCAN, PAGE_MIXED, PAGE_VECTOR)
+
+# Pages with more visible text characters than this count as having text
+MIN_TEXT_CHARS = 100
+# Images covering at least this fraction of a text-less page make it a scan
+SCAN_COVERAGE = 0.6
+# Smaller images (logos, bullets, rules) do not make a text page mixed
+MIN_IMAGE_COVERAGE = 0.05
+
+# text_chars: estimated text-layer characters (visible and invisible), a lower
+# bound once it passes MIN_TEXT_CHARS because counting stops there;
+# invisible_text: most of that text is render mode 3 (an OCR layer);
+# image_area: fraction of the page covered by raster images (0.0 - 1.0)
+PageSignals = namedtuple('PageSignals', ['content_bytes', 'text_blocks', 'text_chars', 'invisible_text',
+                                         'image_count', 'image_area', 'fonts'])
+
+_TEXT_OBJECT = re.compile(rb'\bBT\b(.*?)\bET\b', re.S)
+_STRING = re.compile(rb'\((?:\\.|[^\\)])*\)|<[0-9A-Fa-f\s]*>')
+_INVISIBLE = re.compile(rb'\b3\s+Tr\b')
+_RESOURCE_ENTRY = re.compile(r'/(Font|XObject)\s*(<<.*?>>|\d+\s+0\s+R)', re.S)
+_REFERENCE = re.compile(r'/([^\s/<>\[\]()]+)\s*(\d+)\s+0\s+R')
+_DO = re.compile(rb'/([^\s/\[\]()<>{}%]+)\s+Do\b')
+_GRAPHICS = re.compile(rb'/([^\s/\[\]()<>{}%]+)|([-+]?(?:\d+\.?\d*|\.\d+))|\b(q|Q|cm|Do|BI)\b')
+# Inline image: dictionary after BI, binary data after ID, ended by whitespace + EI
+_INLINE_IMAGE = re.compile(rb'\bBI\b.*?\bID\s.*?\sEI\b', re.S)
+
+
+def _font_name(basefont: str) -> str:
+    # "/ABCDEF+Helvetica" -> "Helvetica" (drop the subset tag)
+    basefont = basefont.lstrip('/')
+    return basefont.split('+', 1)[1] if '+' in basefont[:7] else basefont
+
+
+def _lookup(doc, xref: int, key: str, cache: Dict) -> str:
+    """xref_get_key dengan cache per dokumen (font dan gambar dipakai ulang antar halaman)"""
+    value = cache.get((xref, key))
+    if value is None:
+        value = cache[(xref, key)] = doc.xref_get_key(xref, key)[1]
+    return value
+
+
+def _resource_refs(doc, page_xref: int, cache: Dict) -> Optional[Dict[str, Dict[str, int]]]:
+    """
+    {'Font': {name: xref}, 'XObject': {name: xref}} dari /Resources halaman,
+    dibaca dengan satu lookup. None jika /Resources diwarisi dari page tree
+    (pakai scan PyMuPDF).
+    """
+    value_type, value = doc.xref_get_key(page_xref, "Resources")
+    if value_type == 'xref':
+        value = _lookup_object(doc, int(value.split()[0]), cache)
+    elif value_type != 'dict':
+        return None
+
+    refs = {'Font': {}, 'XObject': {}}
+    for kind, entry in _RESOURCE_ENTRY.findall(value):
+        if entry.startswith('<<'):
+            entries = entry
+        else:
+            entries = _lookup_object(doc, int(entry.split()[0]), cache)
+        refs[kind] = {name: int(xref) for name, xref in _REFERENCE.findall(entries)}
+    return refs
+
+
+def _lookup_object(doc, xref: int, cache: Dict) -> str:
+    value = cache.get((xref, None))
+    if value is None:
+        value = cache[(xref, None)] = doc.xref_object(xref, compressed=True)
+    return value
+
+
+def _string_chars(strings) -> int:
+    # (literal) is one byte per char; <hex> is two digits per byte
+    return sum(len(string) - 2 if string[:1] == b'(' else (len(string) - 2) // 2 for string in strings)
+
+
+def _text_statistics(content: bytes, limit: int):
+    """
+    (text object count, string chars, invisible string chars)
+
+    Tanpa render mode 3, penghitungan berhenti setelah lebih dari limit
+    karakter (halaman sudah pasti punya teks), jadi chars adalah batas bawah.
+    """
+    blocks = content.count(b"BT")
+    if not _INVISIBLE.search(content):
+        chars = 0
+        for match in _STRING.finditer(content):
+            chars += _string_chars((match.group(),))
+            if chars > limit:
+                break
+        return blocks, chars, 0
+
+    chars = 0
+    invisible = 0
+    for match in _TEXT_OBJECT.finditer(content):
+        segment_chars = _string_chars(_STRING.findall(match.group(1)))
+        chars += segment_chars
+        if _INVISIBLE.search(match.group(1)):
+            invisible += segment_chars
+    return blocks, chars, invisible
+
+
+def _image_coverage(graphics: bytes, image_names: set, page_area: float) -> float:
+    """
+    Luas gambar dari content stream: setiap `/Im Do` dan inline image (`BI`,
+    datanya sudah dibuang) menggambar unit square yang di-transform CTM,
+    jadi luasnya |det(CTM)|. Hanya determinan yang
+    dilacak (q/Q menyimpan dan memulihkannya). Tidak memperhitungkan clipping
+    sehingga hasilnya dijepit ke 1.0.
+    """
+    if not page_area:
+        return 0.0
+    det = 1.0
+    stack = []
+    numbers = []
+    name = None
+    covered = 0.0
+    for match in _GRAPHICS.finditer(graphics):
+        operand, number, operator = match.groups()
+        if number is not None:
+            numbers.append(float(number))
+            continue
+        if operand is not None:
+            name = operand.decode('latin-1')
+            continue
+        if operator == b'q':
+            stack.append(det)
+        elif operator == b'Q':
+            det = stack.pop() if stack else 1.0
+        elif operator == b'cm' and len(numbers) >= 6:
+            a, b, c, d = numbers[-6:-2]
+            det *= a * d - b * c
+        elif operator == b'BI' or (operator == b'Do' and name in image_names):
+            covered += abs(det)
+        numbers.clear()
+    return min(1.0, covered / page_area)
+
+
+def _exact_signals(page, fonts: frozenset, content_bytes: int) -> PageSignals:
+    """Sinyal lewat ekstraksi lengkap untuk halaman yang isinya ada di Form XObject"""
+    text = page.get_text().strip()
+    page_area = abs(page.rect)
+    covered = sum(abs(fitz.Rect(info['bbox']) & page.rect) for info in page.get_image_info())
+    image_area = min(1.0, covered / page_area) if page_area else 0.0
+    return PageSignals(content_bytes, len(page.get_text("blocks")), len(text), False,
+                       len(page.get_images(full=True)), image_area, fonts)
+
+
+def page_signals(page, cache: Optional[Dict] = None) -> PageSignals:
+    """
+    Kumpulkan sinyal murah untuk satu halaman fitz
+
+    Args:
+        page: Halaman fitz
+        cache: Dict yang dipakai bersama untuk semua halaman satu dokumen
+            (lookup font/gambar yang sama tidak diulang)
+    """
+    doc = page.parent
+    cache = {} if cache is None else cache
+    content = page.read_contents()
+
+    refs = _resource_refs(doc, page.xref, cache)
+    if refs is None:
+        fonts = frozenset(_font_name(font[3] or font[4]) for font in page.get_fonts())
+        image_names = {image[7] for image in page.get_images(full=True)}
+    else:
+        fonts = frozenset(_font_name(_lookup(doc, xref, "BaseFont", cache)) for xref in refs['Font'].values())
+        image_names = {name for name, xref in refs['XObject'].items()
+                       if _lookup(doc, xref, "Subtype", cache) == '/Image'}
+
+    content_bytes = len(content)
+    inline_images = 0
+    if b"BI" in content:
+        # Keep only the BI operator; the binary data could look like strings or operators
+        content, inline_images = _INLINE_IMAGE.subn(b' BI ', content)
+
+    if any(name.decode('latin-1') not in image_names for name in _DO.findall(content)):
+        # Form XObject: text or images drawn inside it are not in the page stream
+        return _exact_signals(page, fonts, content_bytes)
+
+    blocks = chars = invisible = 0
+    if b"BT" in content:
+        blocks, chars, invisible = _text_statistics(content, MIN_TEXT_CHARS)
+
+    image_area = 0.0
+    if image_names or inline_images:
+        # Text objects cannot contain cm, Do or BI; dropping them shortens the scan
+        graphics = _TEXT_OBJECT.sub(b' ', content) if blocks else content
+        image_area = _image_coverage(graphics, image_names, abs(page.mediabox))
+
+    return PageSignals(content_bytes, blocks, chars, invisible * 2 > chars,
+                       len(image_names) + inline_images, image_area, fonts)
+
+
+def classify_signals(signals: PageSignals) -> str:
+    """Label halaman dari sinyalnya"""
+    has_text = signals.text_chars > MIN_TEXT_CHARS and not signals.invisible_text
+    if not has_text and signals.image_area >= SCAN_COVERAGE:
+        return PAGE_SCAN
+    if has_text:
+        return PAGE_MIXED if signals.image_area >= MIN_IMAGE_COVERAGE else PAGE_TEXT
+    if signals.image_area >= MIN_IMAGE_COVERAGE:
+        return PAGE_SCAN
+    return PAGE_VECTOR
+
+
+def classify_page(page, cache: Optional[Dict] = None) -> str:
+    """Label satu halaman fitz: text, scan, mixed atau vector"""
+    return classify_signals(page_signals(page, cache))
+
+
+def classify_pages(pdf_path: Path, page_numbers: Optional[Iterable[int]] = None) -> Dict[int, str]:
+    """
+    Klasifikasi halaman PDF dari satu dokumen terbuka
+
+    Args:
+        pdf_path: Path ke file PDF atau PDFSource
+        page_numbers: Nomor halaman (1-based), default semua halaman
+
+    Returns:
+        Dict {page_num: label}
+    """
+    if not PYMUPDF_AVAILABLE:
+        raise RuntimeError("Page classification needs PyMuPDF")
+
+    doc = open_fitz(pdf_path)
+    try:
+        if page_numbers is None:
+            page_numbers = range(1, len(doc) + 1)
+        cache: Dict = {}
+        return {page_num: classify_page(doc.load_page(page_num - 1), cache) for page_num in page_numbers}
+    finally:
+        doc.close()
@@ -0,0 +1,83 @@
+"""
+Page-Parallel Execution Engine
+==============================
+
+Menjalankan pekerjaan per halaman di beberapa proses sekaligus. Dokumen
+dibagi menjadi range halaman yang berurutan, setiap worker membuka PDF
+sendiri dan mengembalikan hasil per halaman yang kemudian digabung lagi
+sesuai urutan halaman.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def resolve_workers(workers: int) -> int:
+    """Resolve requested worker count (0 or None = all CPU cores)"""
+    if not workers or workers < 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def split_page_ranges(total_pages: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    Split halaman [0, total_pages) menjadi range (start, end) yang berurutan
+
+    Setiap worker mendapat satu range dengan ukuran yang hampir sama.
+    """
+    if total_pages <= 0:
+        return []
+
+    shards = max(1, min(workers, total_pages))
+    base, extra = divmod(total_pages, shards)
+
+    ranges = []
+    start = 0
+    for shard in range(shards):
+        size = base + (1 if shard < extra else 0)
+        ranges.append((start, start + size))
+        start += size
+
+    return ranges
+
+
+def run_page_shards(shard_fn: Callable[..., Dict[int, Any]], pdf_path: Path,
+                    total_pages: int, workers: int = 1, first_page: int = 0,
+                    **kwargs) -> Dict[int, Any]:
+    """
+    Jalankan shard_fn(pdf_path, start, end, **kwargs) untuk setiap range halaman
+
+    Args:
+        shard_fn: Fungsi level-module (harus bisa di-pickle) yang mengembalikan
+            dict {page_num: result} untuk halaman di range-nya
+        pdf_path: Path ke file PDF atau PDFSource (worker memetakan ulang
+            file-nya; PDF di memory dikirim sebagai bytes)
+        total_pages: Jumlah halaman dokumen
+        workers: Jumlah proses worker (1 = serial di proses ini)
+        first_page: Halaman (0-based) pertama yang diproses; halaman sebelumnya
+            dilewati (misalnya sudah ada di checkpoint)
+
+    Returns:
+        Dict {page_num: result} gabungan dari semua shard
+    """
+    workers = resolve_workers(workers)
+    ranges = [(start + first_page, end + first_page)
+              for start, end in split_page_ranges(total_pages - first_page, workers)]
+
+    # Serial path runs the very same shard function in-process, so the
+    # parallel output only differs in where the work happened.
+    if len(ranges) <= 1:
+        return shard_fn(pdf_path, first_page, total_pages, **kwargs) if ranges else {}
+
+    results: Dict[int, Any] = {}
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [
+            executor.submit(shard_fn, pdf_path, start, end, **kwargs)
+            for start, end in ranges
+        ]
+        for future in futures:
+            results.update(future.result())
+
+    return results
@@ -9,7 +9,6 @@ import os
 import tempfile
 from pathlib import Path
 from typing import Optional, Tuple, List
-import subprocess
 
 # Import libraries dengan fallback
 try:
@@ -20,7 +19,6 @@ except ImportError:
 
 try:
     import pytesseract
-    from pdf2image import convert_from_path
     OCR_AVAILABLE = True
 except ImportError:
     OCR_AVAILABLE = False
@@ -40,6 +38,25 @@ except ImportError:
             print(*args)
     console = Console()
 
+try:
+    from .rasterizer import (
+        count_pages, iter_document_pages, fill_skipped_pages, format_skipped_pages,
+        DEFAULT_WINDOW_SIZE, RASTERIZER_AVAILABLE, SKIPPED_PAGE_PLACEHOLDER
+    )
+    from .ocr_pool import OCRScheduler
+    from .tracing import span
+    from .tools import tool_registry
+    from .pdf_source import PDFInput, open_source, open_fitz, pdf_reader
+except ImportError:
+    from rasterizer import (
+        count_pages, iter_document_pages, fill_skipped_pages, format_skipped_pages,
+        DEFAULT_WINDOW_SIZE, RASTERIZER_AVAILABLE, SKIPPED_PAGE_PLACEHOLDER
+    )
+    from ocr_pool import OCRScheduler
+    from tracing import span
+    from tools import tool_registry
+    from pdf_source import PDFInput, open_source, open_fitz, pdf_reader
+
 class PDFTextExtractor:
     """
     Kelas untuk ekstraksi teks dari PDF menggunakan berbagai metode
@@ -47,6 +64,9 @@ class PDFTextExtractor:
     
     def __init__(self):
         self.available_methods = self._check_available_methods()
+        self.raster_window_size = DEFAULT_WINDOW_SIZE  # Pages held in memory during OCR
+        self.raster_backend = "auto"  # Rasterizer backend: auto, pymupdf or pdf2image
+        self.ocr_workers = None  # Parallel tesseract processes (None = core count)
     
     def _check_available_methods(self) -> List[str]:
         """Check which extraction methods are available"""
@@ -56,7 +76,7 @@ class PDFTextExtractor:
             methods.append("pymupdf")
         if PYPDF2_AVAILABLE:
             methods.append("pypdf2")
-        if OCR_AVAILABLE:
+        if OCR_AVAILABLE and RASTERIZER_AVAILABLE:
             methods.append("ocr")
         
         return methods
@@ -65,131 +85,156 @@ class PDFTextExtractor:
         """
         Extract text using PyMuPDF (fitz) - Best for text-based PDFs
         """
-        try:
-            doc = fitz.open(str(pdf_path))
-            text_content = ""
-            
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text_content += f"\n\n# Page {page_num + 1}\n\n"
-                text_content += page.get_text()
-            
-            doc.close()
-            
-            if text_content.strip():
-                return True, text_content, "Text extracted successfully using PyMuPDF"
-            else:
-                return False, "", "No text found in PDF (might be image-based)"
+        with span("text_extraction", engine="pymupdf"):
+            try:
+                doc = open_fitz(pdf_path)
+                sections = []
                 
-        except Exception as e:
-            return False, "", f"PyMuPDF extraction failed: {str(e)}"
+                for page_num in range(len(doc)):
+                    page = doc.load_page(page_num)
+                    sections.append(f"\n\n# Page {page_num + 1}\n\n")
+                    sections.append(page.get_text())
+                
+                doc.close()
+                text_content = "".join(sections)
+                
+                if text_content.strip():
+                    return True, text_content, "Text extracted successfully using PyMuPDF"
+                else:
+                    return False, "", "No text found in PDF (might be image-based)"
+                    
+            except Exception as e:
+                return False, "", f"PyMuPDF extraction failed: {str(e)}"
     
     def extract_text_pypdf2(self, pdf_path: Path) -> Tuple[bool, str, str]:
         """
         Extract text using PyPDF2 - Fallback method
         """
-        try:
-            reader = PdfReader(str(pdf_path))
-            text_content = ""
-            
-            for page_num, page in enumerate(reader.pages):
-                text_content += f"\n\n# Page {page_num + 1}\n\n"
-                text_content += page.extract_text()
-            
-            if text_content.strip():
-                return True, text_content, "Text extracted successfully using PyPDF2"
-            else:
-                return False, "", "No text found in PDF (might be image-based)"
+        with span("text_extraction", engine="pypdf2"):
+            try:
+                reader = pdf_reader(pdf_path)
+                sections = []
                 
-        except Exception as e:
-            return False, "", f"PyPDF2 extraction failed: {str(e)}"
+                for page_num, page in enumerate(reader.pages):
+                    sections.append(f"\n\n# Page {page_num + 1}\n\n")
+                    sections.append(page.extract_text())
+                
+                text_content = "".join(sections)
+                
+                if text_content.strip():
+                    return True, text_content, "Text extracted successfully using PyPDF2"
+                else:
+                    return False, "", "No text found in PDF (might be image-based)"
+                    
+            except Exception as e:
+                return False, "", f"PyPDF2 extraction failed: {str(e)}"
     
     def extract_text_ocr(self, pdf_path: Path) -> Tuple[bool, str, str]:
         """
         Extract text using OCR - For image-based PDFs
         """
-        if not OCR_AVAILABLE:
-            return False, "", "OCR not available (install pytesseract and pdf2image)"
+        if not OCR_AVAILABLE or not RASTERIZER_AVAILABLE:
+            return False, "", "OCR not available (install pytesseract and PyMuPDF or pdf2image)"
         
-        try:
-            # Check if tesseract is installed
-            subprocess.run(['tesseract', '--version'], 
-                         capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Check if tesseract is installed (probed once per process)
+        if not tool_registry.is_available('tesseract'):
             return False, "", "Tesseract OCR not installed. Download from: https://github.com/UB-Mannheim/tesseract/wiki"
         
-        try:
-            console.print("[yellow]Converting PDF to images for OCR...[/yellow]")
-            
-            # Convert PDF to images
-            images = convert_from_path(str(pdf_path), dpi=300)
-            text_content = ""
-            
-            console.print(f"[yellow]Processing {len(images)} pages with OCR...[/yellow]")
-            
-            for page_num, image in enumerate(images):
-                text_content += f"\n\n# Page {page_num + 1}\n\n"
+        with span("text_extraction", engine="ocr"):
+            try:
+                console.print("[yellow]Converting PDF to images for OCR...[/yellow]")
                 
-                # Perform OCR
-                page_text = pytesseract.image_to_string(image, lang='eng')
-                text_content += page_text
+                # Stream PDF pages as images in bounded windows
+                total_pages = count_pages(pdf_path)
+                sections = []
                 
-                console.print(f"[green]Processed page {page_num + 1}/{len(images)}[/green]")
-            
-            if text_content.strip():
-                return True, text_content, f"Text extracted successfully using OCR ({len(images)} pages)"
-            else:
-                return False, "", "No text found even with OCR"
+                console.print(f"[yellow]Processing {total_pages} pages with OCR...[/yellow]")
                 
-        except Exception as e:
-            return False, "", f"OCR extraction failed: {str(e)}"
+                # Perform OCR on a pool of tesseract workers
+                scheduler = OCRScheduler(workers=self.ocr_workers, lang='eng')
+                pages = iter_document_pages(pdf_path, dpi=300, window_size=self.raster_window_size,
+                                            backend=self.raster_backend)
+                # Pages the rasterizer skipped arrive with image None and are not OCR'd
+                pages = fill_skipped_pages(pages, range(1, total_pages + 1))
+                skipped = []
+                
+                for result in scheduler.map(pages):
+                    if result['error']:
+                        raise RuntimeError(f"page {result['page']}: {result['error']}")
+                    
+                    sections.append(f"\n\n# Page {result['page']}\n\n")
+                    
+                    if result['text'] is None:
+                        sections.append(SKIPPED_PAGE_PLACEHOLDER.format(page=result['page']))
+                        skipped.append(result['page'])
+                        continue
+                    
+                    sections.append(result['text'])
+                    
+                    console.print(f"[green]Processed page {result['page']}/{total_pages} ({result['elapsed']:.1f}s)[/green]")
+                
+                console.print(f"[cyan]{scheduler.format_summary()}[/cyan]")
+                text_content = "".join(sections)
+                ocr_pages = total_pages - len(skipped)
+                
+                if ocr_pages and text_content.strip():
+                    return True, text_content, (f"Text extracted successfully using OCR "
+                                                f"({ocr_pages}/{total_pages} pages){format_skipped_pages(skipped)}")
+                else:
+                    return False, "", "No text found even with OCR"
+                    
+            except Exception as e:
+                return False, "", f"OCR extraction failed: {str(e)}"
     
-    def extract_text(self, pdf_path: Path, method: str = "auto") -> Tuple[bool, str, str]:
+    def extract_text(self, pdf_path: PDFInput, method: str = "auto") -> Tuple[bool, str, str]:
         """
         Extract text from PDF using specified or automatic method selection
         
         Args:
-            pdf_path: Path to PDF file
+            pdf_path: Path to PDF file, PDFSource, or PDF bytes/file object
+                (opened once; the fallback methods read the same buffer)
             method: "auto", "pymupdf", "pypdf2", or "ocr"
             
         Returns:
             (success, text_content, message)
         """
         
-        if method == "auto":
-            # Try methods in order of preference
-            for auto_method in ["pymupdf", "pypdf2", "ocr"]:
-                if auto_method in self.available_methods:
-                    console.print(f"[blue]Trying {auto_method} extraction...[/blue]")
-                    
-                    if auto_method == "pymupdf":
-                        success, text, msg = self.extract_text_pymupdf(pdf_path)
-                    elif auto_method == "pypdf2":
-                        success, text, msg = self.extract_text_pypdf2(pdf_path)
-                    elif auto_method == "ocr":
-                        success, text, msg = self.extract_text_ocr(pdf_path)
-                    
-                    if success:
-                        console.print(f"[green]✓ {msg}[/green]")
-                        return True, text, msg
-                    else:
-                        console.print(f"[yellow]⚠ {msg}[/yellow]")
-            
-            return False, "", "All extraction methods failed"
-        
-        else:
-            # Use specific method
-            if method not in self.available_methods:
-                return False, "", f"Method '{method}' not available"
+        with open_source(pdf_path) as source, \
+                span("document", processor="extractor", method=method, file=source.name):
+            if method == "auto":
+                # Try methods in order of preference
+                for auto_method in ["pymupdf", "pypdf2", "ocr"]:
+                    if auto_method in self.available_methods:
+                        console.print(f"[blue]Trying {auto_method} extraction...[/blue]")
+                        
+                        if auto_method == "pymupdf":
+                            success, text, msg = self.extract_text_pymupdf(source)
+                        elif auto_method == "pypdf2":
+                            success, text, msg = self.extract_text_pypdf2(source)
+                        elif auto_method == "ocr":
+                            success, text, msg = self.extract_text_ocr(source)
+                        
+                        if success:
+                            console.print(f"[green]✓ {msg}[/green]")
+                            return True, text, msg
+                        else:
+                            console.print(f"[yellow]⚠ {msg}[/yellow]")
+                
+                return False, "", "All extraction methods failed"
             
-            if method == "pymupdf":
-                return self.extract_text_pymupdf(pdf_path)
-            elif method == "pypdf2":
-                return self.extract_text_pypdf2(pdf_path)
-            elif method == "ocr":
-                return self.extract_text_ocr(pdf_path)
             else:
-                return False, "", f"Unknown method: {method}"
+                # Use specific method
+                if method not in self.available_methods:
+                    return False, "", f"Method '{method}' not available"
+                
+                if method == "pymupdf":
+                    return self.extract_text_pymupdf(source)
+                elif method == "pypdf2":
+                    return self.extract_text_pypdf2(source)
+                elif method == "ocr":
+                    return self.extract_text_ocr(source)
+                else:
+                    return False, "", f"Unknown method: {method}"
     
     def save_text_as_markdown(self, text_content: str, output_path: Path) -> bool:
         """
@@ -214,6 +259,7 @@ class PDFTextExtractor:
             'available_methods': self.available_methods,
             'pymupdf_available': PYMUPDF_AVAILABLE,
             'pypdf2_available': PYPDF2_AVAILABLE,
-            'ocr_available': OCR_AVAILABLE,
+            'ocr_available': OCR_AVAILABLE and RASTERIZER_AVAILABLE,
+            'tesseract': tool_registry.get('tesseract'),
             'recommended_method': self.available_methods[0] if self.available_methods else None
         }
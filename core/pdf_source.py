@@ -0,0 +1,286 @@
+"""
+PDF Source
+==========
+
+Satu input PDF yang dibuka sekali dan dibagi ke PyMuPDF, PyPDF2 dan
+rasterizer. Input bisa berupa path, bytes/bytearray/memoryview atau
+file-like object:
+
+- Path dipetakan ke memory (mmap, read-only) saat pertama dibutuhkan;
+  semua dokumen fitz dan PdfReader berikutnya membaca buffer yang sama
+  tanpa membuka ulang file.
+- bytes/memoryview dipakai langsung tanpa copy, jadi PDF yang diterima
+  daemon lewat socket tidak pernah ditulis ke disk.
+- File-like object dengan fileno() dipetakan ke memory; selain itu
+  (io.BytesIO, stream socket) isinya dibaca sekali ke memory.
+
+Contoh:
+    with open_source(pdf_path) as source:
+        doc = source.open_fitz()       # fitz.open(stream=...) tanpa copy
+        reader = source.pdf_reader()   # PdfReader di atas buffer yang sama
+        pages = render_pages(source, [1, 2])
+
+Processor menerima PDFSource di mana pun mereka menerima Path; helper
+open_fitz()/pdf_reader() di modul ini tetap membuka Path langsung dari
+disk untuk pemanggil yang tidak membuat source.
+
+PyMuPDF dan PyPDF2 baru di-import saat dokumen pertama dibuka, karena modul
+ini ikut di-import converter saat startup CLI.
+
+Backend pdf2image tidak bisa membaca dari memory: untuk source tanpa path,
+pdf2image sendiri menulis file sementara (pakai backend pymupdf untuk
+input yang tidak boleh menyentuh disk).
+"""
+
+import hashlib
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional, Tuple, Union
+
+# Name given to in-memory documents that arrive without one
+DEFAULT_NAME = "document.pdf"
+
+PDFInput = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO, "PDFSource"]
+
+
+class _BufferIO(io.RawIOBase):
+    """Read-only raw stream di atas memoryview (read() hanya meng-copy potongan yang dibaca)"""
+
+    def __init__(self, buffer: memoryview):
+        super().__init__()
+        self._buffer = buffer
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        chunk = self._buffer[self._position:self._position + len(target)]
+        size = len(chunk)
+        target[:size] = chunk
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._buffer) + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+
+class PDFSource:
+    """
+    PDF dari path atau memory dengan satu buffer bersama
+
+    Attributes:
+        path: File di disk, None untuk input dari memory
+        name: Nama file (dipakai untuk nama output dan header markdown)
+        size_bytes: Ukuran PDF
+        mtime_ns: mtime file saat source dibuat (None untuk input dari memory)
+    """
+
+    def __init__(self, data: PDFInput, name: Optional[str] = None):
+        """
+        Args:
+            data: Path, bytes/bytearray/memoryview atau file-like object (mode binary)
+            name: Nama dokumen; default nama file, atau DEFAULT_NAME untuk bytes
+
+        Raises:
+            TypeError: Tipe input tidak didukung
+            OSError: Path tidak bisa di-stat
+        """
+        self.path: Optional[Path] = None
+        self.mtime_ns: Optional[int] = None
+        self._buffer: Optional[memoryview] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._digest: Optional[str] = None
+
+        if isinstance(data, (str, os.PathLike)):
+            self.path = Path(data)
+            stat = self.path.stat()
+            self.size_bytes = stat.st_size
+            self.mtime_ns = stat.st_mtime_ns
+            self.name = name or self.path.name
+            return
+
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            buffer = memoryview(data)
+            # fitz needs one contiguous run of bytes
+            self._buffer = buffer.cast('B') if buffer.c_contiguous else memoryview(buffer.tobytes())
+        elif hasattr(data, 'read'):
+            self._read_file_object(data)
+            file_name = getattr(data, 'name', None)
+            if not name and isinstance(file_name, str):
+                name = Path(file_name).name
+        else:
+            raise TypeError(f"Unsupported PDF input type: {type(data).__name__}")
+
+        self.size_bytes = len(self._mmap) if self._mmap is not None else self._buffer.nbytes
+        self.name = name or DEFAULT_NAME
+
+    def _read_file_object(self, file_object: BinaryIO) -> None:
+        if isinstance(file_object, io.BytesIO):
+            self._buffer = file_object.getbuffer()
+            return
+        try:
+            fileno = file_object.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            fileno = None
+        if fileno is not None and os.fstat(fileno).st_size > 0:
+            # The mapping holds its own descriptor: the caller may close the file
+            self._mmap = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        else:
+            self._buffer = memoryview(file_object.read())
+
+    @property
+    def stem(self) -> str:
+        return Path(self.name).stem
+
+    @property
+    def suffix(self) -> str:
+        return Path(self.name).suffix
+
+    @property
+    def in_memory(self) -> bool:
+        """True jika PDF tidak punya file di disk"""
+        return self.path is None
+
+    @property
+    def buffer(self) -> memoryview:
+        """
+        Isi PDF; file di disk dipetakan ke memory saat pertama diakses
+
+        Setiap akses ke mapping memberi memoryview baru, sehingga mapping
+        tidak bisa di-unmap selama dokumen yang memakainya masih hidup.
+        """
+        if self._mmap is not None:
+            return memoryview(self._mmap)
+        if self._buffer is not None:
+            return self._buffer
+        with open(self.path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                self._buffer = memoryview(b"")
+                return self._buffer
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._mmap)
+
+    def identity(self) -> Tuple[Any, ...]:
+        """Identitas isi: (size, mtime_ns) untuk file, (size, sha256) untuk memory"""
+        if self.path is not None:
+            return ('file', self.size_bytes, self.mtime_ns)
+        return ('memory', self.size_bytes, self.sha256())
+
+    def sha256(self) -> str:
+        """SHA-256 isi PDF (dihitung sekali)"""
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.buffer).hexdigest()
+        return self._digest
+
+    def stream(self) -> BinaryIO:
+        """File-like object read-only di atas buffer (tanpa copy seluruh isi)"""
+        return io.BufferedReader(_BufferIO(self.buffer))
+
+    def open_fitz(self):
+        """Dokumen fitz di atas buffer bersama (tutup dengan doc.close())"""
+        import fitz  # PyMuPDF
+        return fitz.open(stream=self.buffer, filetype="pdf")
+
+    def pdf_reader(self):
+        """PdfReader di atas buffer bersama"""
+        from PyPDF2 import PdfReader
+        return PdfReader(self.stream())
+
+    def close(self) -> None:
+        """
+        Lepas memory map file; source berbasis path dipetakan ulang jika
+        dipakai lagi. Mapping yang masih dipakai dokumen terbuka dibiarkan
+        dan dilepas oleh garbage collector.
+        """
+        if self.path is None or self._mmap is None:
+            return
+        mapping, self._mmap = self._mmap, None
+        try:
+            mapping.close()
+        except BufferError:
+            # A document still holds a view; the mapping goes away with it
+            pass
+
+    def __enter__(self) -> "PDFSource":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # Process pools: a file is mapped again in the worker, memory is sent as bytes
+        if self.path is not None:
+            return (PDFSource, (self.path, self.name))
+        return (PDFSource, (self.buffer.tobytes(), self.name))
+
+    def __repr__(self) -> str:
+        location = str(self.path) if self.path is not None else "memory"
+        return f"PDFSource({self.name!r}, {location}, {self.size_bytes} bytes)"
+
+
+def as_source(pdf: PDFInput, name: Optional[str] = None) -> PDFSource:
+    """PDFSource untuk input apapun (source yang sudah ada dikembalikan apa adanya)"""
+    if isinstance(pdf, PDFSource):
+        return pdf
+    return PDFSource(pdf, name)
+
+
+@contextmanager
+def open_source(pdf: PDFInput, name: Optional[str] = None) -> Iterator[PDFSource]:
+    """
+    Context manager untuk PDFSource; source yang dibuat di sini ditutup saat
+    keluar, source milik pemanggil dibiarkan terbuka
+    """
+    source = as_source(pdf, name)
+    try:
+        yield source
+    finally:
+        if source is not pdf:
+            source.close()
+
+
+def source_path(pdf: PDFInput) -> Optional[Path]:
+    """Path file di disk untuk input ini, None jika PDF hanya ada di memory"""
+    if isinstance(pdf, (str, os.PathLike)):
+        return Path(pdf)
+    if isinstance(pdf, PDFSource):
+        return pdf.path
+    return None
+
+
+def open_fitz(pdf: PDFInput):
+    """fitz.open untuk Path (langsung dari disk) atau PDFSource/bytes (dari buffer)"""
+    if isinstance(pdf, (str, os.PathLike)):
+        import fitz  # PyMuPDF
+        return fitz.open(str(pdf))
+    return as_source(pdf).open_fitz()
+
+
+def pdf_reader(pdf: PDFInput):
+    """PdfReader untuk Path (langsung dari disk) atau PDFSource/bytes (dari buffer)"""
+    if isinstance(pdf, (str, os.PathLike)):
+        from PyPDF2 import PdfReader
+        return PdfReader(str(pdf))
+    return as_source(pdf).pdf_reader()
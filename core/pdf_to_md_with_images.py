@@ -34,6 +34,27 @@ except ImportError:
             print(*args)
     console = Console()
 
+try:
+    from .rasterizer import (
+        render_pages, count_pages, iter_document_pages, fill_skipped_pages, format_skipped_pages,
+        DEFAULT_WINDOW_SIZE, RASTERIZER_AVAILABLE, SKIPPED_PAGE_PLACEHOLDER
+    )
+    from .markdown_writer import MarkdownWriter
+    from .image_store import ImageStore
+    from .image_encoder import ImageEncoder, DEFAULT_CODEC
+    from .document_profile import DocumentProfile, ensure_profile
+    from .pdf_source import PDFInput, open_source, open_fitz
+except ImportError:
+    from rasterizer import (
+        render_pages, count_pages, iter_document_pages, fill_skipped_pages, format_skipped_pages,
+        DEFAULT_WINDOW_SIZE, RASTERIZER_AVAILABLE, SKIPPED_PAGE_PLACEHOLDER
+    )
+    from markdown_writer import MarkdownWriter
+    from image_store import ImageStore
+    from image_encoder import ImageEncoder, DEFAULT_CODEC
+    from document_profile import DocumentProfile, ensure_profile
+    from pdf_source import PDFInput, open_source, open_fitz
+
 class PDFToMarkdownWithImages:
     """
     Converter untuk PDF ke Markdown dengan gambar
@@ -43,6 +64,11 @@ class PDFToMarkdownWithImages:
         self.output_dir = Path(output_dir)
         self.temp_dir = Path(temp_dir)
         self.available_methods = self._check_available_methods()
+        self.raster_window_size = DEFAULT_WINDOW_SIZE  # Pages held in memory while rasterizing
+        self.raster_backend = "auto"  # Rasterizer backend: auto, pymupdf or pdf2image
+        self.image_passthrough = True  # Keep embedded JPEGs as .jpg instead of re-encoding to PNG
+        self.image_codec = DEFAULT_CODEC  # Page snapshot codec (see image_encoder.CODECS)
+        self.image_quality = None  # Quality for jpeg/webp snapshots (None = codec default)
     
     def _check_available_methods(self) -> List[str]:
         """Check which methods are available"""
@@ -50,7 +76,7 @@ class PDFToMarkdownWithImages:
         
         if PYMUPDF_AVAILABLE:
             methods.append("pymupdf_text_and_images")
-        if PDF2IMAGE_AVAILABLE:
+        if RASTERIZER_AVAILABLE:
             methods.append("pdf2image_full_pages")
         
         return methods
@@ -60,62 +86,54 @@ class PDFToMarkdownWithImages:
         Extract text dan gambar menggunakan PyMuPDF
         """
         try:
-            doc = fitz.open(str(pdf_path))
+            doc = open_fitz(pdf_path)
             
             # Buat folder untuk gambar
             images_dir = output_md_path.parent / f"{output_md_path.stem}_images"
             images_dir.mkdir(exist_ok=True)
             
-            markdown_content = f"# {pdf_path.stem}\n\n"
-            markdown_content += "*Generated by PDF Converter Tool with Images*\n\n"
-            markdown_content += "---\n\n"
-            
-            image_count = 0
-            
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
+            with MarkdownWriter(output_md_path) as markdown:
+                markdown.write(f"# {pdf_path.stem}\n\n")
+                markdown.write("*Generated by PDF Converter Tool with Images*\n\n")
+                markdown.write("---\n\n")
                 
-                # Add page header
-                markdown_content += f"## Page {page_num + 1}\n\n"
+                image_count = 0
+                image_store = ImageStore(images_dir, self.image_passthrough)  # Repeated images are written once
                 
-                # Extract text
-                page_text = page.get_text()
-                if page_text.strip():
-                    markdown_content += page_text + "\n\n"
-                
-                # Extract images from page
-                image_list = page.get_images(full=True)
-                
-                for img_index, img in enumerate(image_list):
-                    try:
-                        # Get image data
-                        xref = img[0]
-                        pix = fitz.Pixmap(doc, xref)
-                        
-                        if pix.n - pix.alpha < 4:  # GRAY or RGB
-                            img_filename = f"page_{page_num + 1}_img_{img_index + 1}.png"
-                            img_path = images_dir / img_filename
-                            
-                            pix.save(str(img_path))
+                for page_num in range(len(doc)):
+                    page = doc.load_page(page_num)
+                    
+                    # Add page header
+                    markdown.write(f"## Page {page_num + 1}\n\n")
+                    
+                    # Extract text
+                    page_text = page.get_text()
+                    if page_text.strip():
+                        markdown.write(page_text + "\n\n")
+                    
+                    # Extract images from page
+                    image_list = page.get_images(full=True)
+                    
+                    for img_index, img in enumerate(image_list):
+                        try:
+                            img_filename = image_store.extract(
+                                doc, img[0], f"page_{page_num + 1}_img_{img_index + 1}.png",
+                                accept=lambda pix: pix.n - pix.alpha < 4  # GRAY or RGB
+                            )
                             
-                            # Add image reference to markdown
-                            relative_img_path = f"{images_dir.name}/{img_filename}"
-                            markdown_content += f"![Image {image_count + 1}]({relative_img_path})\n\n"
+                            if img_filename:
+                                # Add image reference to markdown
+                                relative_img_path = f"{images_dir.name}/{img_filename}"
+                                markdown.write(f"![Image {image_count + 1}]({relative_img_path})\n\n")
+                                
+                                image_count += 1
                             
-                            image_count += 1
-                        
-                        pix = None
-                        
-                    except Exception as e:
-                        console.print(f"[yellow]Warning: Could not extract image {img_index + 1} from page {page_num + 1}: {e}[/yellow]")
+                        except Exception as e:
+                            console.print(f"[yellow]Warning: Could not extract image {img_index + 1} from page {page_num + 1}: {e}[/yellow]")
+                    
+                    markdown.end_page()
                 
-                markdown_content += "---\n\n"
-            
-            doc.close()
-            
-            # Save markdown file
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                doc.close()
             
             return True, f"Extracted {image_count} images and text using PyMuPDF"
             
@@ -126,210 +144,200 @@ class PDFToMarkdownWithImages:
         """
         Konversi setiap halaman PDF menjadi gambar
         """
-        if not PDF2IMAGE_AVAILABLE:
-            return False, "pdf2image not available"
+        if not RASTERIZER_AVAILABLE:
+            return False, "No rasterizer available (install PyMuPDF or pdf2image)"
         
         try:
             console.print("[blue]Converting PDF pages to images...[/blue]")
             
-            # Convert PDF to images
-            images = convert_from_path(
-                str(pdf_path), 
-                dpi=200,  # Good quality but not too large
-                fmt='PNG'
-            )
+            total_pages = count_pages(pdf_path)
             
             # Buat folder untuk gambar
             images_dir = output_md_path.parent / f"{output_md_path.stem}_images"
             images_dir.mkdir(exist_ok=True)
             
-            markdown_content = f"# {pdf_path.stem}\n\n"
-            markdown_content += "*Generated by PDF Converter Tool - Full Page Images*\n\n"
-            markdown_content += f"**Total Pages:** {len(images)}\n\n"
-            markdown_content += "---\n\n"
-            
-            for page_num, image in enumerate(images):
-                # Save page as image
-                img_filename = f"page_{page_num + 1}.png"
-                img_path = images_dir / img_filename
-                
-                # Optimize image size
-                image.save(str(img_path), "PNG", optimize=True)
+            with MarkdownWriter(output_md_path) as markdown, \
+                    ImageEncoder(self.image_codec, self.image_quality) as encoder:
+                markdown.write(f"# {pdf_path.stem}\n\n")
+                markdown.write("*Generated by PDF Converter Tool - Full Page Images*\n\n")
+                markdown.write(f"**Total Pages:** {total_pages}\n\n")
+                markdown.write("---\n\n")
                 
-                # Add to markdown
-                relative_img_path = f"{images_dir.name}/{img_filename}"
-                markdown_content += f"## Page {page_num + 1}\n\n"
-                markdown_content += f"![Page {page_num + 1}]({relative_img_path})\n\n"
-                markdown_content += "---\n\n"
-                
-                console.print(f"[green]Converted page {page_num + 1}/{len(images)}[/green]")
-            
-            # Save markdown file
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                # Stream pages in bounded windows (good quality but not too large)
+                pages = iter_document_pages(pdf_path, dpi=200, window_size=self.raster_window_size,
+                                            backend=self.raster_backend)
+                skipped = []
+                for page_number, image in fill_skipped_pages(pages, range(1, total_pages + 1)):
+                    page_num = page_number - 1
+                    markdown.write(f"## Page {page_num + 1}\n\n")
+                    
+                    if image is None:
+                        # Render failed: keep the page's slot so numbering stays intact
+                        markdown.write(SKIPPED_PAGE_PLACEHOLDER.format(page=page_num + 1) + "\n\n")
+                        markdown.end_page()
+                        skipped.append(page_num + 1)
+                        continue
+                    
+                    # Save page as image (encoded on a thread pool)
+                    img_filename = encoder.submit(image, images_dir, f"page_{page_num + 1}")
+                    
+                    # Add to markdown
+                    relative_img_path = f"{images_dir.name}/{img_filename}"
+                    markdown.write(f"![Page {page_num + 1}]({relative_img_path})\n\n")
+                    markdown.end_page()
+                    
+                    console.print(f"[green]Converted page {page_num + 1}/{total_pages}[/green]")
             
-            return True, f"Converted {len(images)} pages to images"
+            converted = total_pages - len(skipped)
+            return True, f"Converted {converted}/{total_pages} pages to images{format_skipped_pages(skipped)}"
             
         except Exception as e:
             return False, f"pdf2image conversion failed: {str(e)}"
     
-    def extract_hybrid_method(self, pdf_path: Path, output_md_path: Path) -> Tuple[bool, str]:
+    def extract_hybrid_method(self, pdf_path: Path, output_md_path: Path,
+                              profile: Optional[DocumentProfile] = None) -> Tuple[bool, str]:
         """
         Hybrid method: PyMuPDF untuk teks + pdf2image untuk halaman yang tidak ada teks
+        
+        Args:
+            profile: DocumentProfile yang sudah dihitung (dibuat jika None)
         """
         try:
-            doc = fitz.open(str(pdf_path))
+            profile = ensure_profile(pdf_path, profile)
             
             # Buat folder untuk gambar
             images_dir = output_md_path.parent / f"{output_md_path.stem}_images"
             images_dir.mkdir(exist_ok=True)
             
-            markdown_content = f"# {pdf_path.stem}\n\n"
-            markdown_content += "*Generated by PDF Converter Tool - Hybrid Method*\n\n"
-            markdown_content += "---\n\n"
-            
-            total_images = 0
-            pages_with_little_text = []
-            
-            # First pass: identify pages with little text
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                page_text = page.get_text().strip()
+            with MarkdownWriter(output_md_path) as markdown, \
+                    ImageEncoder(self.image_codec, self.image_quality) as encoder:
+                markdown.write(f"# {pdf_path.stem}\n\n")
+                markdown.write("*Generated by PDF Converter Tool - Hybrid Method*\n\n")
+                markdown.write("---\n\n")
                 
-                if len(page_text) < 100:  # Less than 100 characters
-                    pages_with_little_text.append(page_num)
-            
-            doc.close()
-            
-            # Convert text-poor pages to images
-            if pages_with_little_text and PDF2IMAGE_AVAILABLE:
-                console.print(f"[blue]Converting {len(pages_with_little_text)} pages with little text to images...[/blue]")
+                total_images = 0
                 
-                try:
-                    # Convert specific pages to images
-                    page_images = convert_from_path(
-                        str(pdf_path),
-                        dpi=200,
-                        first_page=min(pages_with_little_text) + 1,
-                        last_page=max(pages_with_little_text) + 1
-                    )
+                # Pages without usable text (scans, drawings) come from the profile's labels
+                pages_with_little_text = [page_number - 1 for page_number in profile.low_text_pages()]
+                
+                # Convert text-poor pages to images
+                if pages_with_little_text and RASTERIZER_AVAILABLE:
+                    console.print(f"[blue]Converting {len(pages_with_little_text)} pages with little text to images...[/blue]")
+                    
+                    try:
+                        # Render only the text-poor pages
+                        page_image_dict = {}
+                        pages = render_pages(pdf_path, [page_num + 1 for page_num in pages_with_little_text],
+                                             dpi=200, window_size=self.raster_window_size,
+                                             backend=self.raster_backend)
+                        for page_number, image in pages:
+                            page_image_dict[page_number - 1] = image
                     
+                    except Exception as e:
+                        console.print(f"[yellow]Warning: Could not convert pages to images: {e}[/yellow]")
+                        page_image_dict = {}
+                else:
                     page_image_dict = {}
-                    img_index = 0
-                    for page_num in range(min(pages_with_little_text), max(pages_with_little_text) + 1):
-                        if page_num in pages_with_little_text:
-                            page_image_dict[page_num] = page_images[img_index]
-                            img_index += 1
                 
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Could not convert pages to images: {e}[/yellow]")
-                    page_image_dict = {}
-            else:
-                page_image_dict = {}
-            
-            # Second pass: generate markdown
-            doc = fitz.open(str(pdf_path))
-            
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                markdown_content += f"## Page {page_num + 1}\n\n"
+                # Second pass: generate markdown
+                doc = open_fitz(pdf_path)
+                image_store = ImageStore(images_dir, self.image_passthrough)  # Repeated images are written once
                 
-                if page_num in pages_with_little_text and page_num in page_image_dict:
-                    # Save page as image
-                    img_filename = f"page_{page_num + 1}.png"
-                    img_path = images_dir / img_filename
-                    page_image_dict[page_num].save(str(img_path), "PNG", optimize=True)
-                    
-                    # Add image to markdown
-                    relative_img_path = f"{images_dir.name}/{img_filename}"
-                    markdown_content += f"![Page {page_num + 1}]({relative_img_path})\n\n"
-                    total_images += 1
-                else:
-                    # Extract text
-                    page_text = page.get_text()
-                    if page_text.strip():
-                        markdown_content += page_text + "\n\n"
+                for page_num in range(len(doc)):
+                    page = doc.load_page(page_num)
+                    markdown.write(f"## Page {page_num + 1}\n\n")
                     
-                    # Extract embedded images
-                    image_list = page.get_images(full=True)
-                    for img_index, img in enumerate(image_list):
-                        try:
-                            xref = img[0]
-                            pix = fitz.Pixmap(doc, xref)
-                            
-                            if pix.n - pix.alpha < 4:
-                                img_filename = f"page_{page_num + 1}_img_{img_index + 1}.png"
-                                img_path = images_dir / img_filename
-                                pix.save(str(img_path))
+                    if page_num in pages_with_little_text and page_num in page_image_dict:
+                        # Save page as image
+                        img_filename = encoder.submit(page_image_dict.pop(page_num), images_dir,
+                                                      f"page_{page_num + 1}")
+                        
+                        # Add image to markdown
+                        relative_img_path = f"{images_dir.name}/{img_filename}"
+                        markdown.write(f"![Page {page_num + 1}]({relative_img_path})\n\n")
+                        total_images += 1
+                    else:
+                        # Extract text
+                        page_text = page.get_text()
+                        if page_text.strip():
+                            markdown.write(page_text + "\n\n")
+                        
+                        # Extract embedded images
+                        image_list = page.get_images(full=True)
+                        for img_index, img in enumerate(image_list):
+                            try:
+                                img_filename = image_store.extract(
+                                    doc, img[0], f"page_{page_num + 1}_img_{img_index + 1}.png",
+                                    accept=lambda pix: pix.n - pix.alpha < 4
+                                )
                                 
-                                relative_img_path = f"{images_dir.name}/{img_filename}"
-                                markdown_content += f"![Image from Page {page_num + 1}]({relative_img_path})\n\n"
-                                total_images += 1
-                            
-                            pix = None
-                        except:
-                            pass
+                                if img_filename:
+                                    relative_img_path = f"{images_dir.name}/{img_filename}"
+                                    markdown.write(f"![Image from Page {page_num + 1}]({relative_img_path})\n\n")
+                                    total_images += 1
+                            except:
+                                pass
+                    
+                    markdown.end_page()
                 
-                markdown_content += "---\n\n"
-            
-            doc.close()
+                total_pages = len(doc)
+                doc.close()
             
-            # Save markdown file
-            with open(output_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            return True, f"Hybrid extraction: {total_images} images, text from {len(doc) - len(pages_with_little_text)} pages"
+            return True, f"Hybrid extraction: {total_images} images, text from {total_pages - len(pages_with_little_text)} pages"
             
         except Exception as e:
             return False, f"Hybrid extraction failed: {str(e)}"
     
-    def convert_pdf_to_markdown_with_images(self, pdf_path: Path, method: str = "auto") -> Tuple[bool, str, Path]:
+    def convert_pdf_to_markdown_with_images(self, pdf_path: PDFInput, method: str = "auto",
+                                            profile: Optional[DocumentProfile] = None) -> Tuple[bool, str, Path]:
         """
         Convert PDF to Markdown dengan gambar
         
         Args:
-            pdf_path: Path ke PDF file
+            pdf_path: Path ke PDF file, PDFSource, atau bytes/file object PDF
             method: "auto", "pymupdf", "pdf2image", "hybrid"
+            profile: DocumentProfile yang dipakai ulang oleh hybrid method
             
         Returns:
             (success, message, output_path)
         """
         
-        # Tentukan output path
-        output_md_path = self.output_dir / f"{pdf_path.stem}.md"
-        
-        if method == "auto":
-            # Try hybrid method first, then others
-            if "pymupdf_text_and_images" in self.available_methods and "pdf2image_full_pages" in self.available_methods:
-                success, msg = self.extract_hybrid_method(pdf_path, output_md_path)
-                if success:
-                    return True, msg, output_md_path
+        with open_source(pdf_path) as source:
+            # Tentukan output path (one open PDF shared by every method below)
+            output_md_path = self.output_dir / f"{source.stem}.md"
             
-            # Try PyMuPDF
-            if "pymupdf_text_and_images" in self.available_methods:
-                success, msg = self.extract_with_pymupdf(pdf_path, output_md_path)
-                if success:
-                    return True, msg, output_md_path
+            if method == "auto":
+                # Try hybrid method first, then others
+                if "pymupdf_text_and_images" in self.available_methods and "pdf2image_full_pages" in self.available_methods:
+                    success, msg = self.extract_hybrid_method(source, output_md_path, profile)
+                    if success:
+                        return True, msg, output_md_path
             
-            # Try pdf2image
-            if "pdf2image_full_pages" in self.available_methods:
-                success, msg = self.extract_with_pdf2image(pdf_path, output_md_path)
-                if success:
-                    return True, msg, output_md_path
+                # Try PyMuPDF
+                if "pymupdf_text_and_images" in self.available_methods:
+                    success, msg = self.extract_with_pymupdf(source, output_md_path)
+                    if success:
+                        return True, msg, output_md_path
             
-            return False, "No extraction methods available", output_md_path
-        
-        elif method == "pymupdf":
-            success, msg = self.extract_with_pymupdf(pdf_path, output_md_path)
-            return success, msg, output_md_path
-        
-        elif method == "pdf2image":
-            success, msg = self.extract_with_pdf2image(pdf_path, output_md_path)
-            return success, msg, output_md_path
-        
-        elif method == "hybrid":
-            success, msg = self.extract_hybrid_method(pdf_path, output_md_path)
-            return success, msg, output_md_path
-        
-        else:
-            return False, f"Unknown method: {method}", output_md_path
+                # Try pdf2image
+                if "pdf2image_full_pages" in self.available_methods:
+                    success, msg = self.extract_with_pdf2image(source, output_md_path)
+                    if success:
+                        return True, msg, output_md_path
+            
+                return False, "No extraction methods available", output_md_path
+            
+            elif method == "pymupdf":
+                success, msg = self.extract_with_pymupdf(source, output_md_path)
+                return success, msg, output_md_path
+            
+            elif method == "pdf2image":
+                success, msg = self.extract_with_pdf2image(source, output_md_path)
+                return success, msg, output_md_path
+            
+            elif method == "hybrid":
+                success, msg = self.extract_hybrid_method(source, output_md_path, profile)
+                return success, msg, output_md_path
+            
+            else:
+                return False, f"Unknown method: {method}", output_md_path
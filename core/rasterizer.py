@@ -0,0 +1,308 @@
+"""
+Page Rasterizer
+===============
+
+Render halaman PDF menjadi gambar PIL dalam satu kali jalan lewat backend
+yang bisa dipilih per run. Backend "pymupdf" me-render langsung di proses
+ini tanpa subprocess atau file sementara; backend "pdf2image" (fallback)
+menggabungkan halaman yang berurutan menjadi satu range sehingga PDF tidak
+di-parse ulang untuk setiap halaman.
+
+pdf_path boleh berupa PDFSource (lihat pdf_source.py): PyMuPDF me-render
+dari buffer yang sama dengan processor, pdf2image memakai path file-nya
+(atau convert_from_bytes untuk PDF yang hanya ada di memory).
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Import libraries dengan fallback
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    from pdf2image import convert_from_path, convert_from_bytes, pdfinfo_from_path, pdfinfo_from_bytes
+    PDF2IMAGE_AVAILABLE = True
+except ImportError:
+    PDF2IMAGE_AVAILABLE = False
+
+try:
+    from rich.console import Console
+    console = Console()
+except ImportError:
+    class Console:
+        def print(self, *args, **kwargs):
+            print(*args)
+    console = Console()
+
+try:
+    from .tracing import span
+    from .pdf_source import as_source, open_fitz, source_path
+except ImportError:
+    from tracing import span
+    from pdf_source import as_source, open_fitz, source_path
+
+RASTERIZER_AVAILABLE = (PYMUPDF_AVAILABLE and PIL_AVAILABLE) or PDF2IMAGE_AVAILABLE
+
+# Maximum number of decoded pages held in memory at once by pdf2image
+DEFAULT_WINDOW_SIZE = 8
+
+# Written in place of a page that could not be rendered
+SKIPPED_PAGE_PLACEHOLDER = "*[Page {page} could not be rendered]*"
+
+
+def coalesce_page_ranges(page_numbers: Iterable[int]) -> List[Tuple[int, int]]:
+    """
+    Gabungkan nomor halaman menjadi range (first, last) yang berurutan
+
+    Contoh: [1, 2, 3, 7, 8, 10] -> [(1, 3), (7, 8), (10, 10)]
+    """
+    ranges: List[Tuple[int, int]] = []
+
+    for page_num in sorted(set(page_numbers)):
+        if ranges and page_num == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], page_num)
+        else:
+            ranges.append((page_num, page_num))
+
+    return ranges
+
+
+def split_into_windows(ranges: List[Tuple[int, int]], window_size: int) -> List[Tuple[int, int]]:
+    """
+    Pecah range halaman menjadi window dengan paling banyak window_size halaman
+
+    Contoh: [(1, 10)] dengan window 4 -> [(1, 4), (5, 8), (9, 10)]
+    """
+    window_size = max(1, window_size)
+    windows = []
+
+    for first_page, last_page in ranges:
+        for window_start in range(first_page, last_page + 1, window_size):
+            windows.append((window_start, min(window_start + window_size - 1, last_page)))
+
+    return windows
+
+
+def count_pages(pdf_path: Path) -> int:
+    """Jumlah halaman PDF (Path atau PDFSource) tanpa me-render apapun"""
+    if PYMUPDF_AVAILABLE:
+        doc = open_fitz(pdf_path)
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+
+    if PDF2IMAGE_AVAILABLE:
+        path = source_path(pdf_path)
+        if path is None:
+            return int(pdfinfo_from_bytes(as_source(pdf_path).buffer.tobytes())['Pages'])
+        return int(pdfinfo_from_path(str(path))['Pages'])
+
+    raise RuntimeError("No rasterizer available (install PyMuPDF or pdf2image)")
+
+
+class RasterBackend(ABC):
+    """
+    Interface backend rasterizer
+
+    Subclass wajib mengimplementasikan is_available() dan render() yang
+    menerima nomor halaman (1-based, sudah terurut dan unik) dan yield
+    (page_num, image); backend yang belum lengkap gagal saat dibuat.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        """True jika dependency backend ini terpasang"""
+
+    @abstractmethod
+    def render(self, pdf_path: Path, page_numbers: List[int], dpi: int,
+               window_size: int) -> Iterator[Tuple[int, "Image.Image"]]:
+        """Yield (page_num, image) untuk setiap halaman yang berhasil di-render"""
+
+
+class PyMuPDFBackend(RasterBackend):
+    """Render in-process with PyMuPDF (no subprocess, no temp files)"""
+
+    name = "pymupdf"
+
+    def is_available(self) -> bool:
+        return PYMUPDF_AVAILABLE and PIL_AVAILABLE
+
+    def render(self, pdf_path: Path, page_numbers: List[int], dpi: int,
+               window_size: int) -> Iterator[Tuple[int, "Image.Image"]]:
+        # One page is decoded at a time, so window_size does not apply here
+        doc = open_fitz(pdf_path)
+        try:
+            for page_num in page_numbers:
+                try:
+                    with span("rasterize", backend=self.name, page=page_num, dpi=dpi):
+                        pix = doc.load_page(page_num - 1).get_pixmap(dpi=dpi, alpha=False)
+                        image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                        pix = None
+                except Exception as e:
+                    console.print(f"[yellow]Failed to render page {page_num}: {e}[/yellow]")
+                    continue
+
+                yield page_num, image
+        finally:
+            doc.close()
+
+
+class Pdf2ImageBackend(RasterBackend):
+    """Render with pdf2image, one pdftoppm call per window of consecutive pages"""
+
+    name = "pdf2image"
+
+    def is_available(self) -> bool:
+        return PDF2IMAGE_AVAILABLE
+
+    def render(self, pdf_path: Path, page_numbers: List[int], dpi: int,
+               window_size: int) -> Iterator[Tuple[int, "Image.Image"]]:
+        path = source_path(pdf_path)
+        # pdftoppm only reads files: pdf2image spills an in-memory PDF to a temp file
+        pdf_bytes = as_source(pdf_path).buffer.tobytes() if path is None else None
+
+        for first_page, last_page in split_into_windows(coalesce_page_ranges(page_numbers), window_size):
+            try:
+                with span("rasterize", backend=self.name, first_page=first_page,
+                          last_page=last_page, dpi=dpi):
+                    if pdf_bytes is not None:
+                        images = convert_from_bytes(pdf_bytes, dpi=dpi, first_page=first_page,
+                                                    last_page=last_page)
+                    else:
+                        images = convert_from_path(
+                            str(path),
+                            dpi=dpi,
+                            first_page=first_page,
+                            last_page=last_page
+                        )
+            except Exception as e:
+                console.print(f"[yellow]Failed to render pages {first_page}-{last_page}: {e}[/yellow]")
+                continue
+
+            # Hand pages over one by one and drop our references so a window is
+            # freed as soon as the consumer is done with it.
+            images.reverse()
+            page_num = first_page
+            while images:
+                yield page_num, images.pop()
+                page_num += 1
+
+
+# Registered backends in order of preference for "auto"
+BACKENDS: Dict[str, RasterBackend] = {
+    backend.name: backend for backend in (PyMuPDFBackend(), Pdf2ImageBackend())
+}
+
+BACKEND_CHOICES = ("auto",) + tuple(BACKENDS)
+
+
+def available_backends() -> List[str]:
+    """Nama backend yang bisa dipakai di environment ini"""
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+def get_backend(name: str = "auto") -> RasterBackend:
+    """
+    Pilih backend rasterizer
+
+    Args:
+        name: "auto" (PyMuPDF jika ada, lalu pdf2image) atau nama backend
+
+    Raises:
+        ValueError: Nama backend tidak dikenal
+        RuntimeError: Backend yang diminta (atau semua backend) tidak tersedia
+    """
+    name = (name or "auto").lower()
+
+    if name == "auto":
+        for backend in BACKENDS.values():
+            if backend.is_available():
+                return backend
+        raise RuntimeError("No rasterizer available (install PyMuPDF or pdf2image)")
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown raster backend '{name}' (choose from {', '.join(BACKEND_CHOICES)})")
+
+    backend = BACKENDS[name]
+    if not backend.is_available():
+        raise RuntimeError(f"Raster backend '{name}' is not available")
+    return backend
+
+
+def render_pages(pdf_path: Path, page_numbers: Iterable[int], dpi: int = 150,
+                 window_size: int = DEFAULT_WINDOW_SIZE,
+                 backend: str = "auto") -> Iterator[Tuple[int, "Image.Image"]]:
+    """
+    Render sekumpulan halaman PDF dan yield hasilnya satu per satu
+
+    Args:
+        pdf_path: Path ke file PDF atau PDFSource
+        page_numbers: Nomor halaman (1-based, seperti pdf2image)
+        dpi: Resolusi render
+        window_size: Maksimum halaman yang di-render sekaligus (pdf2image);
+            PyMuPDF selalu me-render satu halaman per langkah
+        backend: Nama backend ("auto", "pymupdf" atau "pdf2image")
+
+    Yields:
+        (page_num, image) urut berdasarkan nomor halaman. Halaman yang gagal
+        di-render dilewati dengan warning (lihat fill_skipped_pages).
+    """
+    pages = sorted(set(page_numbers))
+    if not pages:
+        return
+
+    yield from get_backend(backend).render(pdf_path, pages, dpi, window_size)
+
+
+def fill_skipped_pages(pages: Iterable[Tuple[int, "Image.Image"]],
+                       page_numbers: Iterable[int]) -> Iterator[Tuple[int, Optional["Image.Image"]]]:
+    """
+    Beri slot (page_num, None) untuk halaman yang dilewati rasterizer
+
+    render_pages() melewati halaman yang gagal di-render; consumer yang
+    menulis satu section per halaman memakai ini supaya halaman tersebut
+    tetap muncul (sebagai placeholder) dan nomor halaman tidak bergeser.
+    """
+    rendered = iter(pages)
+    upcoming = next(rendered, None)
+
+    for page_num in sorted(set(page_numbers)):
+        if upcoming is not None and upcoming[0] == page_num:
+            yield upcoming
+            upcoming = next(rendered, None)
+        else:
+            yield page_num, None
+
+
+def format_skipped_pages(skipped: Iterable[int]) -> str:
+    """Ringkasan halaman yang gagal di-render untuk pesan hasil, '' jika tidak ada"""
+    skipped = sorted(skipped)
+    if not skipped:
+        return ""
+    return f" ({len(skipped)} pages could not be rendered: {', '.join(str(page_num) for page_num in skipped)})"
+
+
+def iter_document_pages(pdf_path: Path, dpi: int = 150,
+                        window_size: int = DEFAULT_WINDOW_SIZE,
+                        backend: str = "auto") -> Iterator[Tuple[int, "Image.Image"]]:
+    """
+    Stream semua halaman dokumen dalam window terbatas
+
+    Peak memory bergantung pada window_size, bukan jumlah halaman. Consumer
+    sebaiknya tidak menyimpan gambar setelah selesai memprosesnya.
+    """
+    yield from render_pages(pdf_path, range(1, count_pages(pdf_path) + 1), dpi, window_size, backend)
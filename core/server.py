@@ -0,0 +1,549 @@
+"""
+Conversion Daemon
+=================
+
+Server lokal yang menjaga PDFConverter dan processor-nya tetap "hangat"
+sehingga setiap dokumen tidak lagi membayar startup Python, import
+rich/PyMuPDF/PyPDF2 dan pengecekan pandoc. Job diterima lewat HTTP (TCP
+atau Unix socket), dijalankan di pool proses worker, dan hasilnya bisa
+ditunggu langsung atau di-poll dengan job ID.
+
+Endpoint:
+    GET    /health          status server, jumlah job per status dan tool eksternal
+    GET    /formats         format output yang didukung
+    POST   /jobs            {"path": "...", "format": "md", "options": [], "wait": false}
+    POST   /jobs?format=md&name=x.pdf&wait=1
+                            PDF mentah di body (Content-Type: application/pdf),
+                            opsi pandoc sebagai parameter option= berulang
+    GET    /jobs            semua job yang masih disimpan
+    GET    /jobs/<id>       status satu job
+    DELETE /jobs/<id>       batalkan job yang belum berjalan
+
+PDF yang di-upload dikirim ke worker lewat pipe process pool dan dibaca
+langsung dari memory (PDFSource); PDF-nya tidak pernah ditulis ke disk,
+hanya hasil konversinya. Output upload diberi nama <stem>-<job id>, jadi
+upload dengan nama yang sama tidak saling menimpa.
+
+Server tidak memakai autentikasi dan membaca file berdasarkan path dari
+client, jadi hanya untuk dipakai secara lokal (default 127.0.0.1).
+"""
+
+import json
+import os
+import socketserver
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    from rich.console import Console
+    console = Console()
+except ImportError:
+    class Console:
+        def print(self, *args, **kwargs):
+            print(*args)
+    console = Console()
+
+try:
+    from .page_parallel import resolve_workers
+    from .utils import check_pandoc_installation, MAX_PDF_SIZE_MB
+    from .tools import tool_registry
+    from .pdf_source import PDFSource, DEFAULT_NAME
+    from .tracing import tracer
+except ImportError:
+    from page_parallel import resolve_workers
+    from utils import check_pandoc_installation, MAX_PDF_SIZE_MB
+    from tools import tool_registry
+    from pdf_source import PDFSource, DEFAULT_NAME
+    from tracing import tracer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Finished jobs kept for polling before the oldest are forgotten
+MAX_FINISHED_JOBS = 1000
+
+# Largest JSON request body accepted (bytes)
+MAX_REQUEST_SIZE = 1024 * 1024
+
+# Largest PDF upload accepted (bytes), same limit as files on disk
+MAX_UPLOAD_SIZE = MAX_PDF_SIZE_MB * 1024 * 1024
+
+
+class RequestTooLarge(ValueError):
+    """Content-Length melebihi batas; dijawab 413 tanpa membaca body"""
+
+
+# Converter instance owned by each worker process (see _init_worker)
+_worker_converter = None
+
+
+def _init_worker(converter_config: Dict[str, Any], trace_path: Optional[Path] = None) -> None:
+    """Buat PDFConverter sekali per proses worker (dan ikut menulis trace, jika aktif)"""
+    global _worker_converter
+    try:
+        from .converter import PDFConverter
+    except ImportError:
+        from converter import PDFConverter
+
+    # A forked worker already traces to the inherited file; a spawned one opens it
+    if trace_path is not None and not tracer.enabled:
+        tracer.configure(trace_path)
+    _worker_converter = PDFConverter(**converter_config)
+
+
+def _run_job(input_file: Union[str, bytes], output_format: str,
+             custom_options: Optional[List[str]], name: Optional[str] = None) -> Dict[str, Any]:
+    """Jalankan satu konversi di proses worker (input path atau bytes PDF hasil upload)"""
+    start = time.perf_counter()
+    try:
+        source = PDFSource(input_file, name) if isinstance(input_file, bytes) else Path(input_file)
+        output = _worker_converter.convert_pdf(source, output_format, custom_options)
+        error = None if output else "conversion failed"
+    except Exception as e:
+        output, error = None, f"{type(e).__name__}: {e}"
+
+    return {
+        'output': str(output) if output else None,
+        'error': error,
+        'elapsed': time.perf_counter() - start,
+    }
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+class JobManager:
+    """
+    Antrian job konversi di atas pool proses worker yang tetap hidup
+    """
+
+    def __init__(self, converter, jobs: int = 1, max_finished: int = MAX_FINISHED_JOBS):
+        """
+        Args:
+            converter: PDFConverter yang konfigurasinya dipakai oleh worker
+            jobs: Jumlah konversi bersamaan (0 = semua core)
+            max_finished: Jumlah job selesai yang tetap bisa di-poll
+        """
+        self.jobs = resolve_workers(jobs)
+        self.supported_formats = dict(converter.supported_formats)
+        self.max_finished = max_finished
+        self._worker_config = converter.get_worker_config()
+        self._executor = self._create_executor()
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._futures: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                   initargs=(self._worker_config, tracer.output_path))
+
+    def warm_up(self) -> None:
+        """Start semua worker sekarang, bukan saat job pertama datang"""
+        futures = [self._executor.submit(_warm_up) for _ in range(self.jobs)]
+        for future in futures:
+            future.result()
+
+    def submit(self, input_file: Union[Path, bytes], output_format: str,
+               custom_options: Optional[List[str]] = None,
+               name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Masukkan job ke antrian
+
+        Args:
+            input_file: Path PDF di mesin server, atau bytes PDF hasil upload
+            output_format: Format output
+            custom_options: Opsi pandoc tambahan
+            name: Nama dokumen upload; file output diberi nama <stem>-<job id>
+
+        Returns:
+            Snapshot job (status 'queued')
+
+        Raises:
+            ValueError: Format tidak didukung, file tidak ada atau upload kosong
+            BrokenProcessPool: Worker mati; pool sudah dibuat ulang, job tidak
+                dimasukkan dan bisa dikirim lagi
+        """
+        job_id = uuid.uuid4().hex[:12]
+        upload = isinstance(input_file, (bytes, bytearray, memoryview))
+        if upload:
+            payload = bytes(input_file)
+            # Only the base name is used so an upload cannot write outside the output dir
+            job_input = Path(name or DEFAULT_NAME).name or DEFAULT_NAME
+            # Outputs are named after the document: uploads that share a name
+            # must not overwrite each other's results
+            upload_name = Path(job_input)
+            name = f"{upload_name.stem}-{job_id}{upload_name.suffix or '.pdf'}"
+        else:
+            input_file = Path(input_file).expanduser().resolve()
+            payload = job_input = str(input_file)
+
+        if output_format not in self.supported_formats:
+            raise ValueError(f"Format '{output_format}' tidak didukung")
+        if upload and not payload:
+            raise ValueError("PDF upload kosong")
+        if not upload and not input_file.is_file():
+            raise ValueError(f"File tidak ditemukan: {input_file}")
+
+        job = {
+            'id': job_id,
+            'status': 'queued',
+            'input': job_input,
+            'format': output_format,
+            'options': custom_options or [],
+            'output': None,
+            'error': None,
+            'submitted': time.time(),
+            'finished': None,
+            'elapsed': None,
+        }
+
+        with self._lock:
+            try:
+                future = self._executor.submit(_run_job, payload, output_format, custom_options, name)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed by the OOM killer); every later submit
+                # would fail too, so start a fresh pool for the next request
+                console.print("[red]Worker pool broken, restarting workers[/red]")
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+                raise
+            self._jobs[job_id] = job
+            self._futures[job_id] = future
+        future.add_done_callback(lambda done, job_id=job_id: self._finish(job_id, done))
+
+        return self.get(job_id)
+
+    def _finish(self, job_id: str, future) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            self._futures.pop(job_id, None)
+            if job is None:
+                return
+
+            if future.cancelled():
+                job['status'] = 'cancelled'
+            elif future.exception() is not None:
+                job['status'] = 'failed'
+                job['error'] = f"{type(future.exception()).__name__}: {future.exception()}"
+            else:
+                result = future.result()
+                job.update(result)
+                job['status'] = 'done' if result['output'] else 'failed'
+            job['finished'] = time.time()
+
+            self._prune()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job['finished'] is not None]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Snapshot satu job, None jika tidak dikenal"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            snapshot = dict(job)
+            future = self._futures.get(job_id)
+
+        if snapshot['status'] == 'queued' and future is not None and future.running():
+            snapshot['status'] = 'running'
+        return snapshot
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            job_ids = list(self._jobs)
+        return [job for job in map(self.get, job_ids) if job is not None]
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Tunggu job selesai (atau timeout) dan kembalikan snapshot-nya"""
+        with self._lock:
+            future = self._futures.get(job_id)
+
+        if future is not None:
+            try:
+                future.exception(timeout=timeout)
+            except Exception:
+                pass
+
+            # The done callback may still be running in the executor thread
+            deadline = time.monotonic() + 1.0
+            while future.done() and time.monotonic() < deadline:
+                job = self.get(job_id)
+                if job is None or job['finished'] is not None:
+                    break
+                time.sleep(0.01)
+
+        return self.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Batalkan job yang belum mulai berjalan"""
+        with self._lock:
+            future = self._futures.get(job_id)
+        return future is not None and future.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for job in self.list_jobs():
+            counts[job['status']] = counts.get(job['status'], 0) + 1
+        return counts
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """Handler JSON untuk API job (server.job_manager dipakai bersama)"""
+
+    server_version = "PDFConverterDaemon/1.0"
+
+    def do_GET(self):
+        parts = self._path_parts()
+        manager = self.server.job_manager
+
+        if parts == ['health']:
+            self._send_json(HTTPStatus.OK, {
+                'status': 'ok',
+                'pid': os.getpid(),
+                'workers': manager.jobs,
+                'jobs': manager.stats(),
+                'tools': tool_registry.status(),
+            })
+        elif parts == ['formats']:
+            self._send_json(HTTPStatus.OK, manager.supported_formats)
+        elif parts == ['jobs']:
+            self._send_json(HTTPStatus.OK, {'jobs': manager.list_jobs()})
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            job = manager.get(parts[1])
+            if job is None:
+                self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job '{parts[1]}'")
+            else:
+                self._send_json(HTTPStatus.OK, job)
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown endpoint '{self.path}'")
+
+    def do_POST(self):
+        if self._path_parts() != ['jobs']:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown endpoint '{self.path}'")
+            return
+
+        try:
+            if self._content_type() == 'application/pdf':
+                request = self._read_upload()
+                timeout = self._parse_timeout(request)
+                job = self.server.job_manager.submit(request['data'], request['format'],
+                                                     request['options'], name=request['name'])
+            else:
+                request = self._read_json()
+                path = request.get('path')
+                options = request.get('options') or []
+                if not isinstance(path, str) or not path:
+                    raise ValueError("'path' is required")
+                if not isinstance(options, list) or not all(isinstance(option, str) for option in options):
+                    raise ValueError("'options' must be a list of strings")
+                timeout = self._parse_timeout(request)
+
+                job = self.server.job_manager.submit(Path(path), request.get('format', 'md'), options)
+        except RequestTooLarge as e:
+            self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, str(e))
+            return
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        except BrokenProcessPool:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE,
+                             "Worker pool crashed and was restarted, submit the job again")
+            return
+
+        if request.get('wait'):
+            job = self.server.job_manager.wait(job['id'], timeout)
+            self._send_json(HTTPStatus.OK, job)
+        else:
+            self._send_json(HTTPStatus.ACCEPTED, job, headers={'Location': f"/jobs/{job['id']}"})
+
+    def do_DELETE(self):
+        parts = self._path_parts()
+        if len(parts) != 2 or parts[0] != 'jobs':
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown endpoint '{self.path}'")
+            return
+
+        manager = self.server.job_manager
+        if manager.get(parts[1]) is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job '{parts[1]}'")
+        elif manager.cancel(parts[1]):
+            self._send_json(HTTPStatus.OK, manager.wait(parts[1], timeout=1.0))
+        else:
+            self._send_error(HTTPStatus.CONFLICT, "Job already running or finished")
+
+    def _path_parts(self) -> List[str]:
+        return [part for part in self.path.split('?', 1)[0].split('/') if part]
+
+    def _content_length(self, limit: int, too_large: str) -> int:
+        """Content-Length yang sudah divalidasi, dicek sebelum body dibaca"""
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            raise ValueError("Invalid Content-Length header")
+        if length < 0:
+            # rfile.read(-1) would block until the client closes the connection
+            raise ValueError("Invalid Content-Length header")
+        if length > limit:
+            raise RequestTooLarge(too_large)
+        return length
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = self._content_length(MAX_REQUEST_SIZE, "Request body too large")
+
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if not isinstance(request, dict):
+            raise ValueError("Request body must be a JSON object")
+        return request
+
+    @staticmethod
+    def _parse_timeout(request: Dict[str, Any]) -> Optional[float]:
+        """Timeout wait dalam detik (None = tunggu sampai selesai)"""
+        timeout = request.get('timeout')
+        if timeout is None or timeout == '':
+            return None
+        try:
+            timeout = float(timeout)
+        except (TypeError, ValueError):
+            raise ValueError("'timeout' must be a number of seconds")
+        if not timeout >= 0 or timeout == float('inf'):
+            raise ValueError("'timeout' must be a non-negative number of seconds")
+        return timeout
+
+    def _content_type(self) -> str:
+        return (self.headers.get('Content-Type') or '').split(';', 1)[0].strip().lower()
+
+    def _read_upload(self) -> Dict[str, Any]:
+        """Body PDF mentah; format, name, option, wait dan timeout dari query string"""
+        length = self._content_length(MAX_UPLOAD_SIZE, f"PDF upload too large (maximum {MAX_PDF_SIZE_MB}MB)")
+
+        query = parse_qs(urlsplit(self.path).query)
+        return {
+            'data': self.rfile.read(length),
+            'name': query.get('name', [DEFAULT_NAME])[-1],
+            'format': query.get('format', ['md'])[-1],
+            'options': query.get('option', []),
+            'wait': query.get('wait', [''])[-1].lower() in ('1', 'true', 'yes'),
+            'timeout': query.get('timeout', [None])[-1],
+        }
+
+    def _send_json(self, status: HTTPStatus, payload: Any,
+                   headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {'error': message})
+
+    def address_string(self) -> str:
+        # Unix socket clients have no (host, port) address
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ConversionHTTPServer(ThreadingHTTPServer):
+    """HTTP server di TCP (host, port)"""
+
+    daemon_threads = True
+
+    def __init__(self, address, job_manager: JobManager, verbose: bool = False):
+        self.job_manager = job_manager
+        self.verbose = verbose
+        super().__init__(address, ConversionRequestHandler)
+
+
+class ConversionUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server di Unix domain socket"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, job_manager: JobManager, verbose: bool = False):
+        self.job_manager = job_manager
+        self.verbose = verbose
+        self.socket_path = Path(socket_path)
+
+        # Remove a stale socket left by a previous run
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        super().__init__(str(self.socket_path), ConversionRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+
+def create_server(converter, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                  socket_path: Optional[Path] = None, jobs: int = 1,
+                  verbose: bool = False):
+    """
+    Buat server (belum berjalan) dengan JobManager yang sudah warm
+
+    Args:
+        converter: PDFConverter yang konfigurasinya dipakai oleh worker
+        host, port: Alamat TCP (diabaikan jika socket_path diisi)
+        socket_path: Path Unix socket
+        jobs: Jumlah konversi bersamaan (0 = semua core)
+        verbose: Log setiap request ke stderr
+    """
+    manager = JobManager(converter, jobs=jobs)
+    manager.warm_up()
+
+    try:
+        if socket_path:
+            return ConversionUnixServer(Path(socket_path), manager, verbose)
+        return ConversionHTTPServer((host, port), manager, verbose)
+    except Exception:
+        manager.shutdown(wait=False)
+        raise
+
+
+def serve(converter, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+          socket_path: Optional[Path] = None, jobs: int = 1, verbose: bool = False) -> None:
+    """Jalankan daemon sampai Ctrl+C"""
+    if not check_pandoc_installation():
+        console.print("[yellow]Warning: pandoc tidak ditemukan, hanya format md/md-hybrid/md-ocr yang akan berhasil[/yellow]")
+
+    server = create_server(converter, host, port, socket_path, jobs, verbose)
+    if socket_path:
+        address = f"unix:{socket_path}"
+    else:
+        address = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    console.print(f"[green]PDF Converter daemon listening on {address} "
+                  f"({server.job_manager.jobs} workers)[/green]")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Shutting down...[/yellow]")
+    finally:
+        server.server_close()
+        server.job_manager.shutdown(wait=False)
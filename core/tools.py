@@ -0,0 +1,140 @@
+"""
+External Tool Registry
+======================
+
+Probe binary eksternal (pandoc, tesseract) sekali per proses dan simpan
+hasilnya: tersedia atau tidak, path, versi, bahasa OCR dan format output.
+Konversi berikutnya memakai hasil cache sehingga batch ribuan file tidak
+lagi menjalankan `pandoc --version` / `tesseract --version` untuk setiap
+dokumen. Panggil invalidate() setelah menginstall atau mengganti tool.
+
+Contoh:
+    from tools import tool_registry
+
+    if tool_registry.is_available('tesseract'):
+        langs = tool_registry.get('tesseract')['languages']
+"""
+
+import shutil
+import subprocess
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+# Batas waktu satu probe (detik); binary yang hang dianggap tidak tersedia
+PROBE_TIMEOUT = 10
+
+
+def _run(args: List[str]) -> Optional[str]:
+    """Jalankan perintah probe dan kembalikan stdout+stderr, atau None jika gagal"""
+    try:
+        result = subprocess.run(args, capture_output=True, text=True, check=True,
+                                timeout=PROBE_TIMEOUT)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return None
+    # Older tesseract releases print their version on stderr
+    return (result.stdout or "") + (result.stderr or "")
+
+
+def _first_line(output: str) -> Optional[str]:
+    lines = [line.strip() for line in output.splitlines() if line.strip()]
+    return lines[0] if lines else None
+
+
+def _probe_pandoc(path: str) -> Dict[str, Any]:
+    output = _run([path, '--version'])
+    if output is None:
+        return {'available': False}
+    formats = _run([path, '--list-output-formats']) or ""
+    return {
+        'available': True,
+        'version': _first_line(output),
+        'output_formats': [line.strip() for line in formats.splitlines() if line.strip()],
+    }
+
+
+def _probe_tesseract(path: str) -> Dict[str, Any]:
+    output = _run([path, '--version'])
+    if output is None:
+        return {'available': False}
+    langs = _run([path, '--list-langs']) or ""
+    # First line is a header: 'List of available languages in "..." (N):'
+    languages = [line.strip() for line in langs.splitlines()[1:] if line.strip()]
+    return {
+        'available': True,
+        'version': _first_line(output),
+        'languages': languages,
+    }
+
+
+# name -> (binary, probe function)
+DEFAULT_PROBES: Dict[str, tuple] = {
+    'pandoc': ('pandoc', _probe_pandoc),
+    'tesseract': ('tesseract', _probe_tesseract),
+}
+
+
+class ToolRegistry:
+    """
+    Cache kemampuan tool eksternal per proses (thread-safe)
+
+    Setiap tool di-probe saat pertama kali ditanyakan; hasilnya dipakai
+    sampai invalidate() dipanggil.
+    """
+
+    def __init__(self, probes: Optional[Dict[str, tuple]] = None):
+        """
+        Args:
+            probes: name -> (binary, fungsi probe(path) -> dict); default pandoc dan tesseract
+        """
+        self.probes: Dict[str, tuple] = dict(DEFAULT_PROBES if probes is None else probes)
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, binary: str, probe: Callable[[str], Dict[str, Any]]) -> None:
+        """Tambahkan (atau ganti) tool yang bisa di-probe"""
+        with self._lock:
+            self.probes[name] = (binary, probe)
+            self._cache.pop(name, None)
+
+    def get(self, name: str) -> Dict[str, Any]:
+        """
+        Informasi tool: 'name', 'available', 'path', 'version' plus field khusus
+        tool ('output_formats' untuk pandoc, 'languages' untuk tesseract)
+        """
+        with self._lock:
+            info = self._cache.get(name)
+            if info is None:
+                info = self._probe(name)
+                self._cache[name] = info
+            return dict(info)
+
+    def is_available(self, name: str) -> bool:
+        return self.get(name)['available']
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Buang hasil probe satu tool (atau semua) supaya di-probe ulang"""
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(name, None)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Informasi semua tool yang terdaftar (di-probe jika belum)"""
+        return {name: self.get(name) for name in list(self.probes)}
+
+    def _probe(self, name: str) -> Dict[str, Any]:
+        if name not in self.probes:
+            raise KeyError(f"Unknown tool: {name}")
+        binary, probe = self.probes[name]
+
+        path = shutil.which(binary)
+        info: Dict[str, Any] = {'available': False}
+        # Skip the subprocess entirely when the binary is not on PATH
+        if path is not None:
+            info = probe(path)
+        return {'name': name, 'path': path, 'version': None, **info}
+
+
+# Registry global yang dipakai converter dan processor
+tool_registry = ToolRegistry()
@@ -0,0 +1,238 @@
+"""
+Pipeline Tracing
+================
+
+Timing terstruktur untuk pipeline konversi. Setiap span (dokumen, halaman
+atau stage seperti ekstraksi teks, rasterize, encode PNG, OCR, pandoc)
+ditulis sebagai satu baris JSON saat selesai:
+
+    {"name": "rasterize", "id": 12, "parent": 3, "start": 1718000000.12,
+     "duration": 0.041, "pid": 4242, "thread": "MainThread", "page": 7}
+
+Tracing nonaktif secara default dan span() kemudian hanya mengembalikan
+context manager kosong, jadi instrumentasi bisa dibiarkan di hot path.
+
+Trace ke file juga dicatat oleh proses worker (batch --jobs, daemon, shard
+page-parallel): semua proses menulis ke file yang sama lewat descriptor
+O_APPEND dengan satu write() per span, jadi baris dari beberapa proses
+tidak tercampur. Id span unik per proses (lihat field pid).
+Mode --profile membungkus satu run dengan cProfile dan mencetak fungsi
+yang paling mahal.
+"""
+
+import io
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+
+class _NullSpan:
+    """Span yang tidak mencatat apapun (tracing nonaktif)"""
+
+    id = None
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """Satu interval waktu yang ditulis ke tracer saat selesai"""
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional[int], attrs: dict):
+        self.tracer = tracer
+        self.name = name
+        self.id = next(tracer._ids)
+        self.parent = parent
+        self.attrs = attrs
+        self._start_wall = 0.0
+        self._start = 0.0
+
+    def set(self, **attrs: Any) -> None:
+        """Tambahkan atribut (misalnya jumlah karakter) sebelum span selesai"""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self._start_wall = time.time()
+        self._start = time.perf_counter()
+        self.tracer._push(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        duration = time.perf_counter() - self._start
+        self.tracer._pop(self)
+
+        if exc_type is not None:
+            self.attrs['error'] = f"{exc_type.__name__}: {exc_value}"
+
+        self.tracer._emit({
+            'name': self.name,
+            'id': self.id,
+            'parent': self.parent,
+            'start': self._start_wall,
+            'duration': duration,
+            'pid': os.getpid(),
+            'thread': threading.current_thread().name,
+            **self.attrs
+        })
+
+
+class Tracer:
+    """
+    Penulis span JSON lines (satu instance per proses, lihat `tracer`)
+
+    Trace ke file ikut dicatat oleh worker hasil fork (descriptor O_APPEND
+    yang diwarisi); worker spawn memanggil configure(output_path) sendiri.
+    Trace ke stream hanya dicatat di proses yang memanggil configure().
+    """
+
+    def __init__(self):
+        self._sink = None
+        self._path: Optional[Path] = None
+        self._fd: Optional[int] = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    @property
+    def enabled(self) -> bool:
+        return (self._sink is not None or self._fd is not None) and self._pid == os.getpid()
+
+    @property
+    def output_path(self) -> Optional[Path]:
+        """File trace aktif (diteruskan ke proses worker), None jika tidak ada"""
+        return self._path
+
+    def configure(self, output: Any) -> None:
+        """
+        Aktifkan tracing
+
+        Args:
+            output: Path file JSON lines atau stream yang bisa ditulis
+        """
+        self.close()
+        if isinstance(output, (str, Path)):
+            self._path = Path(output)
+            self._fd = os.open(str(self._path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        else:
+            self._sink = output
+        self._pid = os.getpid()
+
+    def _after_fork(self) -> None:
+        # Runs single-threaded in the child: the lock may have been held by a
+        # parent thread and the span stack belongs to the parent. The inherited
+        # O_APPEND descriptor keeps working; a stream sink is left to the parent.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sink = None
+        if self._fd is not None:
+            self._pid = os.getpid()
+
+    def close(self) -> None:
+        """Nonaktifkan tracing dan tutup file output"""
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._sink = None
+            self._path = None
+            self._fd = None
+
+    def current_span_id(self) -> Optional[int]:
+        """Id span yang sedang aktif di thread ini"""
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1].id if stack else None
+
+    def span(self, name: str, parent: Optional[int] = None, **attrs: Any):
+        """
+        Context manager untuk satu span
+
+        Args:
+            name: Nama span (document, page, rasterize, ocr, pandoc, ...)
+            parent: Id span induk; default span aktif di thread ini. Isi
+                secara eksplisit untuk pekerjaan di worker thread.
+            **attrs: Atribut tambahan (page, mode, format, ...)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        if parent is None:
+            parent = self.current_span_id()
+        return Span(self, name, parent, attrs)
+
+    def _push(self, span: Span) -> None:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        self._local.stack.append(span)
+
+    def _pop(self, span: Span) -> None:
+        stack = self._local.stack
+        if stack and stack[-1] is span:
+            stack.pop()
+
+    def _emit(self, record: dict) -> None:
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._fd is not None:
+                # One O_APPEND write per span: lines from other processes never interleave
+                os.write(self._fd, line.encode('utf-8'))
+            elif self._sink is not None:
+                self._sink.write(line)
+                self._sink.flush()
+
+
+# Process-wide tracer used by all processors
+tracer = Tracer()
+
+
+def span(name: str, parent: Optional[int] = None, **attrs: Any):
+    """Shortcut untuk tracer.span()"""
+    return tracer.span(name, parent, **attrs)
+
+
+@contextmanager
+def profile_run(output_path: Optional[Path] = None, limit: int = 25,
+                sort_by: str = 'cumulative', stream=None) -> Iterator["cProfile.Profile"]:
+    """
+    Jalankan blok kode di bawah cProfile dan cetak fungsi yang paling mahal
+
+    Args:
+        output_path: Jika diisi, statistik mentah disimpan (bisa dibuka
+            dengan pstats atau snakeviz)
+        limit: Jumlah fungsi yang ditampilkan
+        sort_by: Urutan pstats ('cumulative', 'tottime', ...)
+        stream: Tujuan ringkasan (default stdout)
+    """
+    # Only loaded when profiling is requested (keeps CLI startup fast)
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+
+        if output_path:
+            profiler.dump_stats(str(output_path))
+
+        summary = io.StringIO()
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.strip_dirs().sort_stats(sort_by).print_stats(limit)
+        print(summary.getvalue(), file=stream or sys.stdout)
@@ -5,10 +5,11 @@ Utility Functions for PDF Converter
 
 import os
 import shutil
-import subprocess
 import sys
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 # Try to import magic, but provide fallback
 try:
@@ -17,6 +18,13 @@ try:
 except ImportError:
     MAGIC_AVAILABLE = False
 
+try:
+    from .tools import tool_registry
+    from .pdf_source import PDFSource
+except ImportError:
+    from tools import tool_registry
+    from pdf_source import PDFSource
+
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
@@ -24,16 +32,15 @@ from rich.text import Text
 
 console = Console()
 
+# Largest PDF accepted for conversion (file or in-memory upload)
+MAX_PDF_SIZE_MB = 100
+
 def check_pandoc_installation() -> bool:
     """
-    Memeriksa apakah pandoc sudah terinstall
+    Memeriksa apakah pandoc sudah terinstall (hasil probe di-cache per proses,
+    lihat tools.tool_registry)
     """
-    try:
-        result = subprocess.run(['pandoc', '--version'], 
-                              capture_output=True, text=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return tool_registry.is_available('pandoc')
 
 def install_pandoc_guide():
     """
@@ -76,7 +83,15 @@ def get_file_type(file_path: Path) -> str:
 def validate_pdf_file(file_path: Path) -> Tuple[bool, str]:
     """
     Memvalidasi apakah file adalah PDF yang valid
+    
+    file_path boleh berupa PDFSource; PDF di memory dicek dari ukuran dan
+    header %PDF- di awal buffer
     """
+    if isinstance(file_path, PDFSource):
+        if file_path.in_memory:
+            return _validate_pdf_buffer(file_path)
+        file_path = file_path.path
+    
     if not file_path.exists():
         return False, f"File tidak ditemukan: {file_path}"
     
@@ -85,8 +100,8 @@ def validate_pdf_file(file_path: Path) -> Tuple[bool, str]:
     
     # Check file size
     file_size_mb = file_path.stat().st_size / (1024 * 1024)
-    if file_size_mb > 100:  # 100MB limit
-        return False, f"File terlalu besar: {file_size_mb:.1f}MB (maksimum: 100MB)"
+    if file_size_mb > MAX_PDF_SIZE_MB:
+        return False, f"File terlalu besar: {file_size_mb:.1f}MB (maksimum: {MAX_PDF_SIZE_MB}MB)"
     
     # Check if it's actually a PDF file
     if MAGIC_AVAILABLE:
@@ -99,6 +114,17 @@ def validate_pdf_file(file_path: Path) -> Tuple[bool, str]:
     
     return True, "File PDF valid"
 
+def _validate_pdf_buffer(source: PDFSource) -> Tuple[bool, str]:
+    file_size_mb = source.size_bytes / (1024 * 1024)
+    if file_size_mb > MAX_PDF_SIZE_MB:
+        return False, f"PDF terlalu besar: {file_size_mb:.1f}MB (maksimum: {MAX_PDF_SIZE_MB}MB)"
+    
+    # Readers accept junk before the header, so look a little past the start
+    if b"%PDF-" not in source.buffer[:1024].tobytes():
+        return False, f"Data bukan PDF yang valid: {source.name}"
+    
+    return True, "File PDF valid"
+
 def create_output_directory(output_dir: Path, format_name: str) -> Path:
     """
     Membuat direktori output untuk format tertentu
@@ -107,13 +133,23 @@ def create_output_directory(output_dir: Path, format_name: str) -> Path:
     format_dir.mkdir(parents=True, exist_ok=True)
     return format_dir
 
-def clean_temp_directory(temp_dir: Path):
+@contextmanager
+def job_workspace(temp_root: Optional[Path] = None, prefix: str = "job-") -> Iterator[Path]:
     """
-    Membersihkan direktori temporary
+    Direktori kerja sementara milik satu konversi, dihapus saat selesai
+    
+    Setiap job mendapat direktori unik di bawah temp_root, jadi konversi
+    yang berjalan bersamaan tidak saling menghapus file. temp_root None
+    memakai direktori temp sistem (ikut TMPDIR, misalnya tmpfs).
     """
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
-    temp_dir.mkdir(parents=True, exist_ok=True)
+    if temp_root is not None:
+        Path(temp_root).mkdir(parents=True, exist_ok=True)
+    
+    workspace = Path(tempfile.mkdtemp(prefix=prefix, dir=str(temp_root) if temp_root else None))
+    try:
+        yield workspace
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
 
 def get_available_pdf_files(directory: Path) -> List[Path]:
     """
@@ -0,0 +1,5 @@
+"""
+PDF Converter version (modul kecil tanpa dependency supaya --version cepat)
+"""
+
+__version__ = "1.0.0"
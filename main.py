@@ -7,6 +7,8 @@ Script utama untuk menjalankan PDF Converter
 Dapat dijalankan dengan: python main.py
 """
 
+import argparse
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -17,35 +19,16 @@ core_dir = current_dir / "core"
 sys.path.insert(0, str(core_dir))
 
 def check_dependencies():
-    """Check if required dependencies are available"""
-    missing_deps = []
-    
-    try:
-        import rich
-    except ImportError:
-        missing_deps.append("rich")
-    
-    try:
-        import pypandoc
-    except ImportError:
-        missing_deps.append("pypandoc")
-    
-    try:
-        import PyPDF2
-    except ImportError:
-        missing_deps.append("PyPDF2")
-    
-    try:
-        from pdf2image import convert_from_path
-    except ImportError:
-        missing_deps.append("pdf2image")
-    
-    try:
-        from PIL import Image
-    except ImportError:
-        missing_deps.append("Pillow")
-    
-    return missing_deps
+    """Check if required dependencies are available (tanpa meng-import modulnya)"""
+    # (module name, pip package) - find_spec hanya mencari modul, jauh lebih cepat dari import
+    required = [
+        ("rich", "rich"),
+        ("pypandoc", "pypandoc"),
+        ("PyPDF2", "PyPDF2"),
+        ("pdf2image", "pdf2image"),
+        ("PIL", "Pillow"),
+    ]
+    return [package for module, package in required if importlib.util.find_spec(module) is None]
 
 def show_dependency_error(missing_deps):
     """Show user-friendly dependency error message"""
@@ -69,10 +52,21 @@ def show_dependency_error(missing_deps):
     print()
     print("=" * 60)
 
+def parse_args(argv=None):
+    """Parse --help/--version sebelum modul berat apa pun di-import"""
+    from version import __version__
+
+    parser = argparse.ArgumentParser(
+        description="PDF Converter - interactive mode (use core/cli.py for subcommands)"
+    )
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    return parser.parse_args(argv)
+
 def main():
     """
     Fungsi utama untuk menjalankan PDF Converter
     """
+    parse_args()
     try:
         print("PDF Converter - Starting...")
         print("Checking dependencies...")
@@ -0,0 +1,131 @@
+"""
+Test Batch Scheduler
+====================
+"""
+
+import multiprocessing
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+from batch import BatchScheduler, STATUS_CANCELLED, STATUS_FAILED, STATUS_OK, STATUS_TIMEOUT
+from converter import PDFConverter
+
+
+def _make_text_pdf(pdf_path: Path, label: str):
+    import fitz
+
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), f"Batch document {label}")
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def _make_batch(tmp: Path, count: int):
+    pdf_files = []
+    for index in range(count):
+        pdf_path = tmp / "input" / f"doc_{index}.pdf"
+        pdf_path.parent.mkdir(exist_ok=True)
+        _make_text_pdf(pdf_path, str(index))
+        pdf_files.append(pdf_path)
+    return pdf_files
+
+
+def test_parallel_batch_converts_every_file():
+    """Parallel batch produces the same outputs as a serial one, in input order"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_files = _make_batch(tmp, 5)
+        broken = tmp / "input" / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+        results = list(converter.iter_batch_convert(pdf_files + [broken], 'md', jobs=3))
+
+        assert sorted(result['index'] for result in results) == list(range(6))
+        statuses = {result['input'].name: result['status'] for result in results}
+        assert statuses.pop("broken.pdf") == STATUS_FAILED
+        assert set(statuses.values()) == {STATUS_OK}
+
+        outputs = converter.batch_convert(pdf_files, 'md', jobs=2)
+        assert outputs == [tmp / "output" / "md" / f"doc_{index}.md" for index in range(5)]
+        assert "Batch document 3" in outputs[3].read_text(encoding='utf-8')
+
+
+def _slow_convert_pdf(self, input_file, output_format, custom_options=None):
+    if input_file.stem == "doc_0":
+        time.sleep(30)
+    return _real_convert_pdf(self, input_file, output_format, custom_options)
+
+
+_real_convert_pdf = PDFConverter.convert_pdf
+
+
+def test_timeout_does_not_stall_other_files():
+    """A document over the timeout is killed while the rest still finish"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+    if multiprocessing.get_start_method() != 'fork':
+        print("⚠️  Needs fork start method to patch workers, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_files = _make_batch(tmp, 4)
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+
+        PDFConverter.convert_pdf = _slow_convert_pdf
+        try:
+            start = time.perf_counter()
+            results = list(BatchScheduler(jobs=2, timeout=1).run(converter, pdf_files, 'md'))
+            elapsed = time.perf_counter() - start
+        finally:
+            PDFConverter.convert_pdf = _real_convert_pdf
+
+        statuses = {result['input'].stem: result['status'] for result in results}
+        assert statuses == {"doc_0": STATUS_TIMEOUT, "doc_1": STATUS_OK,
+                            "doc_2": STATUS_OK, "doc_3": STATUS_OK}
+        assert elapsed < 20
+
+
+def test_cancel_reports_remaining_files():
+    """cancel() stops the batch and every unfinished file is reported"""
+    converted = []
+
+    class FakeConverter:
+        def convert_pdf(self, input_file, output_format, custom_options=None):
+            converted.append(input_file)
+            if len(converted) == 2:
+                scheduler.cancel()
+            return input_file
+
+    scheduler = BatchScheduler(jobs=1)
+    files = [Path(f"file_{index}.pdf") for index in range(5)]
+    results = list(scheduler.run(FakeConverter(), files, 'md'))
+
+    assert len(converted) == 2
+    assert [result['status'] for result in results] == [STATUS_OK, STATUS_OK] + [STATUS_CANCELLED] * 3
+
+
+if __name__ == "__main__":
+    test_parallel_batch_converts_every_file()
+    test_timeout_does_not_stall_other_files()
+    test_cancel_reports_remaining_files()
+    print("✅ Batch scheduler tests passed")
@@ -0,0 +1,46 @@
+"""
+Test Benchmark Corpus
+=====================
+"""
+
+import hashlib
+import sys
+import tempfile
+from pathlib import Path
+
+# Add benchmarks to path
+current_dir = Path(__file__).parent
+benchmarks_dir = current_dir.parent / "benchmarks"
+sys.path.insert(0, str(benchmarks_dir))
+
+
+def test_corpus_is_deterministic():
+    """Building the same document twice gives byte-identical PDFs"""
+    try:
+        import fitz
+        from PIL import Image
+    except ImportError:
+        print("⚠️  PyMuPDF/Pillow not available, skipping")
+        return
+
+    from corpus import KINDS, build_pdf
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for kind in KINDS:
+            digests = []
+            for attempt in range(2):
+                pdf_path = tmp / f"{kind}_{attempt}.pdf"
+                build_pdf(pdf_path, kind, 5)
+                digests.append(hashlib.sha256(pdf_path.read_bytes()).hexdigest())
+
+            assert digests[0] == digests[1], kind
+
+            doc = fitz.open(str(tmp / f"{kind}_0.pdf"))
+            assert len(doc) == 5
+            doc.close()
+
+
+if __name__ == "__main__":
+    test_corpus_is_deterministic()
+    print("✅ Benchmark corpus tests passed")
@@ -0,0 +1,94 @@
+"""
+Test Conversion Cache
+=====================
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+from cache import ConversionCache
+
+
+def test_key_depends_on_content_and_options():
+    """Same bytes give the same key, other options or content do not"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        first = tmp / "first.pdf"
+        copy = tmp / "copy.pdf"
+        other = tmp / "other.pdf"
+        first.write_bytes(b"%PDF-1.4 same")
+        copy.write_bytes(b"%PDF-1.4 same")
+        other.write_bytes(b"%PDF-1.4 different")
+
+        cache = ConversionCache(tmp / "cache")
+        key = cache.make_key(first, format='md', dpi=150)
+
+        assert cache.make_key(copy, format='md', dpi=150) == key
+        assert cache.make_key(first, format='md', dpi=300) != key
+        assert cache.make_key(other, format='md', dpi=150) != key
+
+
+def test_text_and_files_round_trip():
+    """Stored text and output files come back unchanged"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 doc")
+
+        output_md = tmp / "out" / "doc.md"
+        images_dir = tmp / "out" / "doc_images"
+        images_dir.mkdir(parents=True)
+        output_md.write_text("# doc", encoding='utf-8')
+        (images_dir / "page_1.png").write_bytes(b"png")
+
+        cache = ConversionCache(tmp / "cache")
+        key = cache.make_key(pdf_path, format='md-hybrid')
+
+        assert cache.get_text(key) is None
+        assert cache.restore_files(key, tmp / "restored") == []
+
+        cache.put_text(key, "\n\n# Page 1\n\nhello")
+        assert cache.get_text(key) == "\n\n# Page 1\n\nhello"
+
+        cache.put_files(key, [output_md, images_dir])
+        restored = cache.restore_files(key, tmp / "restored")
+
+        assert tmp / "restored" / "doc.md" in restored
+        assert (tmp / "restored" / "doc_images" / "page_1.png").read_bytes() == b"png"
+
+
+def test_lru_eviction_keeps_recently_used_entries():
+    """When over the size limit the least recently used entry goes first"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        cache = ConversionCache(tmp / "cache", max_size_mb=1)
+        payload = "x" * (400 * 1024)
+
+        for name in ("a", "b"):
+            cache.put_text(name * 64, payload)
+
+        # Make "a" the most recently used entry
+        old = time.time() - 100
+        os.utime(cache._entry_dir("b" * 64) / "meta.json", (old, old))
+        assert cache.get_text("a" * 64) == payload
+
+        cache.put_text("c" * 64, payload)
+
+        assert cache.get_text("b" * 64) is None
+        assert cache.get_text("a" * 64) == payload
+        assert cache.get_text("c" * 64) == payload
+
+
+if __name__ == "__main__":
+    test_key_depends_on_content_and_options()
+    test_text_and_files_round_trip()
+    test_lru_eviction_keeps_recently_used_entries()
+    print("✅ Cache tests passed")
@@ -0,0 +1,166 @@
+"""
+Test Resumable Conversion Checkpoints
+=====================================
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+import fast_pdf_processor
+from checkpoint import PageCheckpoint, first_incomplete_page, is_truncated
+from fast_pdf_processor import FastPDFProcessor
+
+
+def _make_text_pdf(pdf_path: Path, pages: int):
+    import fitz
+
+    doc = fitz.open()
+    for page_num in range(pages):
+        doc.new_page().insert_text((72, 72), f"Checkpointed page {page_num + 1} " + "lorem ipsum " * 8)
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def test_checkpoint_roundtrip_and_invalidation():
+    """Recorded pages survive a reload; a torn last line or another source is discarded"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 original")
+        output_path = tmp / "doc.md"
+
+        checkpoint = PageCheckpoint(output_path, pdf_path, "ocr-all")
+        assert checkpoint.load() == {}
+        checkpoint.record(0, {'text': "one"})
+        checkpoint.record(2, {'text': "three"})
+        with open(checkpoint.path, 'a', encoding='utf-8') as f:
+            f.write('{"page": 1, "resu')  # interrupted write
+
+        pages = PageCheckpoint(output_path, pdf_path, "ocr-all").load()
+        assert pages == {0: {'text': "one"}, 2: {'text': "three"}}
+        assert first_incomplete_page(pages, 3) == 1
+        assert first_incomplete_page({0: {}, 1: {}}, 2) is None
+
+        assert PageCheckpoint(output_path, pdf_path, "guaranteed-hybrid").load() == {}
+
+        checkpoint.remove()
+        assert not checkpoint.path.exists()
+
+
+def test_guaranteed_hybrid_resumes_after_time_limit():
+    """A run cut off by the time limit is marked truncated and the rerun only renders missing pages"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    real_render_pages = fast_pdf_processor.render_pages
+    rendered = []
+
+    def slow_render_pages(pdf_path, page_numbers, **kwargs):
+        for page_number, image in real_render_pages(pdf_path, page_numbers, **kwargs):
+            rendered.append(page_number)
+            if page_number == 2:
+                time.sleep(1.5)  # push the run past its deadline
+            yield page_number, image
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "scan.pdf"
+        _make_text_pdf(pdf_path, 4)
+        output_md = tmp / "scan.md"
+
+        processor = FastPDFProcessor(tmp, tmp)
+        processor.checkpointing = True
+        processor.max_processing_time = 1
+
+        fast_pdf_processor.render_pages = slow_render_pages
+        try:
+            success, message = processor.convert_hybrid_fast(pdf_path, output_md)
+        finally:
+            fast_pdf_processor.render_pages = real_render_pages
+
+        assert success, message
+        assert is_truncated(output_md)
+        checkpoint = PageCheckpoint(output_md, pdf_path, "guaranteed-hybrid")
+        assert sorted(checkpoint.load()) == [0]
+
+        processor.max_processing_time = 300
+        rendered.clear()
+        fast_pdf_processor.render_pages = slow_render_pages
+        try:
+            success, message = processor.convert_hybrid_fast(pdf_path, output_md)
+        finally:
+            fast_pdf_processor.render_pages = real_render_pages
+
+        assert success, message
+        assert rendered == [2, 3, 4]
+        assert not is_truncated(output_md)
+        assert not checkpoint.path.exists()
+        content = output_md.read_text(encoding='utf-8')
+        for page_num in range(1, 5):
+            assert f"scan_images/page_{page_num}.png" in content
+
+
+def test_sparse_checkpoint_resumes_with_parallel_shards():
+    """Pages finished out of order by parallel shards are kept and never rendered again"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "scan.pdf"
+        _make_text_pdf(pdf_path, 10)
+        output_md = tmp / "scan.md"
+        images_dir = tmp / "scan_images"
+
+        # Two shards of an earlier run finished pages 1-3 and 7-9
+        checkpoint = PageCheckpoint(output_md, pdf_path, "guaranteed-hybrid")
+        checkpoint.load()
+        done = [0, 1, 2, 6, 7, 8]
+        for page_num in done:
+            checkpoint.record(page_num, {'text': f"Restored page {page_num + 1} " + "from the checkpoint " * 3,
+                                         'image': f"page_{page_num + 1}.png"})
+
+        processor = FastPDFProcessor(tmp, tmp)
+        processor.checkpointing = True
+
+        # The deadline hits again before any page: checkpointed pages survive
+        processor.max_processing_time = -1
+        success, message = processor._guaranteed_image_hybrid(pdf_path, output_md, time.time(), workers=2)
+        assert success, message
+        assert is_truncated(output_md)
+        content = output_md.read_text(encoding='utf-8')
+        for page_num in done:
+            assert f"Restored page {page_num + 1} " in content
+            assert f"scan_images/page_{page_num + 1}.png" in content
+        assert sorted(checkpoint.load()) == done
+
+        processor.max_processing_time = 300
+        success, message = processor._guaranteed_image_hybrid(pdf_path, output_md, time.time(), workers=2)
+        assert success, message
+        assert sorted(image.name for image in images_dir.iterdir()) == [
+            "page_10.png", "page_4.png", "page_5.png", "page_6.png"
+        ]
+        assert not is_truncated(output_md)
+        assert not checkpoint.path.exists()
+        content = output_md.read_text(encoding='utf-8')
+        assert "Restored page 7 " in content and "Checkpointed page 4 " in content
+
+
+if __name__ == "__main__":
+    test_checkpoint_roundtrip_and_invalidation()
+    test_guaranteed_hybrid_resumes_after_time_limit()
+    test_sparse_checkpoint_resumes_with_parallel_shards()
+    print("✅ Checkpoint tests passed")
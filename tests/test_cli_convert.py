@@ -0,0 +1,137 @@
+"""
+Test Non-Interactive Convert Command
+====================================
+"""
+
+import io
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+from cli import EXIT_FAILURES, EXIT_OK, EXIT_PARTIAL, EXIT_USAGE, PDFConverterCLI, expand_input_patterns
+
+
+def _make_text_pdf(pdf_path: Path, pages: int = 1):
+    import fitz
+
+    doc = fitz.open()
+    for page_num in range(pages):
+        doc.new_page().insert_text((72, 72), f"{pdf_path.stem} page {page_num + 1}")
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def test_expand_input_patterns():
+    """Files, directories and recursive globs expand to unique PDFs"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for relative in ("a.pdf", "b.PDF", "notes.txt", "nested/c.pdf"):
+            (tmp / relative).parent.mkdir(parents=True, exist_ok=True)
+            (tmp / relative).write_bytes(b"%PDF-1.4")
+
+        files, unmatched = expand_input_patterns([
+            str(tmp / "**" / "*.pdf"), str(tmp / "a.pdf"), str(tmp), str(tmp / "missing.pdf")
+        ])
+
+        names = [path.name for path in files]
+        assert sorted(names) == ["a.pdf", "b.PDF", "c.pdf"]
+        assert len(names) == len(set(names))
+        assert unmatched == [str(tmp / "missing.pdf")]
+
+
+def test_run_batch_mode_prints_json_summary():
+    """Summary lists every file with status, pages and bytes; failures set the exit code"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        _make_text_pdf(tmp / "in" / "one.pdf", pages=2)
+        _make_text_pdf(tmp / "in" / "two.pdf", pages=3)
+
+        cli = PDFConverterCLI(tmp, use_cache=False, jobs=2, output_dir=tmp / "out")
+
+        summary_stream = io.StringIO()
+        exit_code = cli.run_batch_mode([str(tmp / "in" / "*.pdf")], 'md', summary_stream)
+        summary = json.loads(summary_stream.getvalue())
+
+        assert exit_code == EXIT_OK
+        assert summary['total'] == 2 and summary['succeeded'] == 2
+        assert [Path(entry['input']).name for entry in summary['files']] == ["one.pdf", "two.pdf"]
+        assert [entry['pages'] for entry in summary['files']] == [2, 3]
+        for entry in summary['files']:
+            assert entry['status'] == 'ok'
+            assert entry['bytes_out'] == Path(entry['output']).stat().st_size
+            assert Path(entry['output']).parent == tmp / "out" / "md"
+
+        (tmp / "in" / "broken.pdf").write_bytes(b"not a pdf")
+        summary_stream = io.StringIO()
+        exit_code = cli.run_batch_mode([str(tmp / "in"), str(tmp / "missing.pdf")], 'md', summary_stream)
+        summary = json.loads(summary_stream.getvalue())
+
+        assert exit_code == EXIT_FAILURES
+        assert summary['failed'] == 2
+        statuses = {Path(entry['input']).name: entry['status'] for entry in summary['files']}
+        assert statuses['broken.pdf'] == 'failed' and statuses['missing.pdf'] == 'not-found'
+        # Every entry has the same keys whatever its status
+        assert len({tuple(entry) for entry in summary['files']}) == 1
+
+        assert cli.run_batch_mode([str(tmp / "nothing-*.pdf")], 'md', io.StringIO()) == EXIT_USAGE
+        assert cli.run_batch_mode([str(tmp / "in")], 'bogus', io.StringIO()) == EXIT_USAGE
+
+
+def test_truncated_outputs_are_not_reported_as_success():
+    """Outputs cut off by the time limit are counted apart and give the partial exit code"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        _make_text_pdf(tmp / "in" / "long.pdf", pages=3)
+
+        cli = PDFConverterCLI(tmp, use_cache=False, output_dir=tmp / "out", time_limit=1e-6)
+
+        summary_stream = io.StringIO()
+        exit_code = cli.run_batch_mode([str(tmp / "in")], 'md-hybrid', summary_stream)
+        summary = json.loads(summary_stream.getvalue())
+
+        assert exit_code == EXIT_PARTIAL
+        assert (summary['succeeded'], summary['truncated'], summary['failed']) == (0, 1, 0)
+        assert summary['files'][0]['truncated'] is True
+
+        summary_stream = io.StringIO()
+        exit_code = cli.run_batch_mode([str(tmp / "in"), str(tmp / "missing.pdf")], 'md-hybrid', summary_stream)
+        assert exit_code == EXIT_FAILURES
+
+
+def test_convert_exit_code_without_inputs():
+    """The convert subcommand exits with the usage code when nothing matches"""
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run(
+            [sys.executable, str(core_dir / "cli.py"), "--base-dir", tmp, "--no-cache",
+             "convert", str(Path(tmp) / "*.pdf")],
+            capture_output=True, text=True, timeout=60
+        )
+        assert result.returncode == EXIT_USAGE
+
+
+if __name__ == "__main__":
+    test_expand_input_patterns()
+    test_run_batch_mode_prints_json_summary()
+    test_truncated_outputs_are_not_reported_as_success()
+    test_convert_exit_code_without_inputs()
+    print("✅ CLI convert tests passed")
@@ -0,0 +1,145 @@
+"""
+Test Multi-Format Conversion
+============================
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+from converter import PDFConverter
+
+
+def test_convert_pdf_multi_extracts_once():
+    """All pandoc formats are produced from a single text extraction"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "report.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+
+        extract_calls = []
+
+        def fake_extract_text(path, method="auto"):
+            extract_calls.append(path)
+            return True, "\n\n# Page 1\n\nhello", "fake extraction"
+
+        pandoc_calls = []
+        lock = threading.Lock()
+        real_run = subprocess.run
+
+        def fake_run(args, **kwargs):
+            # Pretend to be pandoc: copy the markdown input to the -o target
+            output_file = Path(args[args.index('-o') + 1])
+            shutil.copy2(args[args.index('-o') - 1], output_file)
+            with lock:
+                pandoc_calls.append(output_file.suffix)
+
+        converter.pdf_extractor.extract_text = fake_extract_text
+        subprocess.run = fake_run
+        try:
+            results = converter.convert_pdf_multi(pdf_path, ['md', 'html', 'docx', 'html', 'bogus'])
+        finally:
+            subprocess.run = real_run
+
+        assert len(extract_calls) == 1
+        assert sorted(pandoc_calls) == ['.docx', '.html']
+        assert results['bogus'] is None
+        for output_format in ('md', 'html', 'docx'):
+            assert results[output_format] == tmp / "output" / output_format / f"report.{output_format}"
+            assert results[output_format].exists()
+
+
+def test_convert_pdf_multi_accepts_bytes():
+    """PDF bytes (e.g. a daemon upload) convert to every format without a file on disk"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+
+        extracted = []
+
+        def fake_extract_text(source, method="auto"):
+            extracted.append(source)
+            return True, "\n\n# Page 1\n\nfrom memory", "fake extraction"
+
+        real_run = subprocess.run
+
+        def fake_run(args, **kwargs):
+            shutil.copy2(args[args.index('-o') - 1], args[args.index('-o') + 1])
+
+        converter.pdf_extractor.extract_text = fake_extract_text
+        subprocess.run = fake_run
+        try:
+            results = converter.convert_pdf_multi(b"%PDF-1.4 fake", ['md', 'html'])
+        finally:
+            subprocess.run = real_run
+
+        assert len(extracted) == 1 and extracted[0].in_memory
+        for output_format in ('md', 'html'):
+            assert results[output_format] == tmp / "output" / output_format / f"document.{output_format}"
+            assert "from memory" in results[output_format].read_text()
+        assert list(tmp.rglob("*.pdf")) == []
+
+
+def test_concurrent_conversions_use_separate_workspaces():
+    """Each conversion gets its own workspace; media paths point inside it and it is removed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+        pdf_files = []
+        for name in ("first", "second"):
+            pdf_path = tmp / f"{name}.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4 fake")
+            pdf_files.append(pdf_path)
+
+        def fake_extract_text(path, method="auto"):
+            return True, f"\n\n# Page 1\n\n{path.stem}", "fake extraction"
+
+        both_running = threading.Barrier(2, timeout=10)
+        pandoc_calls = []
+        real_run = subprocess.run
+
+        def fake_run(args, cwd=None, **kwargs):
+            # Both jobs are inside pandoc at the same time
+            both_running.wait()
+            input_file = Path(args[args.index('-o') - 1])
+            shutil.copy2(input_file, args[args.index('-o') + 1])
+            pandoc_calls.append((Path(cwd), input_file, args))
+
+        converter.pdf_extractor.extract_text = fake_extract_text
+        subprocess.run = fake_run
+        try:
+            threads = [threading.Thread(target=converter.convert_pdf, args=(pdf_path, 'html'))
+                       for pdf_path in pdf_files]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            subprocess.run = real_run
+
+        workspaces = {cwd for cwd, _, _ in pandoc_calls}
+        assert len(workspaces) == 2
+        for cwd, input_file, args in pandoc_calls:
+            assert input_file.parent == cwd and cwd.parent == tmp / "temp"
+            assert f"--extract-media={cwd / 'images-html'}" in args
+
+        for name in ("first", "second"):
+            assert name in (tmp / "output" / "html" / f"{name}.html").read_text()
+        assert list((tmp / "temp").iterdir()) == []
+
+
+if __name__ == "__main__":
+    test_convert_pdf_multi_extracts_once()
+    test_convert_pdf_multi_accepts_bytes()
+    test_concurrent_conversions_use_separate_workspaces()
+    print("✅ Multi-format conversion tests passed")
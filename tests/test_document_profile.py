@@ -0,0 +1,109 @@
+"""
+Test Shared Document Profile
+============================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+
+def _make_mixed_pdf(pdf_path: Path):
+    """Page 1: text only, page 2: photo covering the top half, page 3: blank"""
+    import fitz
+
+    photo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 60, 40), False)
+    photo.set_rect(photo.irect, (30, 120, 200))
+
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "A paragraph of digital text. " * 10, fontname="helv")
+    page = doc.new_page()
+    page.insert_image(fitz.Rect(0, 0, page.rect.width, page.rect.height / 2), pixmap=photo,
+                      keep_proportion=False)
+    doc.new_page()
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def test_profile_collects_page_statistics():
+    """One scan records text length, images, image coverage and fonts per page"""
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from document_profile import DocumentProfile, ensure_profile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "mixed.pdf"
+        _make_mixed_pdf(pdf_path)
+
+        profile = DocumentProfile.from_pdf(pdf_path)
+        assert profile.total_pages == 3
+        assert profile.page(1).text_chars > 100 and profile.page(1).image_count == 0
+        assert profile.page(2).image_count == 1
+        assert abs(profile.page(2).image_area - 0.5) < 0.01
+        assert profile.page(3).text_chars == 0 and profile.page(3).image_area == 0.0
+        assert profile.text_pages() == [1] and profile.low_text_pages() == [2, 3]
+        assert profile.embedded_images == 1
+        assert any("Helvetica" in font for font in profile.fonts)
+        assert profile.to_dict()['total_pages'] == 3
+
+        # Reused while the file is unchanged, rebuilt once it changes
+        assert ensure_profile(pdf_path, profile) is profile
+        _make_mixed_pdf(pdf_path)
+        pdf_path.write_bytes(pdf_path.read_bytes() + b"\n")
+        assert ensure_profile(pdf_path, profile) is not profile
+
+
+def test_conversion_scans_document_once():
+    """Auto mode analysis and the chosen mode share the profile passed in"""
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    import document_profile
+    from document_profile import DocumentProfile
+    from advanced_pdf_processor import AdvancedPDFProcessor
+    from fast_pdf_processor import FastPDFProcessor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "mixed.pdf"
+        _make_mixed_pdf(pdf_path)
+        profile = DocumentProfile.from_pdf(pdf_path)
+
+        scans = []
+        original = DocumentProfile.from_pdf.__func__
+
+        def counting_from_pdf(cls, path):
+            scans.append(path)
+            return original(cls, path)
+
+        document_profile.DocumentProfile.from_pdf = classmethod(counting_from_pdf)
+        try:
+            processor = FastPDFProcessor(tmp, tmp)
+            success, message, output = processor.convert_pdf_fast(pdf_path, "auto", profile=profile)
+            assert success, message
+            assert output.exists()
+
+            analysis = AdvancedPDFProcessor(tmp, tmp).analyze_pdf_content(pdf_path, profile)
+            assert analysis['text_pages'] == 1 and analysis['image_pages'] == 2
+            assert scans == []
+        finally:
+            document_profile.DocumentProfile.from_pdf = classmethod(original)
+
+
+if __name__ == "__main__":
+    test_profile_collects_page_statistics()
+    test_conversion_scans_document_once()
+    print("✅ Document profile tests passed")
@@ -0,0 +1,100 @@
+"""
+Test Parallel Image Encoder
+===========================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+
+def _page_image(width: int = 200, height: int = 260):
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    for y in range(10, height, 20):
+        draw.line((10, y, width - 10, y), fill="black", width=2)
+    return image
+
+
+def test_snapshots_are_written_with_codec_suffix():
+    """Every submitted page exists after close() and the summary accounts for it"""
+    try:
+        from PIL import features
+    except ImportError:
+        print("⚠️  Pillow not available, skipping")
+        return
+
+    from image_encoder import ImageEncoder
+
+    codecs = {'png': '.png', 'png-fast': '.png', 'png-optimized': '.png', 'jpeg': '.jpg'}
+    if features.check('webp'):
+        codecs.update({'webp': '.webp', 'webp-lossless': '.webp'})
+
+    image = _page_image()
+    with tempfile.TemporaryDirectory() as tmp:
+        for codec, suffix in codecs.items():
+            directory = Path(tmp) / codec
+            directory.mkdir()
+            done = []
+            with ImageEncoder(codec, quality=70, workers=2) as encoder:
+                names = [encoder.submit(image, directory, f"page_{n}",
+                                        on_done=lambda n=n: done.append(n))
+                         for n in range(1, 6)]
+
+            assert names == [f"page_{n}{suffix}" for n in range(1, 6)], codec
+            assert all((directory / name).stat().st_size > 0 for name in names), codec
+            assert sorted(done) == [1, 2, 3, 4, 5], codec
+
+            stats = encoder.summary()
+            assert stats['images'] == 5
+            assert stats['bytes_out'] == sum((directory / name).stat().st_size for name in names)
+            assert stats['bytes_per_image'] == stats['bytes_out'] / 5
+            assert f"{stats['bytes_per_image'] / 1024:.0f}KB per image" in encoder.format_summary()
+
+
+def test_unknown_codec_is_rejected():
+    """An unknown codec fails before any image is queued"""
+    from image_encoder import ImageEncoder, CODEC_CHOICES
+
+    try:
+        ImageEncoder('gif')
+    except ValueError as e:
+        assert 'gif' in str(e)
+    else:
+        raise AssertionError("ImageEncoder accepted an unknown codec")
+    assert 'png-optimized' in CODEC_CHOICES
+
+
+def test_encode_errors_surface_on_close():
+    """A failed encode is raised from close() instead of being dropped"""
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("⚠️  Pillow not available, skipping")
+        return
+
+    from image_encoder import ImageEncoder
+
+    with tempfile.TemporaryDirectory() as tmp:
+        encoder = ImageEncoder('png', workers=1)
+        encoder.submit(_page_image(), Path(tmp) / "missing", "page_1")
+        try:
+            encoder.close()
+        except OSError:
+            pass
+        else:
+            raise AssertionError("encode error was not raised")
+
+
+if __name__ == "__main__":
+    test_snapshots_are_written_with_codec_suffix()
+    test_unknown_codec_is_rejected()
+    test_encode_errors_surface_on_close()
+    print("✅ Image encoder tests passed")
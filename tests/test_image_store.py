@@ -0,0 +1,178 @@
+"""
+Test Deduplicated Image Extraction
+==================================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+
+def _make_logo_pdf(pdf_path: Path, pages: int = 5):
+    """Same logo on every page: separate (identical) xrefs first, then a shared xref"""
+    import fitz
+
+    logo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 80, 80), False)
+    logo.set_rect(logo.irect, (200, 30, 30))
+    png = logo.tobytes("png")
+
+    doc = fitz.open()
+    shared_xref = None
+    for page_num in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 200), f"Page {page_num + 1} with the company logo")
+        rect = fitz.Rect(72, 72, 152, 152)
+        if page_num < 3:
+            shared_xref = page.insert_image(rect, stream=png)
+        else:
+            page.insert_image(rect, xref=shared_xref)
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def test_repeated_image_is_written_once():
+    """A logo on every page is decoded and saved once and referenced from each page"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from image_store import ImageStore
+    from pdf_to_md_with_images import PDFToMarkdownWithImages
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "logos.pdf"
+        _make_logo_pdf(pdf_path)
+
+        doc = fitz.open(str(pdf_path))
+        store = ImageStore(tmp)
+        names = [store.extract(doc, img[0], f"page_{page_num + 1}.png")
+                 for page_num in range(len(doc)) for img in doc[page_num].get_images(full=True)]
+        doc.close()
+        assert names == ["page_1.png"] * 5
+        assert store.written == 1 and store.reused == 4
+
+        output_md = tmp / "out" / "logos.md"
+        output_md.parent.mkdir()
+        success, message = PDFToMarkdownWithImages(tmp / "out", tmp).extract_with_pymupdf(pdf_path, output_md)
+        assert success, message
+
+        images = list((tmp / "out" / "logos_images").iterdir())
+        assert [image.name for image in images] == ["page_1_img_1.png"]
+        assert output_md.read_text(encoding='utf-8').count("logos_images/page_1_img_1.png") == 5
+
+
+def test_rejected_image_is_not_decoded_again():
+    """An image the filter rejects is remembered and skipped on later pages"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from image_store import ImageStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "logos.pdf"
+        _make_logo_pdf(pdf_path)
+
+        calls = []
+
+        def too_small(pix):
+            calls.append(pix.width)
+            return pix.width > 100
+
+        doc = fitz.open(str(pdf_path))
+        store = ImageStore(tmp)
+        for page_num in range(len(doc)):
+            for img in doc[page_num].get_images(full=True):
+                assert store.extract(doc, img[0], "logo.png", accept=too_small) is None
+        doc.close()
+
+        assert calls == [80]
+        assert store.written == 0 and not (tmp / "logo.png").exists()
+
+
+def test_filter_sees_cmyk_before_conversion():
+    """A colour-space filter still rejects CMYK; accepted CMYK images are saved as RGB PNG"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from image_store import ImageStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        cmyk = fitz.Pixmap(fitz.csCMYK, fitz.IRect(0, 0, 80, 80), False)
+        cmyk.set_rect(cmyk.irect, (0, 200, 200, 0))
+        doc = fitz.open()
+        doc.new_page().insert_image(fitz.Rect(72, 72, 152, 152), pixmap=cmyk)
+        xref = doc[0].get_images(full=True)[0][0]
+
+        rejecting = ImageStore(tmp, passthrough=False)
+        assert rejecting.extract(doc, xref, "cmyk.png", accept=lambda pix: pix.n - pix.alpha < 4) is None
+        assert not (tmp / "cmyk.png").exists()
+
+        accepting = ImageStore(tmp, passthrough=False)
+        assert accepting.extract(doc, xref, "cmyk.png", accept=lambda pix: pix.width > 50) == "cmyk.png"
+        assert fitz.Pixmap(str(tmp / "cmyk.png")).n == 3
+        doc.close()
+
+
+def test_jpeg_streams_are_written_without_reencoding():
+    """RGB JPEGs are copied byte for byte; CMYK JPEGs still go through PNG"""
+    try:
+        import fitz
+        from PIL import Image
+    except ImportError:
+        print("⚠️  PyMuPDF/Pillow not available, skipping")
+        return
+
+    import io
+    from image_store import ImageStore
+
+    def jpeg_bytes(mode, color):
+        buffer = io.BytesIO()
+        Image.new(mode, (120, 90), color).save(buffer, "JPEG")
+        return buffer.getvalue()
+
+    rgb_jpeg = jpeg_bytes("RGB", (20, 120, 220))
+    cmyk_jpeg = jpeg_bytes("CMYK", (10, 200, 30, 0))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        doc = fitz.open()
+        page = doc.new_page()
+        rgb_xref = page.insert_image(fitz.Rect(0, 0, 120, 90), stream=rgb_jpeg)
+        cmyk_xref = page.insert_image(fitz.Rect(0, 100, 120, 190), stream=cmyk_jpeg)
+
+        store = ImageStore(tmp)
+        assert store.extract(doc, rgb_xref, "photo.png",
+                             accept=lambda pix: pix.width > 50) == "photo.jpg"
+        assert (tmp / "photo.jpg").read_bytes() == rgb_jpeg
+        assert store.extract(doc, cmyk_xref, "cmyk.png") == "cmyk.png"
+        assert store.passthrough_count == 1 and store.written == 2
+
+        reencoded = ImageStore(tmp / "png", passthrough=False)
+        (tmp / "png").mkdir()
+        assert reencoded.extract(doc, rgb_xref, "photo.png") == "photo.png"
+        assert reencoded.passthrough_count == 0
+        doc.close()
+
+
+if __name__ == "__main__":
+    test_repeated_image_is_written_once()
+    test_rejected_image_is_not_decoded_again()
+    test_filter_sees_cmyk_before_conversion()
+    test_jpeg_streams_are_written_without_reencoding()
+    print("✅ Image store tests passed")
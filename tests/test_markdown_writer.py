@@ -0,0 +1,41 @@
+"""
+Test Streaming Markdown Writer
+==============================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+from markdown_writer import MarkdownWriter
+
+
+def test_page_sections_visible_before_close():
+    """Each finished page is flushed to disk while the writer is still open"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / "out.md"
+
+        with MarkdownWriter(output_path, buffer_size=1024 * 1024) as markdown:
+            markdown.write("# Title\n\n")
+            markdown.write("\n## Page 1\n\n")
+            markdown.write("text\n\n")
+            markdown.end_page()
+
+            assert output_path.read_text(encoding='utf-8') == "# Title\n\n\n## Page 1\n\ntext\n\n---\n\n"
+
+            markdown.write("summary\n")
+            assert markdown.pages_written == 1
+
+        assert markdown.closed
+        assert output_path.read_text(encoding='utf-8').endswith("---\n\nsummary\n")
+        assert markdown.chars_written == len(output_path.read_text(encoding='utf-8'))
+
+
+if __name__ == "__main__":
+    test_page_sections_visible_before_close()
+    print("✅ Markdown writer tests passed")
@@ -0,0 +1,114 @@
+"""
+Test Sampled Auto Mode Selection
+================================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+
+def _make_archive(pdf_path: Path, pages: int, text_every: int):
+    """Scanned archive where every `text_every`-th page is digital text"""
+    import fitz
+
+    scan = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 50, 70), False)
+    scan.set_rect(scan.irect, (240,))
+
+    doc = fitz.open()
+    scan_xref = None
+    for page_num in range(pages):
+        page = doc.new_page()
+        if page_num % text_every == 0:
+            page.insert_textbox(fitz.Rect(72, 72, 520, 400), "Typed page of the archive. " * 10)
+        elif scan_xref is None:
+            scan_xref = page.insert_image(page.rect, pixmap=scan, keep_proportion=False)
+        else:
+            page.insert_image(page.rect, xref=scan_xref, keep_proportion=False)
+    doc.save(str(pdf_path), garbage=3, deflate=True)
+    doc.close()
+
+
+def test_stratified_sample_and_interval():
+    """One page per stratum, reproducible; a full sample has a zero-width interval"""
+    from mode_selector import stratified_sample, wilson_interval
+
+    pages = stratified_sample(1000, 10, seed=7)
+    assert pages == stratified_sample(1000, 10, seed=7)
+    assert [(page - 1) // 100 for page in pages] == list(range(10))
+    assert stratified_sample(5, 10) == [1, 2, 3, 4, 5]
+
+    low, high = wilson_interval(10, 40, 0.95, population=1000)
+    assert low < 0.25 < high
+    assert wilson_interval(10, 40, 0.95, population=40) == (0.25, 0.25)
+    wide = wilson_interval(10, 40, 0.99)
+    assert wide[0] < low and wide[1] > high
+
+
+def test_clear_documents_are_decided_from_the_sample():
+    """A mostly scanned or mostly typed archive only classifies the sampled pages"""
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from document_profile import DocumentProfile
+    from mode_selector import select_mode
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scanned = Path(tmp) / "scanned.pdf"
+        _make_archive(scanned, 400, text_every=20)
+        profile = DocumentProfile.from_pdf(scanned)
+        selection = select_mode(profile, sample_size=40)
+        assert selection['recommended_mode'] == 'ocr'
+        assert selection['method'] == 'sample' and selection['sampled_pages'] == 40
+        assert profile.classified_pages == 40
+
+        typed = Path(tmp) / "typed.pdf"
+        _make_archive(typed, 400, text_every=1)
+        profile = DocumentProfile.from_pdf(typed)
+        selection = select_mode(profile, sample_size=40)
+        assert selection['recommended_mode'] == 'hybrid'
+        assert selection['text_ratio'] == 1.0 and profile.classified_pages == 40
+
+
+def test_ambiguous_sample_escalates_to_full_scan():
+    """Near the OCR threshold every page is classified before deciding"""
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from document_profile import DocumentProfile
+    from mode_selector import select_mode
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "borderline.pdf"
+        _make_archive(pdf_path, 300, text_every=3)  # 100 typed pages: 33%
+        profile = DocumentProfile.from_pdf(pdf_path)
+        selection = select_mode(profile, sample_size=30, confidence=0.99)
+        assert selection['method'] == 'escalated'
+        assert profile.classified_pages == 300
+        assert selection['recommended_mode'] == 'hybrid'
+        assert abs(selection['text_ratio'] - 1 / 3) < 1e-9
+
+        try:
+            select_mode(profile, confidence=1.5)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("confidence outside (0, 1) was accepted")
+
+
+if __name__ == "__main__":
+    test_stratified_sample_and_interval()
+    test_clear_documents_are_decided_from_the_sample()
+    test_ambiguous_sample_escalates_to_full_scan()
+    print("✅ Mode selector tests passed")
@@ -0,0 +1,120 @@
+"""
+Test Parallel OCR Scheduler
+===========================
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+import ocr_pool
+from ocr_pool import OCRScheduler, default_ocr_workers
+
+
+class FakeTesseract:
+    """Stand-in for pytesseract: later pages finish first"""
+
+    def __init__(self):
+        self.calls = []
+
+    def image_to_string(self, image, lang=None, config=''):
+        self.calls.append((image, lang, config))
+        if image == "broken":
+            raise RuntimeError("tesseract crashed")
+        time.sleep(0.05 / int(image.split('-')[1]))
+        return f"text of {image}"
+
+
+def _run_with_fake(scheduler, pages):
+    fake = FakeTesseract()
+    saved = getattr(ocr_pool, 'pytesseract', None)
+    ocr_pool.pytesseract = fake
+    try:
+        return list(scheduler.map(pages)), fake
+    finally:
+        ocr_pool.pytesseract = saved
+
+
+def test_results_stream_back_in_page_order():
+    """Results come back in input order even when later pages finish first"""
+    scheduler = OCRScheduler(workers=4, lang='eng', config='--psm 6')
+    pages = [(page_num, f"img-{page_num}") for page_num in range(1, 9)]
+
+    results, fake = _run_with_fake(scheduler, pages)
+
+    assert [result['page'] for result in results] == list(range(1, 9))
+    assert results[2]['text'] == "text of img-3"
+    assert all(call[1:] == ('eng', '--psm 6') for call in fake.calls)
+    assert scheduler.summary()['pages'] == 8
+
+
+def test_none_images_and_errors_keep_their_slot():
+    """Pages without an image skip OCR; failures are reported per page"""
+    scheduler = OCRScheduler(workers=2)
+    pages = [(1, "img-1"), (2, None), (3, "broken")]
+
+    results, fake = _run_with_fake(scheduler, pages)
+
+    assert [result['page'] for result in results] == [1, 2, 3]
+    assert results[1]['text'] is None and results[1]['error'] is None
+    assert "crashed" in results[2]['error']
+    assert len(fake.calls) == 2
+
+
+def test_default_workers_honor_omp_thread_limit():
+    """Each tesseract job may use OMP_THREAD_LIMIT threads"""
+    saved = os.environ.get('OMP_THREAD_LIMIT')
+    try:
+        os.environ['OMP_THREAD_LIMIT'] = str(os.cpu_count() or 1)
+        assert default_ocr_workers() == 1
+    finally:
+        if saved is None:
+            os.environ.pop('OMP_THREAD_LIMIT', None)
+        else:
+            os.environ['OMP_THREAD_LIMIT'] = saved
+
+
+def test_omp_thread_limit_only_set_while_running():
+    """Tesseract runs single-threaded inside map() and the environment is restored afterwards"""
+    saved = os.environ.pop('OMP_THREAD_LIMIT', None)
+    try:
+        seen = []
+
+        class RecordingTesseract(FakeTesseract):
+            def image_to_string(self, image, lang=None, config=''):
+                seen.append(os.environ.get('OMP_THREAD_LIMIT'))
+                return super().image_to_string(image, lang, config)
+
+        original = getattr(ocr_pool, 'pytesseract', None)
+        ocr_pool.pytesseract = RecordingTesseract()
+        try:
+            list(OCRScheduler(workers=2).map([(1, "img-1"), (2, "img-2")]))
+        finally:
+            ocr_pool.pytesseract = original
+
+        assert seen == ['1', '1']
+        assert 'OMP_THREAD_LIMIT' not in os.environ
+
+        # A limit chosen by the user is left alone
+        os.environ['OMP_THREAD_LIMIT'] = '4'
+        _run_with_fake(OCRScheduler(workers=2), [(1, "img-1")])
+        assert os.environ['OMP_THREAD_LIMIT'] == '4'
+    finally:
+        if saved is None:
+            os.environ.pop('OMP_THREAD_LIMIT', None)
+        else:
+            os.environ['OMP_THREAD_LIMIT'] = saved
+
+
+if __name__ == "__main__":
+    test_results_stream_back_in_page_order()
+    test_none_images_and_errors_keep_their_slot()
+    test_default_workers_honor_omp_thread_limit()
+    test_omp_thread_limit_only_set_while_running()
+    print("✅ OCR scheduler tests passed")
@@ -0,0 +1,89 @@
+"""
+Test Text-Layer-First OCR Router
+================================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+import ocr_pool
+import ocr_router
+from ocr_pool import OCRScheduler
+from ocr_router import OCRRouter, classify_text_layers
+
+
+class FakeTesseract:
+    """Stand-in for pytesseract that records which images it was given"""
+
+    def __init__(self):
+        self.sizes = []
+
+    def image_to_string(self, image, lang=None, config=''):
+        self.sizes.append(image.size)
+        return "scanned text"
+
+
+def _make_mixed_pdf(pdf_path: Path):
+    """Pages 1 and 3 have a text layer, pages 2 and 4 are blank (scan-like)"""
+    import fitz
+
+    doc = fitz.open()
+    for page_num in range(4):
+        page = doc.new_page(width=300, height=300)
+        if page_num % 2 == 0:
+            for line in range(6):
+                page.insert_text((10, 30 + line * 20), f"Digital page {page_num + 1} line {line}")
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def test_only_pages_without_text_layer_are_ocrd():
+    """Text-layer pages skip rendering and tesseract; output stays in page order"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "mixed.pdf"
+        _make_mixed_pdf(pdf_path)
+
+        assert sorted(classify_text_layers(pdf_path, range(1, 5))) == [1, 3]
+
+        rendered = []
+        real_render_pages = ocr_router.render_pages
+
+        def recording_render_pages(pdf_path, page_numbers, **kwargs):
+            rendered.extend(page_numbers)
+            return real_render_pages(pdf_path, page_numbers, **kwargs)
+
+        fake = FakeTesseract()
+        saved = getattr(ocr_pool, 'pytesseract', None)
+        ocr_pool.pytesseract = fake
+        ocr_router.render_pages = recording_render_pages
+        try:
+            router = OCRRouter(OCRScheduler(workers=2), dpi=36)
+            results = list(router.route(pdf_path))
+        finally:
+            ocr_pool.pytesseract = saved
+            ocr_router.render_pages = real_render_pages
+
+        assert rendered == [2, 4]
+        assert len(fake.sizes) == 2
+        assert [result['page'] for result in results] == [1, 2, 3, 4]
+        assert [result['source'] for result in results] == ["text-layer", "ocr", "text-layer", "ocr"]
+        assert "Digital page 3" in results[2]['text']
+        assert results[1]['text'] == "scanned text"
+        assert router.format_summary() == "Routing: 2 pages from text layer, 2 pages sent to OCR"
+
+
+if __name__ == "__main__":
+    test_only_pages_without_text_layer_are_ocrd()
+    print("✅ OCR router tests passed")
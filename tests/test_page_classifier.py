@@ -0,0 +1,126 @@
+"""
+Test Page Classification
+========================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+
+def _make_labelled_pdf(pdf_path: Path):
+    """One page per label, plus an OCR'd scan and a page drawn through a Form XObject"""
+    import fitz
+
+    scan = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 120, 160), False)
+    scan.set_rect(scan.irect, (235,))
+    paragraph = "Digital text that was typeset directly into the PDF page. " * 6
+
+    source = fitz.open()
+    source.new_page().insert_textbox(fitz.Rect(72, 72, 520, 400), paragraph)
+
+    doc = fitz.open()
+    doc.new_page().insert_textbox(fitz.Rect(72, 72, 520, 400), paragraph)          # 1 text
+    doc.new_page().insert_image(fitz.Rect(0, 0, 595, 842), pixmap=scan,
+                                keep_proportion=False)                            # 2 scan
+    page = doc.new_page()                                                         # 3 scan + OCR layer
+    page.insert_image(page.rect, pixmap=scan, keep_proportion=False)
+    page.insert_textbox(fitz.Rect(72, 72, 520, 400), paragraph, render_mode=3)
+    page = doc.new_page()                                                         # 4 mixed
+    page.insert_textbox(fitz.Rect(72, 72, 520, 300), paragraph)
+    page.insert_image(fitz.Rect(72, 320, 520, 700), pixmap=scan)
+    page = doc.new_page()                                                         # 5 vector
+    for index in range(40):
+        page.draw_line((72, 100 + index * 10), (520, 120 + index * 10))
+    doc.new_page().show_pdf_page(fitz.Rect(0, 0, 595, 842), source, 0)            # 6 text in a form
+    doc.save(str(pdf_path), garbage=3, deflate=True)
+    doc.close()
+    source.close()
+
+
+def test_pages_are_labelled_from_cheap_signals():
+    """text / scan / mixed / vector, OCR'd scans stay scans"""
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from page_classifier import classify_pages
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "labelled.pdf"
+        _make_labelled_pdf(pdf_path)
+
+        labels = classify_pages(pdf_path)
+        assert labels == {1: "text", 2: "scan", 3: "scan", 4: "mixed", 5: "vector", 6: "text"}, labels
+        assert classify_pages(pdf_path, [3, 5]) == {3: "scan", 5: "vector"}
+
+
+def test_signals_skip_text_extraction():
+    """Signals come from the content stream; the OCR layer is recognised as invisible"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from page_classifier import page_signals, MIN_TEXT_CHARS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "labelled.pdf"
+        _make_labelled_pdf(pdf_path)
+
+        doc = fitz.open(str(pdf_path))
+        try:
+            text, scan, ocr_scan, mixed, vector = (page_signals(doc[index]) for index in range(5))
+        finally:
+            doc.close()
+
+        assert text.text_chars > MIN_TEXT_CHARS and text.image_count == 0
+        assert scan.text_chars == 0 and abs(scan.image_area - 1.0) < 0.01
+        assert ocr_scan.invisible_text and ocr_scan.text_chars > MIN_TEXT_CHARS
+        assert mixed.image_count == 1 and 0.05 < mixed.image_area < 0.6
+        assert vector.text_blocks == 0 and vector.image_count == 0 and vector.content_bytes > 0
+        assert any("Helvetica" in font for font in text.fonts)
+
+
+def test_inline_image_scan():
+    """A page painted by one inline image (BI..ID..EI) is a scan; its data is not read as text"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from page_classifier import page_signals, classify_signals
+
+    # 40x4 grey samples that happen to look like a text object
+    data = b"BT (" + b"A" * 150 + b") Tj E"
+    assert len(data) == 160
+
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    xref = doc.get_new_xref()
+    doc.update_object(xref, "<<>>")
+    doc.update_stream(xref, b"q 595 0 0 842 0 0 cm\nBI /W 40 /H 4 /CS /G /BPC 8 ID " + data + b"\nEI Q\n")
+    page.set_contents(xref)
+
+    signals = page_signals(doc[0])
+    doc.close()
+
+    assert signals.text_blocks == 0 and signals.text_chars == 0
+    assert signals.image_count == 1 and abs(signals.image_area - 1.0) < 0.01
+    assert classify_signals(signals) == "scan"
+
+
+if __name__ == "__main__":
+    test_pages_are_labelled_from_cheap_signals()
+    test_signals_skip_text_extraction()
+    test_inline_image_scan()
+    print("✅ Page classifier tests passed")
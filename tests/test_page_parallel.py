@@ -0,0 +1,170 @@
+"""
+Test Page-Parallel Engine
+=========================
+"""
+
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+from page_parallel import split_page_ranges, run_page_shards
+
+
+def _square_shard(pdf_path, start, end, offset=0):
+    """Dummy shard function (module level so it can be pickled)"""
+    return {page_num: page_num * page_num + offset for page_num in range(start, end)}
+
+
+def test_split_page_ranges():
+    """Ranges are contiguous, cover every page and never exceed page count"""
+    assert split_page_ranges(0, 4) == []
+    assert split_page_ranges(3, 8) == [(0, 1), (1, 2), (2, 3)]
+    assert split_page_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert split_page_ranges(5, 1) == [(0, 5)]
+
+
+def test_run_page_shards_merges_in_page_order():
+    """Parallel shards give the same per-page results as the serial path"""
+    serial = run_page_shards(_square_shard, Path("dummy.pdf"), 11, workers=1, offset=3)
+    parallel = run_page_shards(_square_shard, Path("dummy.pdf"), 11, workers=4, offset=3)
+
+    assert serial == parallel
+    assert sorted(parallel) == list(range(11))
+
+
+def test_pymupdf_hybrid_parallel_matches_serial():
+    """Sharded PyMuPDF hybrid output is identical to the serial output"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from fast_pdf_processor import FastPDFProcessor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "sample.pdf"
+
+        doc = fitz.open()
+        for page_num in range(9):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page {page_num + 1} " + "lorem ipsum " * 10)
+        doc.save(str(pdf_path))
+        doc.close()
+
+        outputs = []
+        for workers in (1, 3):
+            out_dir = tmp / f"out_{workers}"
+            out_dir.mkdir()
+            processor = FastPDFProcessor(out_dir, tmp)
+            success, message = processor._hybrid_pymupdf_fast(
+                pdf_path, out_dir / "sample.md", time.time(), workers=workers
+            )
+            assert success, message
+
+            content = (out_dir / "sample.md").read_text(encoding='utf-8')
+            outputs.append(re.sub(r"\*\*Conversion Time:\*\*.*", "", content))
+
+        assert outputs[0] == outputs[1]
+        assert "## Page 9" in outputs[1]
+
+
+def test_guaranteed_hybrid_parallel_matches_serial():
+    """Sharded guaranteed hybrid output is identical to the serial output"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from fast_pdf_processor import FastPDFProcessor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "sample.pdf"
+
+        doc = fitz.open()
+        for page_num in range(5):
+            page = doc.new_page(width=200, height=200)
+            page.insert_text((10, 50), f"Page {page_num + 1} " + "lorem ipsum " * 6)
+        doc.save(str(pdf_path))
+        doc.close()
+
+        outputs = []
+        for workers in (1, 2):
+            out_dir = tmp / f"out_{workers}"
+            out_dir.mkdir()
+            processor = FastPDFProcessor(out_dir, tmp)
+            success, message = processor._guaranteed_image_hybrid(
+                pdf_path, out_dir / "sample.md", time.time(), workers=workers
+            )
+            assert success, message
+            assert len(list((out_dir / "sample_images").glob("*.png"))) == 5
+
+            content = (out_dir / "sample.md").read_text(encoding='utf-8')
+            outputs.append(re.sub(r"\*\*Conversion Time:\*\*.*", "", content))
+
+        assert outputs[0] == outputs[1]
+
+
+def test_large_hybrid_parallel_matches_serial():
+    """Large documents (smart hybrid) give identical markdown and images for any worker count"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from fast_pdf_processor import FastPDFProcessor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "manual.pdf"
+
+        doc = fitz.open()
+        for page_num in range(56):
+            page = doc.new_page(width=200, height=200)
+            # Every seventh page has no text, so it is sampled as a snapshot
+            if page_num % 7:
+                page.insert_text((10, 50), f"Page {page_num + 1} " + "lorem ipsum " * 12)
+            page.draw_rect(fitz.Rect(20, 100, 180, 180), color=(0, 0, 1), fill=(1, 0, 0))
+        doc.save(str(pdf_path))
+        doc.close()
+
+        outputs = []
+        for workers in (1, 3):
+            out_dir = tmp / f"out_{workers}"
+            out_dir.mkdir()
+            processor = FastPDFProcessor(out_dir, tmp)
+            success, message = processor.convert_hybrid_fast(
+                pdf_path, out_dir / "manual.md", workers=workers
+            )
+            assert success, message
+            assert "Smart hybrid" in message
+
+            content = (out_dir / "manual.md").read_text(encoding='utf-8')
+            images = {image.name: image.read_bytes()
+                      for image in sorted((out_dir / "manual_images").iterdir())}
+            outputs.append((re.sub(r"\*\*Conversion Time:\*\*.*", "", content), images))
+
+        assert outputs[0] == outputs[1]
+        markdown, images = outputs[1]
+        assert "## Page 56" in markdown and "Page 55 lorem" in markdown
+        assert "page_8.png" in images
+
+
+if __name__ == "__main__":
+    test_split_page_ranges()
+    test_run_page_shards_merges_in_page_order()
+    test_pymupdf_hybrid_parallel_matches_serial()
+    test_guaranteed_hybrid_parallel_matches_serial()
+    test_large_hybrid_parallel_matches_serial()
+    print("✅ Page-parallel tests passed")
@@ -0,0 +1,138 @@
+"""
+Test Memory-Mapped / In-Memory PDF Sources
+==========================================
+"""
+
+import io
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+
+def _make_text_pdf(pages: int = 3) -> bytes:
+    import fitz
+
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {page_num + 1} " + "digital text " * 20, fontname="helv")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_every_input_type_opens_in_each_library():
+    """Path, bytes, memoryview and file objects give PyMuPDF and PyPDF2 the same PDF"""
+    try:
+        import fitz  # noqa: F401
+        import PyPDF2  # noqa: F401
+    except ImportError:
+        print("⚠️  PyMuPDF or PyPDF2 not available, skipping")
+        return
+
+    from pdf_source import PDFSource, open_source
+    from rasterizer import count_pages
+
+    data = _make_text_pdf()
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "report.pdf"
+        pdf_path.write_bytes(data)
+
+        with open(pdf_path, 'rb') as pdf_file:
+            inputs = [pdf_path, data, memoryview(data), bytearray(data), io.BytesIO(data), pdf_file]
+            for pdf in inputs:
+                with open_source(pdf) as source:
+                    doc = source.open_fitz()
+                    assert len(doc) == 3
+                    doc.close()
+                    reader = source.pdf_reader()
+                    assert "Page 3" in reader.pages[2].extract_text()
+                    assert count_pages(source) == 3
+                    assert source.size_bytes == len(data)
+
+                    # Process pools get the path (mapped again) or the bytes
+                    copy = pickle.loads(pickle.dumps(source))
+                    assert copy.name == source.name and copy.sha256() == source.sha256()
+
+        assert PDFSource(pdf_path).name == "report.pdf" and not PDFSource(pdf_path).in_memory
+        assert PDFSource(data).in_memory and PDFSource(data, "upload.pdf").stem == "upload"
+
+
+def test_close_with_open_document_is_safe():
+    """Closing the source never unmaps a buffer a live document still reads"""
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from pdf_source import PDFSource
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "report.pdf"
+        pdf_path.write_bytes(_make_text_pdf())
+
+        source = PDFSource(pdf_path)
+        doc = source.open_fitz()
+        source.close()
+        assert "Page 1" in doc.load_page(0).get_text()
+        doc.close()
+
+        # A file-backed source maps the file again when used after close()
+        doc = source.open_fitz()
+        assert len(doc) == 3
+        doc.close()
+        source.close()
+
+
+def test_conversion_reads_one_shared_buffer():
+    """A conversion never reopens the PDF by path, and bytes convert without a file"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from fast_pdf_processor import FastPDFProcessor
+    from pdf_source import PDFSource
+
+    data = _make_text_pdf()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "report.pdf"
+        pdf_path.write_bytes(data)
+
+        opened_by_path = []
+        original_open = fitz.open
+
+        def recording_open(*args, **kwargs):
+            if args:
+                opened_by_path.append(args[0])
+            return original_open(*args, **kwargs)
+
+        fitz.open = recording_open
+        try:
+            processor = FastPDFProcessor(tmp, tmp)
+            success, message, output = processor.convert_pdf_fast(pdf_path, "hybrid")
+            assert success, message
+            assert opened_by_path == []
+        finally:
+            fitz.open = original_open
+
+        success, message, output = processor.convert_pdf_fast(PDFSource(data, "upload.pdf"), "hybrid")
+        assert success, message
+        assert output.name == "upload_hybrid.md"
+        assert "Page 2" in output.read_text(encoding='utf-8')
+
+
+if __name__ == "__main__":
+    test_every_input_type_opens_in_each_library()
+    test_close_with_open_document_is_safe()
+    test_conversion_reads_one_shared_buffer()
+    print("✅ PDF source tests passed")
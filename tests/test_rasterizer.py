@@ -0,0 +1,207 @@
+"""
+Test Page Rasterizer
+====================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+import rasterizer
+from rasterizer import (
+    coalesce_page_ranges, split_into_windows, render_pages, iter_document_pages, get_backend,
+    fill_skipped_pages
+)
+
+
+def _make_pdf(pdf_path: Path, pages: int):
+    """Create a small PDF with one line of text per page"""
+    import fitz
+
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page(width=200, height=100)
+        page.insert_text((10, 50), f"Page {page_num + 1}")
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def test_coalesce_page_ranges():
+    """Consecutive pages collapse into a single range"""
+    assert coalesce_page_ranges([]) == []
+    assert coalesce_page_ranges([10, 1, 2, 3, 8, 7, 3]) == [(1, 3), (7, 8), (10, 10)]
+    assert coalesce_page_ranges([5]) == [(5, 5)]
+
+
+def test_split_into_windows():
+    """Long ranges are split so no window exceeds the window size"""
+    assert split_into_windows([(1, 10)], 4) == [(1, 4), (5, 8), (9, 10)]
+    assert split_into_windows([(1, 2), (5, 5)], 4) == [(1, 2), (5, 5)]
+
+
+def test_pdf2image_backend_renders_in_bounded_windows():
+    """pdf2image is called once per window, never for the whole document"""
+    calls = []
+
+    def fake_convert_from_path(path, dpi, first_page, last_page):
+        calls.append((first_page, last_page))
+        return [f"image-{page_num}" for page_num in range(first_page, last_page + 1)]
+
+    saved = (rasterizer.PYMUPDF_AVAILABLE, rasterizer.PDF2IMAGE_AVAILABLE,
+             getattr(rasterizer, 'convert_from_path', None))
+    rasterizer.PYMUPDF_AVAILABLE = False
+    rasterizer.PDF2IMAGE_AVAILABLE = True
+    rasterizer.convert_from_path = fake_convert_from_path
+    try:
+        rendered = list(render_pages(Path("dummy.pdf"), range(1, 11), dpi=72, window_size=4))
+    finally:
+        (rasterizer.PYMUPDF_AVAILABLE, rasterizer.PDF2IMAGE_AVAILABLE,
+         rasterizer.convert_from_path) = saved
+
+    assert calls == [(1, 4), (5, 8), (9, 10)]
+    assert rendered == [(page_num, f"image-{page_num}") for page_num in range(1, 11)]
+
+
+def test_render_pages_yields_requested_pages():
+    """Only the requested pages are rendered, in page order"""
+    if not (rasterizer.PYMUPDF_AVAILABLE and rasterizer.PIL_AVAILABLE):
+        print("⚠️  PyMuPDF/Pillow not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "sample.pdf"
+        _make_pdf(pdf_path, 6)
+
+        rendered = list(render_pages(pdf_path, [5, 2, 3, 2], dpi=72))
+
+        assert [page_num for page_num, _ in rendered] == [2, 3, 5]
+        assert rendered[0][1].size == (200, 100)
+
+        all_pages = [page_num for page_num, _ in iter_document_pages(pdf_path, dpi=36, window_size=2)]
+        assert all_pages == [1, 2, 3, 4, 5, 6]
+
+
+def test_backend_selection():
+    """Backends are picked by name and unknown names are rejected"""
+    saved = rasterizer.PDF2IMAGE_AVAILABLE
+    rasterizer.PDF2IMAGE_AVAILABLE = True
+    try:
+        assert get_backend("pdf2image").name == "pdf2image"
+    finally:
+        rasterizer.PDF2IMAGE_AVAILABLE = saved
+
+    try:
+        get_backend("ghostscript")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown backend accepted")
+
+
+def test_incomplete_backend_fails_on_creation():
+    """A backend without render() cannot be instantiated"""
+    class HalfBackend(rasterizer.RasterBackend):
+        name = "half"
+
+        def is_available(self) -> bool:
+            return True
+
+    try:
+        HalfBackend()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("incomplete backend instantiated")
+
+
+def test_fill_skipped_pages_keeps_every_slot():
+    """Pages missing from the render stream come back with image None"""
+    rendered = [(1, "a"), (3, "c"), (4, "d")]
+
+    assert list(fill_skipped_pages(rendered, range(1, 6))) == [
+        (1, "a"), (2, None), (3, "c"), (4, "d"), (5, None)
+    ]
+
+
+def test_failed_page_gets_a_placeholder_in_markdown():
+    """A page the backend could not render is reported, not dropped or renumbered"""
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from PIL import Image
+    from pdf_to_md_with_images import PDFToMarkdownWithImages
+
+    class FlakyBackend(rasterizer.RasterBackend):
+        name = "flaky"
+
+        def is_available(self) -> bool:
+            return True
+
+        def render(self, pdf_path, page_numbers, dpi, window_size):
+            for page_num in page_numbers:
+                if page_num != 2:
+                    yield page_num, Image.new("RGB", (10, 10), "white")
+
+    rasterizer.BACKENDS["flaky"] = FlakyBackend()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = Path(tmp) / "sample.pdf"
+            _make_pdf(pdf_path, 3)
+
+            converter = PDFToMarkdownWithImages(Path(tmp) / "out", Path(tmp) / "temp")
+            converter.output_dir.mkdir()
+            converter.raster_backend = "flaky"
+            output_md = converter.output_dir / "sample.md"
+            success, message = converter.extract_with_pdf2image(pdf_path, output_md)
+
+            assert success, message
+            assert "2/3 pages" in message and "could not be rendered: 2" in message, message
+
+            markdown = output_md.read_text(encoding="utf-8")
+            assert "## Page 2\n\n*[Page 2 could not be rendered]*" in markdown
+            assert "## Page 3\n\n![Page 3]" in markdown
+    finally:
+        del rasterizer.BACKENDS["flaky"]
+
+
+def test_backends_render_same_pages():
+    """PyMuPDF and pdf2image backends yield the same pages at the same size"""
+    if not (rasterizer.PYMUPDF_AVAILABLE and rasterizer.PIL_AVAILABLE and rasterizer.PDF2IMAGE_AVAILABLE):
+        print("⚠️  PyMuPDF/Pillow/pdf2image not available, skipping")
+        return
+
+    import shutil
+    if not shutil.which("pdftoppm"):
+        print("⚠️  poppler not installed, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "sample.pdf"
+        _make_pdf(pdf_path, 3)
+
+        native = list(render_pages(pdf_path, [1, 3], dpi=72, backend="pymupdf"))
+        poppler = list(render_pages(pdf_path, [1, 3], dpi=72, backend="pdf2image"))
+
+        assert [page_num for page_num, _ in native] == [page_num for page_num, _ in poppler] == [1, 3]
+        assert [image.size for _, image in native] == [image.size for _, image in poppler]
+
+
+if __name__ == "__main__":
+    test_coalesce_page_ranges()
+    test_split_into_windows()
+    test_pdf2image_backend_renders_in_bounded_windows()
+    test_render_pages_yields_requested_pages()
+    test_backend_selection()
+    test_incomplete_backend_fails_on_creation()
+    test_fill_skipped_pages_keeps_every_slot()
+    test_failed_page_gets_a_placeholder_in_markdown()
+    test_backends_render_same_pages()
+    print("✅ Rasterizer tests passed")
@@ -0,0 +1,263 @@
+"""
+Test Conversion Daemon
+======================
+"""
+
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+from converter import PDFConverter
+from server import create_server
+
+
+def _make_text_pdf(pdf_path: Path):
+    import fitz
+
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Served by the daemon")
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def _request(base_url: str, method: str, path: str, payload=None):
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    request = urllib.request.Request(base_url + path, data=data, method=method,
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def _unix_request(socket_path: Path, method: str, path: str) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(30)
+        client.connect(str(socket_path))
+        client.sendall(f"{method} {path} HTTP/1.0\r\nHost: localhost\r\n\r\n".encode('ascii'))
+        response = b""
+        while chunk := client.recv(65536):
+            response += chunk
+    return json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+
+def _raw_post(port: int, headers: str) -> int:
+    """POST /jobs with hand-written headers and no body, return the status code"""
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as client:
+        client.sendall(f"POST /jobs HTTP/1.0\r\nHost: localhost\r\n{headers}\r\n".encode('ascii'))
+        response = b""
+        while chunk := client.recv(65536):
+            response += chunk
+    return int(response.split(b" ", 2)[1])
+
+
+def test_http_jobs_roundtrip():
+    """Jobs submitted over HTTP are converted by warm workers and can be polled"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "served.pdf"
+        _make_text_pdf(pdf_path)
+
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+        server = create_server(converter, port=0, jobs=1)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        try:
+            status, health = _request(base_url, 'GET', '/health')
+            assert status == 200 and health['status'] == 'ok'
+
+            status, job = _request(base_url, 'POST', '/jobs',
+                                   {'path': str(pdf_path), 'format': 'md', 'wait': True})
+            assert status == 200
+            assert job['status'] == 'done', job
+            assert "Served by the daemon" in Path(job['output']).read_text(encoding='utf-8')
+
+            status, polled = _request(base_url, 'GET', f"/jobs/{job['id']}")
+            assert status == 200 and polled['status'] == 'done'
+
+            status, queued = _request(base_url, 'POST', '/jobs', {'path': str(pdf_path), 'format': 'html'})
+            assert status == 202 and queued['status'] in ('queued', 'running', 'done', 'failed')
+            assert server.job_manager.wait(queued['id'], timeout=30)['finished'] is not None
+
+            status, error = _request(base_url, 'POST', '/jobs', {'path': str(pdf_path), 'format': 'bogus'})
+            assert status == 400 and 'bogus' in error['error']
+
+            status, error = _request(base_url, 'GET', '/jobs/unknown')
+            assert status == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+            server.job_manager.shutdown()
+
+
+def test_pdf_upload_converted_from_memory():
+    """A PDF posted as the request body is converted without a copy on disk"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "source.pdf"
+        _make_text_pdf(pdf_path)
+        pdf_bytes = pdf_path.read_bytes()
+        pdf_path.unlink()
+
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+        server = create_server(converter, port=0, jobs=1)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        try:
+            request = urllib.request.Request(base_url + "/jobs?format=md&name=uploaded.pdf&wait=1",
+                                             data=pdf_bytes, method='POST',
+                                             headers={'Content-Type': 'application/pdf'})
+            with urllib.request.urlopen(request, timeout=30) as response:
+                job = json.loads(response.read())
+            assert job['status'] == 'done', job
+            assert job['input'] == "uploaded.pdf"
+            assert Path(job['output']).name == f"uploaded-{job['id']}.md"
+            assert "Served by the daemon" in Path(job['output']).read_text(encoding='utf-8')
+            assert list(tmp.rglob("*.pdf")) == []
+
+            # Concurrent uploads with the same name never share an output file
+            first = server.job_manager.submit(pdf_bytes, 'md', name="uploaded.pdf")
+            second = server.job_manager.submit(pdf_bytes, 'md', name="uploaded.pdf")
+            outputs = {server.job_manager.wait(queued['id'], timeout=30)['output']
+                       for queued in (first, second)}
+            assert len(outputs) == 2 and Path(job['output']).exists()
+
+            request = urllib.request.Request(base_url + "/jobs", data=b"", method='POST',
+                                             headers={'Content-Type': 'application/pdf'})
+            try:
+                urllib.request.urlopen(request, timeout=30)
+                assert False, "empty upload accepted"
+            except urllib.error.HTTPError as e:
+                assert e.code == 400
+        finally:
+            server.shutdown()
+            server.server_close()
+            server.job_manager.shutdown()
+
+
+def test_bad_content_length_rejected_before_reading():
+    """Negative or oversized Content-Length is answered without waiting for a body"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+        server = create_server(converter, port=0, jobs=1)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        port = server.server_address[1]
+
+        try:
+            for content_type in ('application/json', 'application/pdf'):
+                assert _raw_post(port, f"Content-Type: {content_type}\r\nContent-Length: -1\r\n") == 400
+                assert _raw_post(port, f"Content-Type: {content_type}\r\nContent-Length: abc\r\n") == 400
+                assert _raw_post(port, f"Content-Type: {content_type}\r\nContent-Length: {10 ** 12}\r\n") == 413
+        finally:
+            server.shutdown()
+            server.server_close()
+            server.job_manager.shutdown()
+
+
+def test_broken_worker_pool_recovers():
+    """A crashed worker gives a 503 once, then jobs run on a fresh pool"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = tmp / "served.pdf"
+        _make_text_pdf(pdf_path)
+
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+        server = create_server(converter, port=0, jobs=1)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        try:
+            status, error = _request(base_url, 'POST', '/jobs',
+                                     {'path': str(pdf_path), 'wait': True, 'timeout': 'abc'})
+            assert status == 400 and 'timeout' in error['error']
+            assert server.job_manager.list_jobs() == []
+
+            # Kill the warm worker the way the OOM killer would
+            executor = server.job_manager._executor
+            for process in list(executor._processes.values()):
+                os.kill(process.pid, signal.SIGKILL)
+            deadline = time.monotonic() + 10
+            while not executor._broken and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+            status, error = _request(base_url, 'POST', '/jobs', {'path': str(pdf_path), 'wait': True})
+            assert status == 503, error
+            assert server.job_manager._executor is not executor
+
+            status, job = _request(base_url, 'POST', '/jobs', {'path': str(pdf_path), 'wait': True})
+            assert status == 200 and job['status'] == 'done', job
+        finally:
+            server.shutdown()
+            server.server_close()
+            server.job_manager.shutdown()
+
+
+def test_unix_socket_endpoint():
+    """The same API is served on a Unix socket"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        socket_path = tmp / "converter.sock"
+
+        converter = PDFConverter(tmp / "temp", tmp / "output")
+        server = create_server(converter, socket_path=socket_path, jobs=1)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            assert _unix_request(socket_path, 'GET', '/health')['status'] == 'ok'
+            assert 'md' in _unix_request(socket_path, 'GET', '/formats')
+        finally:
+            server.shutdown()
+            server.server_close()
+            server.job_manager.shutdown()
+
+        assert not socket_path.exists()
+
+
+if __name__ == "__main__":
+    test_http_jobs_roundtrip()
+    test_pdf_upload_converted_from_memory()
+    test_bad_content_length_rejected_before_reading()
+    test_broken_worker_pool_recovers()
+    test_unix_socket_endpoint()
+    print("✅ Server tests passed")
@@ -0,0 +1,56 @@
+"""
+Test Fast CLI Startup
+=====================
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).parent
+project_dir = current_dir.parent
+core_dir = project_dir / "core"
+
+# Modules that must only be loaded when a conversion actually needs them
+HEAVY_MODULES = {"fitz", "pymupdf", "PyPDF2", "PIL", "pytesseract", "pdf2image", "rich", "cProfile"}
+
+
+def _imported_modules(args):
+    result = subprocess.run([sys.executable, "-X", "importtime"] + args,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip().split(".")[0])
+    return modules
+
+
+def test_help_and_version_skip_heavy_imports():
+    """--help and --version never import PDF, OCR or UI backends"""
+    for args in ([str(core_dir / "cli.py"), "--help"],
+                 [str(core_dir / "cli.py"), "--version"],
+                 [str(project_dir / "main.py"), "--version"]):
+        loaded = _imported_modules(args) & HEAVY_MODULES
+        assert not loaded, f"{args[-2:]} imported {sorted(loaded)}"
+
+
+def test_converter_creates_processors_on_demand():
+    """Constructing PDFConverter does not load any processor backend"""
+    code = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "from converter import PDFConverter\n"
+        "converter = PDFConverter(None, 'out')\n"
+        "assert 'fitz' not in sys.modules and 'PyPDF2' not in sys.modules\n"
+        "extractor = converter.pdf_extractor\n"
+        "assert converter.pdf_extractor is extractor\n"
+        "assert extractor.raster_backend == 'auto'\n"
+    ) % str(core_dir)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+
+
+if __name__ == "__main__":
+    test_help_and_version_skip_heavy_imports()
+    test_converter_creates_processors_on_demand()
+    print("✅ Startup tests passed")
@@ -0,0 +1,65 @@
+"""
+Test External Tool Registry
+===========================
+"""
+
+import sys
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+from tools import ToolRegistry, tool_registry
+
+
+def test_probe_runs_once_until_invalidated():
+    """A tool is probed on first use only; invalidate() forces a new probe"""
+    calls = []
+
+    def probe(path):
+        calls.append(path)
+        return {'available': True, 'version': f"fake {len(calls)}"}
+
+    registry = ToolRegistry(probes={})
+    registry.register('python', sys.executable, probe)
+
+    for _ in range(5):
+        assert registry.is_available('python')
+    info = registry.get('python')
+    assert len(calls) == 1
+    assert info['name'] == 'python' and info['path'] == sys.executable
+    assert info['version'] == "fake 1"
+
+    registry.invalidate('python')
+    assert registry.get('python')['version'] == "fake 2"
+    registry.invalidate()
+    assert registry.status()['python']['version'] == "fake 3"
+
+
+def test_missing_binary_is_not_probed():
+    """A binary that is not on PATH is reported unavailable without running anything"""
+    calls = []
+    registry = ToolRegistry(probes={'ghost': ('no-such-binary-here', calls.append)})
+
+    info = registry.get('ghost')
+    assert info == {'name': 'ghost', 'path': None, 'version': None, 'available': False}
+    assert calls == []
+
+
+def test_default_registry_reports_pandoc_and_tesseract():
+    """The shared registry always answers for pandoc and tesseract"""
+    status = tool_registry.status()
+    assert set(status) >= {'pandoc', 'tesseract'}
+    for info in status.values():
+        assert isinstance(info['available'], bool)
+        if info['available']:
+            assert info['version']
+
+
+if __name__ == "__main__":
+    test_probe_runs_once_until_invalidated()
+    test_missing_binary_is_not_probed()
+    test_default_registry_reports_pandoc_and_tesseract()
+    print("✅ Tool registry tests passed")
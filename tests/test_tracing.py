@@ -0,0 +1,137 @@
+"""
+Test Pipeline Tracing
+=====================
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add core to path
+current_dir = Path(__file__).parent
+core_dir = current_dir.parent / "core"
+sys.path.insert(0, str(core_dir))
+
+import ocr_pool
+from ocr_pool import OCRScheduler
+from tracing import Tracer, tracer
+
+
+class FakeTesseract:
+    """Stand-in for pytesseract"""
+
+    def image_to_string(self, image, lang=None, config=''):
+        return f"text {image}"
+
+
+def _records(stream: io.StringIO):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_disabled_tracer_records_nothing():
+    """Without configure() spans are no-ops"""
+    local = Tracer()
+
+    with local.span("document") as document:
+        document.set(pages=3)
+        assert document.id is None
+
+    assert not local.enabled
+    assert local.current_span_id() is None
+
+
+def test_nested_spans_are_written_as_json_lines():
+    """Child spans carry their parent's id and are emitted before the parent"""
+    local = Tracer()
+    stream = io.StringIO()
+    local.configure(stream)
+
+    with local.span("document", file="a.pdf") as document:
+        with local.span("page", page=1):
+            pass
+        document.set(pages=1)
+
+    try:
+        with local.span("pandoc"):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+
+    local.close()
+    page, doc, pandoc = _records(stream)
+
+    assert page['name'] == "page" and page['page'] == 1
+    assert page['parent'] == doc['id']
+    assert doc['parent'] is None
+    assert doc['file'] == "a.pdf" and doc['pages'] == 1
+    assert doc['duration'] >= page['duration'] >= 0
+    assert pandoc['error'] == "ValueError: boom"
+    assert not local.enabled
+
+
+def test_ocr_worker_spans_attach_to_caller():
+    """OCR spans run in worker threads but are parented to the calling span"""
+    stream = io.StringIO()
+    saved = getattr(ocr_pool, 'pytesseract', None)
+    ocr_pool.pytesseract = FakeTesseract()
+    tracer.configure(stream)
+    try:
+        with tracer.span("document") as document:
+            results = list(OCRScheduler(workers=2).map((page, f"img{page}") for page in range(1, 4)))
+    finally:
+        tracer.close()
+        ocr_pool.pytesseract = saved
+
+    assert [result['text'] for result in results] == ["text img1", "text img2", "text img3"]
+
+    ocr_records = [record for record in _records(stream) if record['name'] == "ocr"]
+    assert sorted(record['page'] for record in ocr_records) == [1, 2, 3]
+    assert all(record['parent'] == document.id for record in ocr_records)
+
+
+def test_batch_worker_processes_write_to_the_trace_file():
+    """Documents converted by batch worker processes are traced to the same file"""
+    try:
+        import fitz
+    except ImportError:
+        print("⚠️  PyMuPDF not available, skipping")
+        return
+
+    from batch import BatchScheduler
+    from converter import PDFConverter
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_files = []
+        for name in ("a", "b"):
+            doc = fitz.open()
+            doc.new_page().insert_text((72, 72), f"Traced document {name} " * 10)
+            doc.save(str(tmp / f"{name}.pdf"))
+            doc.close()
+            pdf_files.append(tmp / f"{name}.pdf")
+
+        trace_path = tmp / "trace.jsonl"
+        converter = PDFConverter(tmp / "temp", tmp / "output", cache_dir=None)
+        tracer.configure(trace_path)
+        try:
+            results = list(BatchScheduler(jobs=2).run(converter, pdf_files, 'md'))
+        finally:
+            tracer.close()
+
+        assert all(result['status'] == 'ok' for result in results), results
+        records = [json.loads(line) for line in trace_path.read_text(encoding='utf-8').splitlines()]
+        documents = [record for record in records
+                     if record['name'] == "document" and record.get('processor') == "converter"]
+        assert sorted(Path(record['file']).name for record in documents) == ["a.pdf", "b.pdf"]
+        assert all(record['pid'] != os.getpid() for record in documents)
+
+
+if __name__ == "__main__":
+    test_disabled_tracer_records_nothing()
+    test_nested_spans_are_written_as_json_lines()
+    test_ocr_worker_spans_attach_to_caller()
+    test_batch_worker_processes_write_to_the_trace_file()
+    print("✅ Tracing tests passed")